@@ -1,14 +1,15 @@
 """
 Database management for border analysis results
-Handles JSON storage and pickle conversion for frame detection
+Handles JSON storage and the compiled detection store for frame detection
 """
 
 import json
-import pickle
 from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+from detection.detection_store import DetectionStore
+
 
 class AnalysisDatabase:
     """Manages storage and retrieval of border analysis results"""
@@ -63,20 +64,8 @@ class AnalysisDatabase:
         with open(active_json_file, "w", encoding="utf-8") as f:
             json.dump(self.data, f, indent=2)
 
-        # Save pickle version for detection system
-        active_pickle_file = self.data_dir / "frame_detection.pkl"
-        detection_data = {}
-        for frame_id, analysis in self.data["analyses"].items():
-            detection_data[frame_id] = {
-                "frame_name": analysis.get("frame_name", frame_id),
-                "combined_signature": analysis.get("combined_signature"),
-                "left_signature": analysis.get("left_border", {}).get("signature"),
-                "right_signature": analysis.get("right_border", {}).get("signature"),
-                "uniqueness_score": analysis.get("uniqueness_score", 0.0),
-            }
-
-        with open(active_pickle_file, "wb") as f:
-            pickle.dump(detection_data, f)
+        # Compile the detection store so the detector picks up the new analysis
+        DetectionStore.from_json(active_json_file).save(self.data_dir / "frame_detection.npz")
 
     def _calculate_signature_similarity(self, sig1: str, sig2: str) -> float:
         """Calculate similarity between two signatures"""
@@ -148,29 +137,19 @@ class AnalysisDatabase:
 
         return "\n".join(report)
 
-    def export_to_pickle(self, filename: Optional[str] = None) -> Path:
-        """Export analysis data to pickle format for frame detection"""
+    def export_detection_store(self, filename: Optional[str] = None) -> Path:
+        """Export analysis data as a compiled detection store (.npz) for frame detection"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"frame_detection_export_{timestamp}.pkl"
-
-        pickle_file = self.reports_dir / filename
+            filename = f"frame_detection_export_{timestamp}.npz"
 
-        # Create optimized data structure for frame detection
-        detection_data = {}
-        for frame_id, analysis in self.data["analyses"].items():
-            detection_data[frame_id] = {
-                "frame_name": analysis.get("frame_name", frame_id),
-                "combined_signature": analysis.get("combined_signature"),
-                "left_signature": analysis.get("left_border", {}).get("signature"),
-                "right_signature": analysis.get("right_border", {}).get("signature"),
-                "uniqueness_score": analysis.get("uniqueness_score", 0.0),
-            }
+        store_file = self.reports_dir / filename
 
-        with open(pickle_file, "wb") as f:
-            pickle.dump(detection_data, f)
+        # Compile from the saved analysis file so the store records its source hash
+        self._save_json()
+        DetectionStore.from_json(self.json_file).save(store_file)
 
-        return pickle_file
+        return store_file
 
     def export_report(self, report_content: str, filename: Optional[str] = None) -> Path:
         """Export report to logs/reports directory"""
@@ -178,11 +178,11 @@ class FrameAnalyzerWindow(QMainWindow):
         self.uniqueness_btn = QPushButton("Calculate Uniqueness Scores")
         self.uniqueness_btn.clicked.connect(self.calculate_uniqueness)
 
-        self.save_pickle_btn = QPushButton("Export to Pickle")
-        self.save_pickle_btn.clicked.connect(self.export_to_pickle)
+        self.export_store_btn = QPushButton("Export Detection Store")
+        self.export_store_btn.clicked.connect(self.export_detection_store)
 
         uniqueness_controls.addWidget(self.uniqueness_btn)
-        uniqueness_controls.addWidget(self.save_pickle_btn)
+        uniqueness_controls.addWidget(self.export_store_btn)
         uniqueness_controls.addStretch()
 
         self.uniqueness_text = QTextEdit()
@@ -383,24 +383,24 @@ class FrameAnalyzerWindow(QMainWindow):
         self.uniqueness_text.setText(text)
         self.progress_label.setText(f"Uniqueness calculated for {len(scores)} frames")
 
-    def export_to_pickle(self):
-        """Export analysis data to pickle format for frame detection"""
+    def export_detection_store(self):
+        """Export analysis data as a compiled detection store for frame detection"""
         try:
             if not self.analysis_db.get_all_analyses():
                 QMessageBox.warning(self, "Export Failed", "No analysis data available to export.")
                 return
 
-            pickle_path = self.analysis_db.export_to_pickle()
+            store_path = self.analysis_db.export_detection_store()
             QMessageBox.information(
                 self,
-                "Pickle Export Complete",
-                f"Border analysis data exported to pickle format:\n{pickle_path}\n\n"
-                "This file can be used for frame detection algorithms.",
+                "Detection Store Export Complete",
+                f"Border analysis data exported as a detection store:\n{store_path}\n\n"
+                "Copy it to config/data/frame_detection.npz to use it for frame detection.",
             )
-            self.progress_label.setText("Exported to pickle format for frame detection")
+            self.progress_label.setText("Exported detection store for frame detection")
 
         except Exception as e:
-            QMessageBox.critical(self, "Pickle Export Error", f"Failed to export to pickle:\n{str(e)}")
+            QMessageBox.critical(self, "Detection Store Export Error", f"Failed to export detection store:\n{str(e)}")
 
 
 def main():
@@ -9,6 +9,7 @@ from .automation_engine import AutomationEngine
 from .automation_controller import AutomationController
 from .base_automator import BaseAutomator
 from .button_engine import ButtonEngine
+from .button_group import ButtonGroup
 from .global_hotkey_manager import GlobalHotkeyManager
 from .scan_engine import ScanEngine
 
@@ -17,6 +18,7 @@ __all__ = [
     "AutomationController",
     "BaseAutomator",
     "ButtonEngine",
+    "ButtonGroup",
     "GlobalHotkeyManager",
     "ScanEngine",
 ]
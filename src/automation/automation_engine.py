@@ -7,6 +7,9 @@ import logging
 import sys
 import pyautogui
 
+from capture.backends import get_capture_backend
+from capture.color_palette import get_button_palette
+
 from .button_engine import ButtonEngine
 from .scan_engine import ScanEngine
 
@@ -24,9 +27,9 @@ class AutomationEngine:
         # Initialize engines
         self.scan_engine = ScanEngine()
 
-    def create_button(self, button_data: list, name: str = "button") -> ButtonEngine:
+    def create_button(self, button_data: list, name: str = "button", automator=None) -> ButtonEngine:
         """Factory method to create ButtonEngine instances."""
-        return ButtonEngine(button_data, name)
+        return ButtonEngine(button_data, name, automator=automator)
 
     def click_at(self, x: int, y: int, button: str = "left", duration: float = 0.1) -> bool:
         """Click at specified coordinates."""
@@ -95,26 +98,16 @@ class AutomationEngine:
         screen_x, screen_y, button_color = button_data
         check_color = expected_color or button_color
 
-        # Define button state colors
-        button_colors = {
-            "red": {"default": (199, 35, 21), "focus": (251, 36, 18), "inactive": (57, 23, 20)},
-            "blue": {"default": (21, 87, 199), "focus": (18, 104, 251), "inactive": (20, 34, 57)},
-            "green": {"default": (17, 162, 40), "focus": (15, 204, 45), "inactive": (16, 46, 22)},
-            "yellow": {"default": (242, 151, 0), "focus": (198, 125, 0), "inactive": (60, 39, 8)},
-        }
-
-        if check_color not in button_colors:
+        palette = get_button_palette()
+        if check_color not in palette.colors:
             self.logger.error(f"Invalid button color '{check_color}'")
             sys.exit("Exiting due to invalid button color")
 
-        actual_color = pyautogui.pixel(screen_x, screen_y)
-        tolerance = 5
+        actual_color = get_capture_backend().pixel(screen_x, screen_y)
 
         # Check if button matches any of the three states
-        for state, expected_rgb in button_colors[check_color].items():
-            color_match = all(abs(actual_color[i] - expected_rgb[i]) <= tolerance for i in range(3))
-            if color_match:
-                return True
+        if palette.matches(actual_color, check_color):
+            return True
 
         # Color validation failed
         if trigger_failsafe_callback:
@@ -135,25 +128,13 @@ class AutomationEngine:
 
         screen_x, screen_y, button_color = button_data
 
-        # Define button inactive colors
-        inactive_colors = {
-            "red": (57, 23, 20),
-            "blue": (20, 34, 57),
-            "green": (16, 46, 22),
-            "yellow": (60, 39, 8),
-        }
-
-        if button_color not in inactive_colors:
+        palette = get_button_palette()
+        if button_color not in palette.colors:
             self.logger.error(f"Invalid button color '{button_color}'")
             sys.exit("Exiting due to invalid button color")
 
-        actual_color = pyautogui.pixel(screen_x, screen_y)
-        expected_color = inactive_colors[button_color]
-        tolerance = 5
-
-        # Check if button matches inactive state
-        color_match = all(abs(actual_color[i] - expected_color[i]) <= tolerance for i in range(3))
-        return color_match
+        actual_color = get_capture_backend().pixel(screen_x, screen_y)
+        return palette.is_inactive(actual_color, button_color)
 
     def button_active(self, button_data: list) -> bool:
         """Check if a button is in active state (default or focus)."""
@@ -163,25 +144,10 @@ class AutomationEngine:
 
         screen_x, screen_y, button_color = button_data
 
-        # Define button state colors
-        button_colors = {
-            "red": {"default": (199, 35, 21), "focus": (251, 36, 18)},
-            "blue": {"default": (21, 87, 199), "focus": (18, 104, 251)},
-            "green": {"default": (17, 162, 40), "focus": (15, 204, 45)},
-            "yellow": {"default": (242, 151, 0), "focus": (198, 125, 0)},
-        }
-
-        if button_color not in button_colors:
+        palette = get_button_palette()
+        if button_color not in palette.colors:
             self.logger.error(f"Invalid button color '{button_color}'")
             sys.exit("Exiting due to invalid button color")
 
-        actual_color = pyautogui.pixel(screen_x, screen_y)
-        tolerance = 5
-
-        # Check if button matches default or focus state
-        for state, expected_color in button_colors[button_color].items():
-            color_match = all(abs(actual_color[i] - expected_color[i]) <= tolerance for i in range(3))
-            if color_match:
-                return True
-
-        return False
+        actual_color = get_capture_backend().pixel(screen_x, screen_y)
+        return palette.is_active(actual_color, button_color)
@@ -9,9 +9,16 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 import pyautogui
 
+from capture.backends import get_capture_backend
+from capture.capture_scheduler import CaptureSubscription, get_capture_scheduler
+from capture.frame_ring import CapturedFrame
+from capture.frame_snapshot import FrameSnapshot
 from utility.button_manager import ButtonManager
+from utility.window_utils import get_frame_bbox
 from automation.scan_engine import ScanEngine
 from automation.automation_engine import AutomationEngine
+from automation.button_group import ButtonGroup
+from automation.poll_timing import PollTimings
 
 
 class BaseAutomator(ABC):
@@ -36,7 +43,17 @@ class BaseAutomator(ABC):
         # Button management
         self.button_manager = ButtonManager(frame_data)
         self.engine = AutomationEngine()
-        self.scan = ScanEngine()
+        self.scan = ScanEngine(
+            capture=self.capture_frame,
+            should_continue=lambda: self.should_continue,
+            timings=PollTimings(self.frame_id),
+            frame_bbox=get_frame_bbox,
+        )
+
+        # Frame snapshot - pixel probes read from it between refresh_snapshot() and the next input/sleep
+        self.snapshot = FrameSnapshot(get_frame_bbox)
+        # Shared capture scheduler feed, subscribed while the automation runs
+        self.frame_feed: Optional[CaptureSubscription] = None
 
         # Automation state
         self.is_running = False
@@ -83,7 +100,20 @@ class BaseAutomator(ABC):
         self.start_time = time.time()
 
         # Run the automation directly (controller handles threading)
-        self.run_automation()
+        scheduler = get_capture_scheduler()
+        recorder = scheduler.recorder
+        if recorder is not None:
+            recorder.frame_id = self.frame_id  # Label recorded frames with this frame
+        self.frame_feed = scheduler.subscribe(self.frame_name)
+        try:
+            self.run_automation()
+        finally:
+            if recorder is not None and recorder.frame_id == self.frame_id:
+                recorder.frame_id = None  # Frames captured after this automation are unlabelled
+            self.log_debug(f"Capture stats: {self.frame_feed.stats()}")
+            self.frame_feed.close()
+            self.frame_feed = None
+            self.scan.timings.save()
         return True
 
     def stop_automation(self) -> bool:
@@ -156,6 +186,7 @@ class BaseAutomator(ABC):
         Sleep for given duration while checking for stop signal.
         Returns True if sleep completed normally, False if interrupted.
         """
+        self.snapshot.invalidate()
         end_time = time.time() + duration
         while time.time() < end_time:
             if self.should_stop:
@@ -202,7 +233,11 @@ class BaseAutomator(ABC):
 
     def create_button(self, button_name: str):
         """Create a button engine for the given button name."""
-        return self.engine.create_button(self.button_manager.get_button(button_name), button_name)
+        return self.engine.create_button(self.button_manager.get_button(button_name), button_name, automator=self)
+
+    def create_button_group(self, *button_names: str) -> ButtonGroup:
+        """Create a ButtonGroup of the named buttons (all of the frame's buttons if none are given)."""
+        return ButtonGroup.from_button_manager(self.button_manager, button_names or None, automator=self)
 
     def get_bbox(self) -> Dict[str, int]:
         """Get bounding box for this frame."""
@@ -212,13 +247,32 @@ class BaseAutomator(ABC):
     # Mouse / Input Operations
     # ==============================
 
+    def refresh_snapshot(self) -> bool:
+        """
+        Capture the frame area once so following pixel probes read from memory.
+        The snapshot is dropped on the next click, mouse move or sleep; call again each loop iteration.
+        """
+        return self.snapshot.load(self.capture_frame())
+
+    def capture_frame(self, max_age: float = 0.0) -> Optional[CapturedFrame]:
+        """
+        Get a frame from the shared capture scheduler (read-only view, no per-frame allocation).
+        Frames captured within max_age seconds of the call are reused instead of grabbing again.
+        """
+        if self.frame_feed is not None:
+            return self.frame_feed.get(max_age)
+        return get_capture_scheduler().get_frame(max_age)
+
     def pixel(self, x: Optional[int], y: Optional[int]) -> tuple[int, int, int]:
-        """Get pixel color at specified coordinates."""
+        """Get pixel color at specified coordinates (from the frame snapshot when one is held)."""
         if x is None or y is None:
             self.log_error(f"Cannot get pixel color: x or y is None (x={x}, y={y})")
             return (0, 0, 0)
         try:
-            return pyautogui.pixel(x, y)
+            color = self.snapshot.pixel(x, y)
+            if color is not None:
+                return color
+            return get_capture_backend().pixel(x, y)
         except Exception as e:
             self.log_error(f"Failed to get pixel color at ({x}, {y}): {e}")
             return (0, 0, 0)
@@ -229,7 +283,10 @@ class BaseAutomator(ABC):
             self.log_error(f"Cannot check pixel color: x or y is None (x={x}, y={y})")
             return False
         try:
-            return pyautogui.pixelMatchesColor(x, y, color)
+            matches = self.snapshot.pixel_matches_color(x, y, color)
+            if matches is not None:
+                return matches
+            return get_capture_backend().pixel(x, y)[:3] == tuple(color[:3])
         except Exception as e:
             self.log_error(f"Failed to check pixel color at ({x}, {y}): {e}")
             return False
@@ -238,6 +295,7 @@ class BaseAutomator(ABC):
         self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left", duration: float = 0.1
     ) -> bool:
         """Click at specified coordinates with optional button and duration."""
+        self.snapshot.invalidate()
         try:
             if self.should_continue:
                 if x is not None and y is not None:
@@ -256,6 +314,7 @@ class BaseAutomator(ABC):
         self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left", duration: float = 0.1
     ) -> bool:
         """Mouse down at specified coordinates with optional button and duration."""
+        self.snapshot.invalidate()
         try:
             if self.should_continue:
                 if x is not None and y is not None:
@@ -276,6 +335,7 @@ class BaseAutomator(ABC):
         """Mouse up at specified coordinates with optional button and duration.
         If x or y are not provided, mouseUp occurs at the current mouse position.
         """
+        self.snapshot.invalidate()
         try:
             if self.should_continue:
                 if x is not None and y is not None:
@@ -292,6 +352,7 @@ class BaseAutomator(ABC):
 
     def moveTo(self, x: int, y: int, duration: float = 0.1) -> bool:
         """Move mouse to specified coordinates with optional duration."""
+        self.snapshot.invalidate()
         try:
             if self.should_continue:
                 pyautogui.moveTo(x, y, duration=duration)
@@ -339,15 +400,15 @@ class BaseAutomator(ABC):
             if time.time() - start_time > self.max_run_time:
                 break
 
-            failed = 0
-            for miner in miners:
-                if miner.active():
-                    miner.click()
-                    self.sleep(0.1)
-                    if miner.active():
-                        failed += 1
-                else:
-                    failed += 1
+            # One capture to find ready miners, one to see which clicks did not take
+            self.refresh_snapshot()
+            ready = [miner for miner in miners if miner.active()]
+            for miner in ready:
+                miner.click()
+            self.sleep(0.1)
+
+            self.refresh_snapshot()
+            failed = len(miners) - len(ready) + sum(1 for miner in ready if miner.active())
 
             # Storage full behavior - stop automation completely
             if failed >= 4:
@@ -7,6 +7,9 @@ import logging
 import sys
 import pyautogui
 
+from capture.backends import get_capture_backend
+from capture.color_palette import BUTTON_COLORS, ColorPalette, get_button_palette
+
 
 class ButtonEngine:
     """Represents a single button with all its automation capabilities."""
@@ -23,27 +26,24 @@ class ButtonEngine:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.automator = automator
 
-        # Define button state colors
-        self.button_colors = {
-            "red": {"default": (199, 35, 21), "focus": (251, 36, 18), "inactive": (57, 23, 20)},
-            "blue": {"default": (21, 87, 199), "focus": (18, 104, 251), "inactive": (20, 34, 57)},
-            "green": {"default": (17, 162, 40), "focus": (15, 204, 45), "inactive": (16, 46, 22)},
-            "yellow": {"default": (242, 151, 0), "focus": (198, 125, 0), "inactive": (60, 39, 8)},
-        }
-
-        # Allow custom colors to override or add to button_colors
+        # Custom colors override or add to the shared palette; otherwise reuse the compiled one
         if custom_colors:
+            button_colors = {color: dict(states) for color, states in BUTTON_COLORS.items()}
             for color, states in custom_colors.items():
-                if color in self.button_colors:
-                    self.button_colors[color].update(states)
+                if color in button_colors:
+                    button_colors[color].update(states)
                 else:
-                    self.button_colors[color] = states
+                    button_colors[color] = states
+            self.palette = ColorPalette(button_colors)
+        else:
+            self.palette = get_button_palette()
+        self.button_colors = self.palette.colors
 
         if self.color not in self.button_colors:
             self.logger.error(f"Invalid button color '{self.color}'")
             sys.exit("Exiting due to invalid button color")
 
-        self.tolerance = 5
+        self.tolerance = self.palette.tolerance
 
     @property
     def should_continue(self) -> bool:
@@ -55,26 +55,16 @@ class ButtonEngine:
         if not self.should_continue:
             return False
 
-        actual_color = self.automator.pixel(self.x, self.y) if self.automator else pyautogui.pixel(self.x, self.y)
-
-        # Check if button matches default or focus state
-        for state in ["default", "focus"]:
-            expected_color = self.button_colors[self.color][state]
-            color_match = all(abs(actual_color[i] - expected_color[i]) <= self.tolerance for i in range(3))
-            if color_match:
-                return True
-        return False
+        actual_color = self.automator.pixel(self.x, self.y) if self.automator else get_capture_backend().pixel(self.x, self.y)
+        return self.palette.is_active(actual_color, self.color)
 
     def inactive(self) -> bool:
         """Check if button is in inactive state."""
         if not self.should_continue:
             return True
 
-        actual_color = self.automator.pixel(self.x, self.y) if self.automator else pyautogui.pixel(self.x, self.y)
-        expected_color = self.button_colors[self.color]["inactive"]
-
-        color_match = all(abs(actual_color[i] - expected_color[i]) <= self.tolerance for i in range(3))
-        return color_match
+        actual_color = self.automator.pixel(self.x, self.y) if self.automator else get_capture_backend().pixel(self.x, self.y)
+        return self.palette.is_inactive(actual_color, self.color)
 
     def click(self, retries: int = 3, ignore: bool = False) -> bool:
         """Click this button with safety validation and retries.
@@ -86,7 +76,7 @@ class ButtonEngine:
 
             if ignore or self.active():
                 if self.automator:
-                    return self.automator.click(self.x, self.y)
+                    return self.automator.click(self.x, self.y, duration=0)
                 else:
                     self.logger.debug(f"Clicking {self.color} {self.name} at ({self.x}, {self.y})")
                     pyautogui.click(self.x, self.y)
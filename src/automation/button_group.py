@@ -0,0 +1,242 @@
+"""
+Button Group
+Reads the state of several buttons from one capture and clicks them in batches.
+"""
+
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pyautogui
+
+from capture.capture_scheduler import get_capture_scheduler
+from capture.color_palette import ACTIVE_STATES, ColorPalette, get_button_palette
+from capture.frame_ring import CapturedFrame
+
+
+class ButtonGroup:
+    """
+    A frame's buttons sampled together.
+
+    Every button coordinate is gathered from one captured frame with a single fancy-index and
+    classified with the compiled color palette, so checking N buttons costs one capture instead
+    of N pixel reads. Clicks in a batch are validated once from that capture.
+    """
+
+    def __init__(self, buttons: Dict[str, list], automator=None, palette: Optional[ColorPalette] = None):
+        """
+        Args:
+            buttons: {name: [screen_x, screen_y, color]} as returned by ButtonManager.get_all_buttons()
+            automator: Owning BaseAutomator (captures, clicks, sleeps and should_continue go through it)
+            palette: Color palette (default: the shared button palette)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.automator = automator
+        self.palette = palette or get_button_palette()
+
+        invalid = [name for name, button in buttons.items() if len(button) != 3 or button[2] not in self.palette.colors]
+        if invalid:
+            raise ValueError(f"Invalid button data for {invalid}")
+
+        self.names: List[str] = list(buttons)
+        self.buttons = {name: list(buttons[name]) for name in self.names}
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.xs = np.array([buttons[name][0] for name in self.names], dtype=np.intp)
+        self.ys = np.array([buttons[name][1] for name in self.names], dtype=np.intp)
+
+        # Per-label family/state codes so a gathered label vector maps to per-button states
+        families = list(self.palette.colors)
+        self.states: List[str] = sorted({state for _, state in self.palette.labels})
+        self._families = np.array([families.index(buttons[name][2]) for name in self.names], dtype=np.int16)
+        self._label_families = np.array([families.index(family) for family, _ in self.palette.labels], dtype=np.int16)
+        self._label_states = np.array([self.states.index(state) for _, state in self.palette.labels], dtype=np.int16)
+
+    @classmethod
+    def from_button_manager(
+        cls, button_manager, names: Optional[Iterable[str]] = None, automator=None
+    ) -> "ButtonGroup":
+        """Build a group from a ButtonManager, optionally limited to the given button names."""
+        buttons = button_manager.get_all_buttons()
+        if names is not None:
+            buttons = {name: button_manager.get_button(name) for name in names}
+        return cls(buttons, automator=automator)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    @property
+    def should_continue(self) -> bool:
+        return self.automator.should_continue if self.automator else True
+
+    # ==============================
+    # Sampling
+    # ==============================
+
+    def capture(self) -> Optional[CapturedFrame]:
+        """Current frame: the automator's held snapshot, else a fresh capture."""
+        if self.automator is not None:
+            return self.automator.snapshot.frame or self.automator.capture_frame()
+        return get_capture_scheduler().get_frame()
+
+    def sample(self, frame: Optional[CapturedFrame] = None) -> np.ndarray:
+        """
+        (N, 3) uint8 colors at every button coordinate, gathered from one frame.
+
+        Returns an empty (0, 3) array when no frame could be captured. Buttons outside the
+        captured bbox read the nearest edge pixel; state_codes() reports them as -1.
+        """
+        gathered = self._gather(frame)
+        if gathered is None:
+            return np.empty((0, 3), dtype=np.uint8)
+        return gathered[0]
+
+    def _gather(self, frame: Optional[CapturedFrame]):
+        """
+        (pixels, inside) of every button from frame, or from capture() when frame is None.
+
+        Frames are views into a ring slot that a newer capture may reuse while they are held.
+        If the slot was reused by the end of the read the pixels may be torn, so a fresh frame
+        is captured and read instead. None when no frame could be captured.
+        """
+        for _ in range(2):
+            frame = frame if frame is not None else self.capture()
+            if frame is None:
+                break
+            rows, cols, inside = self._positions(frame)
+            pixels = frame.array[rows, cols]
+            if frame.current:
+                return pixels, inside
+            self.logger.debug(f"Frame {frame.seq} was overwritten while sampling buttons, capturing again")
+            if self.automator is not None:
+                self.automator.snapshot.invalidate()
+            frame = None
+        self.logger.debug("No frame captured for button group")
+        return None
+
+    def _positions(self, frame: CapturedFrame):
+        """Clipped (rows, cols) of the buttons inside frame and the (N,) mask of those really inside."""
+        ox, oy = frame.origin
+        cols, rows = self.xs - ox, self.ys - oy
+        height, width = frame.array.shape[:2]
+        inside = (cols >= 0) & (rows >= 0) & (cols < width) & (rows < height)
+        if not inside.all():
+            outside = [name for name, ok in zip(self.names, inside.tolist()) if not ok]
+            self.logger.debug(f"Buttons {outside} outside captured bbox {frame.bbox}")
+        return np.clip(rows, 0, height - 1), np.clip(cols, 0, width - 1), inside
+
+    def state_codes(self, frame: Optional[CapturedFrame] = None) -> np.ndarray:
+        """
+        (N,) indices into self.states per button, -1 where the pixel is not the button's color.
+
+        Every button is -1 when no frame could be captured, and buttons outside the captured
+        bbox are -1, so callers see "not active" and retry on their next cycle.
+        """
+        gathered = self._gather(frame)
+        if gathered is None:
+            return np.full(len(self), -1, dtype=np.int16)
+        pixels, inside = gathered
+        labels = self.palette.classify_array(pixels)
+        valid = (labels >= 0) & inside
+        safe = np.where(valid, labels, 0)
+        matches = valid & (self._label_families[safe] == self._families)
+        return np.where(matches, self._label_states[safe], np.int16(-1))
+
+    def read_states(self, frame: Optional[CapturedFrame] = None) -> Dict[str, Optional[str]]:
+        """{name: 'default' | 'focus' | 'inactive' | None} from one capture."""
+        codes = self.state_codes(frame).tolist()
+        return {name: self.states[code] if code >= 0 else None for name, code in zip(self.names, codes)}
+
+    def active_mask(self, frame: Optional[CapturedFrame] = None) -> np.ndarray:
+        """(N,) bool - button shows its default or focus color."""
+        active_codes = [self.states.index(state) for state in ACTIVE_STATES if state in self.states]
+        return np.isin(self.state_codes(frame), active_codes)
+
+    def inactive_mask(self, frame: Optional[CapturedFrame] = None) -> np.ndarray:
+        """(N,) bool - button shows its inactive color."""
+        if "inactive" not in self.states:
+            return np.zeros(len(self), dtype=bool)
+        return self.state_codes(frame) == self.states.index("inactive")
+
+    def active(self, frame: Optional[CapturedFrame] = None) -> List[str]:
+        """Names of the active buttons."""
+        return [name for name, ok in zip(self.names, self.active_mask(frame).tolist()) if ok]
+
+    def inactive(self, frame: Optional[CapturedFrame] = None) -> List[str]:
+        """Names of the inactive buttons."""
+        return [name for name, ok in zip(self.names, self.inactive_mask(frame).tolist()) if ok]
+
+    # ==============================
+    # Clicking
+    # ==============================
+
+    def _click(self, name: str) -> bool:
+        x, y, color = self.buttons[name]
+        if self.automator is not None:
+            return self.automator.click(x, y, duration=0)
+        self.logger.debug(f"Clicking {color} {name} at ({x}, {y})")
+        pyautogui.click(x, y)
+        return True
+
+    def _sleep(self, duration: float) -> bool:
+        if self.automator is not None:
+            return self.automator.sleep(duration)
+        time.sleep(duration)
+        return True
+
+    def click_all_active(self, names: Optional[Iterable[str]] = None, delay: float = 0.0) -> List[str]:
+        """
+        Click every active button (optionally only the given names) validated from one capture.
+
+        Returns:
+            Names of the buttons clicked, in group order
+        """
+        wanted = set(self.names if names is None else names)
+        clicked = []
+        for name in self.active():
+            if name not in wanted:
+                continue
+            if not self.should_continue:
+                break
+            self._click(name)
+            clicked.append(name)
+            if delay:
+                self._sleep(delay)
+        return clicked
+
+    def click_sequence(self, names: Sequence[str], retries: int = 3, delay: float = 0.0) -> bool:
+        """
+        Click buttons in order, validating the whole remaining sequence from one capture per round.
+
+        Clicking stops at the first button that is not active; after a short wait the rest of the
+        sequence is re-read and continued, up to retries rounds. Repeated names are clicked once
+        per occurrence.
+
+        Returns:
+            True if every button in the sequence was clicked
+        """
+        pending = list(names)
+        for attempt in range(retries):
+            if not self.should_continue:
+                return False
+
+            mask = self.active_mask()
+            active = {name for name, ok in zip(self.names, mask.tolist()) if ok}
+            done = 0
+            for name in pending:
+                if name not in active or not self.should_continue:
+                    break
+                self._click(name)
+                done += 1
+                if delay:
+                    self._sleep(delay)
+            pending = pending[done:]
+            if not pending:
+                return True
+
+            if attempt < retries - 1 and not self._sleep(0.1):
+                return False
+        return False
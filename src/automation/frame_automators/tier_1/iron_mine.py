@@ -15,18 +15,11 @@ class IronMineAutomator(BaseAutomator):
         super().__init__(frame_data)
 
     def run_automation(self):
-        miners = [
-            self.create_button("miner1"),
-            self.create_button("miner2"),
-            self.create_button("miner3"),
-            self.create_button("miner4"),
-        ]
-
-        # Main automation loop
+        miners = self.create_button_group("miner1", "miner2", "miner3", "miner4")
+
+        # Main automation loop - one capture per cycle for all four miners
         while self.should_continue:
-            for miner in miners:
-                if self.should_continue and miner.active():
-                    miner.click()
+            miners.click_all_active()
 
             if not self.sleep(0.05):
                 break
@@ -9,7 +9,7 @@ import numpy as np
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
-from utility.window_utils import get_frame_screenshot
+from capture.capture_planner import CapturePlanner
 
 
 class AscensionFacilityAutomator(BaseAutomator):
@@ -20,6 +20,7 @@ class AscensionFacilityAutomator(BaseAutomator):
 
     def run_automation(self):
         canvas = self.frame_data["bbox"]["canvas"]
+        canvas_capture = CapturePlanner.from_frame_data(self.frame_data, ["canvas"])
         space_ship = self.frame_data["bbox"]["space_ship"]
         brick_color = tuple(self.frame_data["colors"]["brick"])
         start = self.frame_data["interactions"]["start"]
@@ -79,15 +80,8 @@ class AscensionFacilityAutomator(BaseAutomator):
         ship_collision_y = ship_y - ship_h // 2  # y at which brick bottom collides
 
         while self.should_continue:
-            screenshot = get_frame_screenshot()
-            if screenshot is None:
-                if not self.sleep(0.02):
-                    break
-                continue
-
-            # Full canvas crop once
-            canvas_img = screenshot.crop((canvas_x1, canvas_y1, canvas_x2, canvas_y2))
-            arr = np.array(canvas_img)[..., :3]
+            # Grab only the canvas (screen coords, same as the brick translation below)
+            arr = canvas_capture.capture()["canvas"]
             mask = np.all(arr == brick_color, axis=-1)
 
             bricks = get_bricks(mask)
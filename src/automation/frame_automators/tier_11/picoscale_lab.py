@@ -6,9 +6,10 @@ Handles automation for the Picoscale Lab frame in WidgetInc.
 from imagehash import phash
 
 
-from PIL import ImageGrab
+from PIL import Image
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from capture.capture_planner import CapturePlanner
 
 
 class PicoscaleLabAutomator(BaseAutomator):
@@ -21,13 +22,13 @@ class PicoscaleLabAutomator(BaseAutomator):
         pass_button = self.create_button("pass")
         fail_button = self.create_button("fail")
 
-        sample_bbox = self.frame_data["bbox"]["sample"]
-        compare_bbox = self.frame_data["bbox"]["compare"]
+        bbox_capture = CapturePlanner.from_frame_data(self.frame_data, ["sample", "compare"])
 
         # Main automation loop
         while self.should_continue:
-            sample_hash = phash(ImageGrab.grab(bbox=sample_bbox, all_screens=True))
-            compare_hash = phash(ImageGrab.grab(bbox=compare_bbox, all_screens=True))
+            regions = bbox_capture.capture()
+            sample_hash = phash(Image.fromarray(regions["sample"]))
+            compare_hash = phash(Image.fromarray(regions["compare"]))
 
             # Use Hamming distance for tolerance
             threshold = 2  # Allow up to 4 bits difference
@@ -4,9 +4,9 @@ Handles automation for the Sentience Aggregator frame in WidgetInc.
 """
 
 from imagehash import phash
-from PIL import ImageGrab
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from capture.backends import get_capture_backend
 
 
 class SentienceAggregatorAutomator(BaseAutomator):
@@ -59,7 +59,7 @@ class SentienceAggregatorAutomator(BaseAutomator):
         BACKHASH_THRESHOLD = 20
 
         def get_hash(idx):
-            return phash(ImageGrab.grab(bbox=tuple(bboxes[idx]), all_screens=True))
+            return phash(get_capture_backend().grab_image(tuple(bboxes[idx])))
 
         # Store back hash once at start when all cards are guaranteed face down
         self.back_hash = get_hash(0)
@@ -3,23 +3,27 @@ Sentience Facility Automator (Frame ID: 11.1)
 Handles automation for the Sentience Facility frame in WidgetInc.
 """
 
+import time
+
 import numpy as np
 from typing import Any, Dict, List, Tuple
 from automation.base_automator import BaseAutomator
-from utility.window_utils import get_frame_screenshot
+from capture.change_detector import ChangeDetector
 from utility.coordinate_utils import conv_frame_coords_to_screen_coords
 
 
 class SentienceFacilityAutomator(BaseAutomator):
     """Automation logic for Sentience Facility (Frame 11.1)."""
 
+    # Seconds without a visible change after which the shapes are classified again
+    RECLASSIFY_AFTER = 3.0
+
     def __init__(self, frame_data: Dict[str, Any]):
         super().__init__(frame_data)
 
-    def _extract_counts(self, screenshot, bboxes: List[Tuple[int, int, int, int]]):
+    def _extract_counts(self, arr_full: np.ndarray, bboxes: List[Tuple[int, int, int, int]]):
         """Return list of record dicts with metrics for each bbox (no labeling)."""
         color_tables = self._color_tables
-        arr_full = np.array(screenshot)[..., :3]
         records = []
         for bbox in bboxes:
             x1, y1, x2, y2 = map(int, bbox)
@@ -70,10 +74,10 @@ class SentienceFacilityAutomator(BaseAutomator):
             mapping[rec["center"]] = label
         return mapping
 
-    def _classify_groups(self, screenshot, source_bboxes, target_bboxes):
-        """Classify both source and target groups from a single screenshot for consistency."""
-        source_records = self._extract_counts(screenshot, source_bboxes)
-        target_records = self._extract_counts(screenshot, target_bboxes)
+    def _classify_groups(self, frame_array: np.ndarray, source_bboxes, target_bboxes):
+        """Classify both source and target groups from a single capture for consistency."""
+        source_records = self._extract_counts(frame_array, source_bboxes)
+        target_records = self._extract_counts(frame_array, target_bboxes)
         source_map = self._assign_labels(source_records)
         target_map = self._assign_labels(target_records)
 
@@ -127,14 +131,33 @@ class SentienceFacilityAutomator(BaseAutomator):
         source_bboxes = self.all_shapes[:4]
         target_bboxes = self.all_shapes[4:]
 
+        # Skip classification while the shapes have not moved since the last pass
+        changes = ChangeDetector(tile=16)
+        shapes_region = (
+            min(b[0] for b in self.all_shapes),
+            min(b[1] for b in self.all_shapes),
+            max(b[2] for b in self.all_shapes),
+            max(b[3] for b in self.all_shapes),
+        )
+
+        # Classify again anyway when the last pass missed a shape or nothing moved for a while
+        retry = True
+        last_pass = 0.0
+
         while self.should_continue:
-            screenshot = get_frame_screenshot()
-            if screenshot is None:
+            frame = self.capture_frame()
+            if frame is None:
+                if not self.sleep(0.25):
+                    return
+                continue
+            moved = changes.update(frame) and changes.changed(shapes_region)
+            if not (moved or retry or time.monotonic() - last_pass >= self.RECLASSIFY_AFTER):
                 if not self.sleep(0.25):
                     return
                 continue
+            last_pass = time.monotonic()
 
-            source_map, target_map = self._classify_groups(screenshot, source_bboxes, target_bboxes)
+            source_map, target_map = self._classify_groups(frame.array, source_bboxes, target_bboxes)
             # Ordered source labels (one each)
             self.ordered_sources = [source_map.get(center_of(b), "unknown") for b in source_bboxes]
             print("[SentienceFacility] Source order:", self.ordered_sources)
@@ -148,6 +171,7 @@ class SentienceFacilityAutomator(BaseAutomator):
                     label_to_target_center[lbl] = c
 
             # Click in source order
+            clicked = 0
             for lbl in self.ordered_sources:
                 tc = label_to_target_center.get(lbl)
                 if not tc:
@@ -155,8 +179,10 @@ class SentienceFacilityAutomator(BaseAutomator):
                 tx, ty = tc
                 sx, sy = conv_frame_coords_to_screen_coords(tx, ty)
                 self.click(sx, sy)
+                clicked += 1
                 if not self.sleep(0.1):
                     return
+            retry = clicked < len(source_bboxes)
 
             # Pause for reshuffle
             if not self.sleep(1.0):
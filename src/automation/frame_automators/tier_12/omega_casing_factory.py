@@ -5,6 +5,7 @@ Handles automation for the Omega Casing Factory frame in WidgetInc.
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import ColorDiffers, ColorMatch
 
 
 class OmegaCasingFactoryAutomator(BaseAutomator):
@@ -23,11 +24,15 @@ class OmegaCasingFactoryAutomator(BaseAutomator):
         background_colors = self.frame_data["colors"]["background_colors"]
         lever_color = self.frame_data["colors"]["lever_color"]
 
+        # Watch point and lever conditions, checked against one capture per tick
+        watch_idle = ColorMatch(watch_point, background_colors)
+        watch_busy = ColorDiffers(watch_point, background_colors)
+        lever_ready = ColorMatch(lever_off, lever_color)
+
         if self.pixel(*watch_point) in background_colors:
             self.mouseDown(*lever_off)
             self.moveTo(*lever_on)
-        while self.should_continue and self.pixel(*watch_point) in background_colors:
-            self.sleep(0.1)
+        self.scan.wait_for_any([watch_busy], timeout=None, check_interval=0.1)
 
         # Main automation loop
         while self.should_continue:
@@ -35,14 +40,11 @@ class OmegaCasingFactoryAutomator(BaseAutomator):
             self.moveTo(*piston_extended, duration=0.1)
             self.mouseUp()
 
-            while self.pixel(*lever_off) != lever_color:
-                self.sleep(0.05)
+            if not self.scan.wait_for_any([lever_ready], timeout=None):
+                break
             self.mouseDown(*lever_off)
             self.moveTo(*lever_on, duration=0.1)
-            while self.should_continue and self.pixel(*watch_point) not in background_colors:
-                self.sleep(0.05)
-
-            while self.should_continue and self.pixel(*watch_point) in background_colors:
-                self.sleep(0.05)
+            self.scan.wait_for_any([watch_idle], timeout=None)
+            self.scan.wait_for_any([watch_busy], timeout=None)
             self.mouseUp()
             continue
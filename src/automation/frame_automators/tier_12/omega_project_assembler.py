@@ -14,10 +14,7 @@ class OmegaProjectAssemblerAutomator(BaseAutomator):
         super().__init__(frame_data)
 
     def run_automation(self):
-        imbue = self.create_button("imbue")
-        sacrifice = self.create_button("sacrifice")
-        install = self.create_button("install")
-        assemble = self.create_button("assemble")
+        buttons = self.create_button_group("imbue", "sacrifice", "install", "assemble")
 
         lever_up = self.frame_data["interactions"]["lever_up"]
         lever_down = self.frame_data["interactions"]["lever_down"]
@@ -30,16 +27,14 @@ class OmegaProjectAssemblerAutomator(BaseAutomator):
             self.moveTo(lever_down[0], lever_down[1], duration=0.1)
             self.mouseUp(duration=0.1)
 
-            imbue.click()
-            sacrifice.click()
-            install.click()
+            buttons.click_sequence(["imbue", "sacrifice", "install"])
 
             self.mouseDown(slider_left[0], slider_left[1])
             self.moveTo(slider_right[0], slider_right[1], duration=0.1)
             self.mouseUp(duration=0.1)
 
-            assemble.click()
+            buttons.click_sequence(["assemble"])
 
-            while not assemble.active():
+            while "assemble" not in buttons.active():
                 if not self.sleep(0.1):
                     break
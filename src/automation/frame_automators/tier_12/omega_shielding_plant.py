@@ -5,6 +5,7 @@ Handles automation for the Omega Shielding Plant frame in WidgetInc.
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import ColorDiffers, ColorMatch, match_colors
 
 
 class OmegaShieldingPlantAutomator(BaseAutomator):
@@ -24,27 +25,28 @@ class OmegaShieldingPlantAutomator(BaseAutomator):
         indicator_color = self.frame_data["colors"]["indicator_color"]
         background_color = self.frame_data["colors"]["background_color"]
 
-        indicator_xy1 = (indicator_x, watch_bbox[1])
+        is_indicator = match_colors(indicator_color)
+        shield_cleared = ColorMatch((center_x, bottom_y), background_color)
 
         # Main automation loop
         while self.should_continue:
-            # Find indicator y
-            for y in range(watch_bbox[1], watch_bbox[3]):
-                if self.pixelMatchesColor(indicator_xy1[0], y, indicator_color):
-                    indicator_y = y
+            # Find indicator y with one strip capture down the watch bbox
+            top, bottom = (indicator_x, watch_bbox[1]), (indicator_x, watch_bbox[3] - 1)
+            indicator = self.scan.scan_line(top, bottom, is_indicator)
+            if indicator is None:
+                if not self.sleep(0.1):
                     break
-            print(y)
+                continue
+            indicator_y = indicator.y
 
             self.mouseDown(lever_up[0], lever_up[1])
             self.moveTo(lever_down[0], lever_down[1])
 
             # watch bbox at indicator y value
-            while self.should_continue and self.pixel(center_x, indicator_y + 20) == background_color:
-                self.sleep(0.05)
+            self.scan.wait_for_any([ColorDiffers((center_x, indicator_y + 20), background_color)], timeout=None)
 
             self.mouseUp()
-            while self.should_continue and self.pixel(center_x, bottom_y) != background_color:
-                self.sleep(0.1)
+            self.scan.wait_for_any([shield_cleared], timeout=None, check_interval=0.1)
 
             if not self.sleep(0.1):
                 break
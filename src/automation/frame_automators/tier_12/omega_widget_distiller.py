@@ -7,6 +7,9 @@ import json
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import match_colors
+from capture.change_detector import ChangeDetector
+from capture.frame_ring import FrameRingBuffer
 
 
 class OmegaWidgetDistillerAutomator(BaseAutomator):
@@ -18,6 +21,7 @@ class OmegaWidgetDistillerAutomator(BaseAutomator):
         # Load widget color map
         with open("src/automation/frame_automators/tier_12/widget_color_map.json", "r") as f:
             self.widget_color_map = set(tuple(c) for c in json.load(f))
+        self.is_widget = match_colors(self.widget_color_map)
 
         self.drag_point_1 = self.frame_data["interactions"]["drag_point_1"]
         self.drag_point_2 = self.frame_data["interactions"]["drag_point_2"]
@@ -25,31 +29,32 @@ class OmegaWidgetDistillerAutomator(BaseAutomator):
         self.watch_bbox = self.frame_data["bbox"]["watch_bbox"]
 
     def run_automation(self):
+        x1, y1, x2, y2 = self.watch_bbox
+        center_y = round((y1 + y2) // 2)  # vertical center of the bbox
+
+        # One grab of the watch line per scan; rescan only once the line changes
+        line_bbox = (x1, center_y, x2 + 1, center_y + 1)
+        line_ring = FrameRingBuffer(slots=2)
+        changes = ChangeDetector(tile=8, frame_source=lambda: line_ring.capture(line_bbox))
+
         # Main automation loop
         while self.should_continue:
-            x1, y1, x2, y2 = self.watch_bbox
-            center_y = round((y1 + y2) // 2)  # vertical center of the bbox
+            line = line_ring.capture(line_bbox)
+            changes.update(line)
 
-            found = False
             # Scan right-to-left, skipping 5px at a time
-            for x in range(x2, x1 - 1, -5):
-                color = self.pixel(x, center_y)
-                if self.should_continue and color[:3] in self.widget_color_map:
-                    self.logger.info(f"Widget color found at ({x}, {center_y}): {color}")
-                    self.moveTo(x, center_y, duration=0.1)
-                    self.mouseDown()
-                    self.moveTo(*self.drag_point_1, duration=0.5)
-                    self.moveTo(*self.drag_point_2, duration=1)
-                    self.moveTo(*self.drag_point_3, duration=0.5)
-                    self.sleep(1)
-                    self.mouseUp()
-                    found = True
-                    break
-
-            if not found:
-                self.logger.info("Widget color not found, adjusting search area.")
-                # Optionally, adjust the search area or take other actions
-                pass
-
-            if not self.sleep(0.05):
-                break
+            widget = self.scan.scan_line(
+                (x1, center_y), (x2, center_y), self.is_widget, step=5, direction=-1, frame=line
+            )
+            if self.should_continue and widget is not None:
+                self.logger.info(f"Widget color found at ({widget.x}, {center_y}): {widget.color}")
+                self.moveTo(widget.x, center_y, duration=0.1)
+                self.mouseDown()
+                self.moveTo(*self.drag_point_1, duration=0.5)
+                self.moveTo(*self.drag_point_2, duration=1)
+                self.moveTo(*self.drag_point_3, duration=0.5)
+                self.sleep(1)
+                self.mouseUp()
+            else:
+                self.logger.info("Widget color not found, waiting for the watch line to change.")
+                changes.wait_for_change(timeout=5.0, interval=0.05, should_continue=lambda: self.should_continue)
@@ -6,9 +6,10 @@ Handles automation for the Rocket Electronics Lab frame in WidgetInc.
 import easyocr
 import numpy as np
 
-from PIL import Image, ImageFilter, ImageGrab
+from PIL import Image, ImageFilter
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from capture.backends import get_capture_backend
 
 
 class RocketElectronicsLabAutomator(BaseAutomator):
@@ -33,7 +34,7 @@ class RocketElectronicsLabAutomator(BaseAutomator):
     def read_binary(self, reading_bbox):
         """Read binary sequence from screen area."""
         # Capture area
-        reading_image = ImageGrab.grab(bbox=reading_bbox, all_screens=True)
+        reading_image = get_capture_backend().grab_image(tuple(reading_bbox))
         # Preprocess for OCR
         # Convert to grayscale and blur for better OCR
         img_test = reading_image.convert("L")
@@ -5,6 +5,7 @@ Handles automation for the Rocket Fuel Distiller frame in WidgetInc.
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import ColorMatch
 
 
 class RocketFuelDistillerAutomator(BaseAutomator):
@@ -23,25 +24,18 @@ class RocketFuelDistillerAutomator(BaseAutomator):
         extended_x = self.frame_data["interactions"]["piston_extended"][0]
 
         piston_color_map = self.frame_data["colors"]["piston_color_map"]
+        pistons = {"piston3": piston3, "piston2": piston2, "piston1": piston1}
+        piston_ready = {name: ColorMatch(piston, piston_color_map) for name, piston in pistons.items()}
+
         # Main automation loop
         while self.should_continue:
-            while self.should_continue and self.pixel(*piston3) not in piston_color_map:
-                self.sleep(0.1)
-            self.mouseDown(*piston3)
-            self.moveTo(extended_x, piston3[1], duration=0.1)
-            self.mouseUp()
-
-            while self.should_continue and self.pixel(*piston2) not in piston_color_map:
-                self.sleep(0.1)
-            self.mouseDown(*piston2)
-            self.moveTo(extended_x, piston2[1], duration=0.1)
-            self.mouseUp()
-
-            while self.should_continue and self.pixel(*piston1) not in piston_color_map:
-                self.sleep(0.1)
-            self.mouseDown(*piston1)
-            self.moveTo(extended_x, piston1[1], duration=0.1)
-            self.mouseUp()
+            for name, piston in pistons.items():
+                # Refill time per piston is learned, so waits poll tightly only when it is due
+                if not self.scan.wait_for_any([piston_ready[name]], timeout=None, check_interval=0.1, learn=name):
+                    return
+                self.mouseDown(*piston)
+                self.moveTo(extended_x, piston[1], duration=0.1)
+                self.mouseUp()
 
             distill.click()
 
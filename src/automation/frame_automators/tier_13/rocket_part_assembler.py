@@ -5,6 +5,7 @@ Handles automation for the Rocket Part Assembler frame in WidgetInc.
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import ColorDiffers
 
 
 class RocketPartAssemblerAutomator(BaseAutomator):
@@ -29,16 +30,18 @@ class RocketPartAssemblerAutomator(BaseAutomator):
         # For each lever/catch_point pair, perform the drag-and-drop sequence
         lever_points = [lever1, lever2]
         catch_points = [catch_point1, catch_point2]
+        caught = [ColorDiffers(catch_point, background_color_map) for catch_point in catch_points]
+        processed = ColorDiffers(processing_point, processing_color)
 
         # Main automation loop
         while self.should_continue:
-            for lever, catch_point in zip(lever_points, catch_points):
+            for lever, catch_point, part_caught in zip(lever_points, catch_points, caught):
                 self.mouseDown(*lever)
                 self.moveTo(catch_point[0], catch_point[1], duration=0.1)
                 self.mouseUp()
 
-                while self.pixel(*catch_point) in background_color_map:
-                    self.sleep(0.05)
+                if not self.scan.wait_for_any([part_caught], timeout=None):
+                    return
 
                 self.mouseDown()
                 self.moveTo(drop_point[0], drop_point[1], duration=1.5)
@@ -50,8 +53,7 @@ class RocketPartAssemblerAutomator(BaseAutomator):
             self.mouseUp()
 
             self.sleep(1)
-            while self.pixel(*processing_point) == processing_color:
-                self.sleep(0.1)
+            self.scan.wait_for_any([processed], timeout=None, check_interval=0.1)
 
             if not self.sleep(0.05):
                 break
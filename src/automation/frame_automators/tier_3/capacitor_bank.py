@@ -15,11 +15,8 @@ class CapacitorBankAutomator(BaseAutomator):
         super().__init__(frame_data)
 
     def run_automation(self):
-        # Create button objects
-        self.plus1 = self.create_button("plus1")
-        self.plus2 = self.create_button("plus2")
-        self.plus4 = self.create_button("plus4")
-        self.plus8 = self.create_button("plus8")
+        # Voltage buttons, validated together from one capture per click sequence
+        self.plus_buttons = self.create_button_group("plus1", "plus2", "plus4", "plus8")
 
         # Get voltage box coordinates
         vbox_top = self.frame_data["frame_xy"]["interactions"]["voltage_box_top"]
@@ -35,8 +32,12 @@ class CapacitorBankAutomator(BaseAutomator):
         one_volt = self.frame_data["interactions"]["1v"]
 
         while self.should_continue:
-            # Get voltage box fill - fix argument order
-            fill = get_vertical_fill(vbox_x, vbox_y_top, vbox_y_bot, empty_color, filled_colors)
+            # Voltage box fill, read from the frame capture (frame_xy coordinates)
+            frame = self.capture_frame()
+            if frame is None:
+                self.sleep(0.5)
+                continue
+            fill = get_vertical_fill(vbox_x, vbox_y_top, vbox_y_bot, empty_color, filled_colors, screenshot=frame)
             voltage = round(15 * fill / 100)
             self.log_info(f"Current voltage: {voltage}")
             if voltage > 0:
@@ -54,10 +55,10 @@ class CapacitorBankAutomator(BaseAutomator):
 
     def match_voltage(self, voltage):
         """Click buttons to match target voltage."""
-        buttons = [(8, self.plus8), (4, self.plus4), (2, self.plus2), (1, self.plus1)]
-
-        for value, button in buttons:
+        sequence = []
+        for value in (8, 4, 2, 1):
             while voltage >= value:
-                button.click()
+                sequence.append(f"plus{value}")
                 voltage -= value
-                self.sleep(0.1)
+
+        self.plus_buttons.click_sequence(sequence, delay=0.1)
@@ -9,10 +9,11 @@ import pyautogui
 import re
 import ast
 import operator as _op
-from PIL import Image, ImageFilter, ImageGrab
-from typing import Any, Dict, Tuple
+from PIL import Image, ImageFilter
+from typing import Any, Dict
 
 from automation.base_automator import BaseAutomator
+from capture.capture_planner import CapturePlanner
 
 
 class ComputeEngineAutomator(BaseAutomator):
@@ -31,9 +32,8 @@ class ComputeEngineAutomator(BaseAutomator):
     # ==============================
     # Image / OCR Helpers
     # ==============================
-    def _vector_preprocess(self, pil_img: Image.Image) -> Image.Image:
+    def _vector_preprocess(self, arr: np.ndarray) -> Image.Image:
         """Vectorized keep-white-only preprocessing (much faster than pixel loops)."""
-        arr = np.asarray(pil_img.convert("RGB"))
         mask = np.all(arr == 255, axis=2)
         out = np.zeros_like(arr)
         out[mask] = 255
@@ -51,20 +51,6 @@ class ComputeEngineAutomator(BaseAutomator):
             return str(results[0])[:32]
         return ""
 
-    def _capture_and_crop_batch(self, bboxes: Dict[str, Tuple[int, int, int, int]]) -> Dict[str, Image.Image]:
-        """Capture ONE bounding grab covering all regions then crop each to reduce grabs."""
-        # Expand list of bboxes
-        coords = list(bboxes.values())
-        x1 = min(b[0] for b in coords)
-        y1 = min(b[1] for b in coords)
-        x2 = max(b[2] for b in coords)
-        y2 = max(b[3] for b in coords)
-        full = ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
-        out = {}
-        for name, (bx1, by1, bx2, by2) in bboxes.items():
-            out[name] = full.crop((bx1 - x1, by1 - y1, bx2 - x1, by2 - y1))
-        return out
-
     # ==============================
     # Equation Solving
     # ==============================
@@ -112,14 +98,9 @@ class ComputeEngineAutomator(BaseAutomator):
     # ==============================
     def run_automation(self):
         # Retrieve bboxes (assumed screen absolute already)
-        b = self.frame_data["bbox"]
-        equation_bbox = b["equation_bbox"]
-        answer_bboxes = {
-            "answer1": b["answer1_bbox"],
-            "answer2": b["answer2_bbox"],
-            "answer3": b["answer3_bbox"],
-            "answer4": b["answer4_bbox"],
-        }
+        regions_capture = CapturePlanner.from_frame_data(
+            self.frame_data, ["equation_bbox", "answer1_bbox", "answer2_bbox", "answer3_bbox", "answer4_bbox"]
+        )
         # Button coord tuples (frame percent converted upstream)
         buttons = self.frame_data["buttons"]
         ans_buttons = [buttons["answer1"], buttons["answer2"], buttons["answer3"], buttons["answer4"]]
@@ -128,15 +109,17 @@ class ComputeEngineAutomator(BaseAutomator):
         ans_buttons = [(int(x), int(y)) for (x, y, *_) in ans_buttons]
 
         while self.should_continue:
-            # Batch capture all answer/equation regions in one grab
+            # Planned capture of the answer/equation regions (shared grabs where it pays off)
             if not self.should_continue:
                 break
-            batch = self._capture_and_crop_batch({"equation": equation_bbox, **answer_bboxes})
+            batch = regions_capture.capture()
             if not self.should_continue:
                 break
-            eq_img = self._vector_preprocess(batch["equation"]) if self.should_continue else None
+            eq_img = self._vector_preprocess(batch["equation_bbox"]) if self.should_continue else None
             ans_imgs = (
-                [self._vector_preprocess(batch[f"answer{i}"]) for i in range(1, 5)] if self.should_continue else []
+                [self._vector_preprocess(batch[f"answer{i}_bbox"]) for i in range(1, 5)]
+                if self.should_continue
+                else []
             )
             if not self.should_continue:
                 break
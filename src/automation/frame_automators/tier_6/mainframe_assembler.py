@@ -6,10 +6,11 @@ Handles automation for the Mainframe Assembler frame in WidgetInc.
 import numpy as np
 import pyautogui
 
-from PIL import ImageGrab
 from typing import Any, Dict
 
 from automation.base_automator import BaseAutomator
+from capture.backends import get_capture_backend
+from capture.change_detector import ChangeDetector
 
 
 class MainframeAssemblerAutomator(BaseAutomator):
@@ -29,10 +30,14 @@ class MainframeAssemblerAutomator(BaseAutomator):
         self.logger.info(f"SPEED DEMON MODE: Monitoring Y={intercept_y}")
         detections = 0
 
+        backend = get_capture_backend()
+        changes = ChangeDetector(tile=8)
         while self.should_continue:
             # Single line capture
-            screenshot = ImageGrab.grab(bbox=(x1, intercept_y - 2, x2, intercept_y), all_screens=True)
-            line = np.array(screenshot)[0]  # First (and only) row
+            strip = backend.grab((x1, intercept_y - 2, x2, intercept_y))
+            if not changes.update(strip):
+                continue  # Nothing moved on the intercept line
+            line = strip[0]  # First row
             # Vectorized detection
             valid = line[:, 1] > np.maximum(line[:, 0], line[:, 2])
             if np.any(valid):
@@ -20,6 +20,7 @@ class CloudDigitizerAutomator(BaseAutomator):
         while self.should_continue:
             # 1) Scan all keys (assumed (x, y)) and record red > 125
             to_click: list[tuple[int, int]] = []
+            self.refresh_snapshot()
             for key in interactions:
                 x, y = interactions[key]
                 r, g, b = self.pixel(x, y)
@@ -5,6 +5,7 @@ Handles automation for the Fuel Rod Assembler frame in WidgetInc.
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import differs_from
 
 
 class FuelRodAssemblerAutomator(BaseAutomator):
@@ -26,6 +27,7 @@ class FuelRodAssemblerAutomator(BaseAutomator):
         print(f"Pickup bbox Y: {y}")
 
         background_colors = self.frame_data["colors"]["background_colors"]
+        is_rod = differs_from(background_colors)
 
         # Main automation loop
         while self.should_continue:
@@ -33,17 +35,15 @@ class FuelRodAssemblerAutomator(BaseAutomator):
             self.moveTo(lever_down[0], lever_down[1], duration=0.2)
             self.mouseUp()
             self.sleep(1.5)
-            for x in range(x1, x2 + 1, 5):
-                color = self.pixel(x, int(y))
-                if self.should_continue and color not in background_colors:
-                    self.mouseDown(x + 20, y)
-                    self.moveTo(pickup_point[0], pickup_point[1], duration=0.5)
-                    self.moveTo(drop_point[0], drop_point[1], duration=1.5)
-
-                    self.sleep(1)
-                    self.mouseUp()
-                    self.sleep(0.5)
-                    break
+            rod = self.scan.scan_line((x1, int(y)), (x2, int(y)), is_rod, step=5)
+            if self.should_continue and rod is not None:
+                self.mouseDown(rod.x + 20, y)
+                self.moveTo(pickup_point[0], pickup_point[1], duration=0.5)
+                self.moveTo(drop_point[0], drop_point[1], duration=1.5)
+
+                self.sleep(1)
+                self.mouseUp()
+                self.sleep(0.5)
 
             for _ in range(4):
                 refine.click()
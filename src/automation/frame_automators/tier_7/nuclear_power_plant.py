@@ -5,6 +5,7 @@ Handles automation for the Nuclear Power Plant frame in WidgetInc.
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from automation.scan_engine import ColorDiffers, match_colors
 
 
 class NuclearPowerPlantAutomator(BaseAutomator):
@@ -29,31 +30,28 @@ class NuclearPowerPlantAutomator(BaseAutomator):
 
         pbar = self.frame_data["interactions"]["pbar"]
         pbar_color = self.frame_data["colors"]["pbar_color"]
+        pbar_done = ColorDiffers(pbar, pbar_color)
 
         y_values = [y1, y2, y3]
 
-        x_range = range(int(x1), int(x2) + 1, 5)
+        is_indicator = match_colors(indicator)
         sliders = {"slider_1": slider_1, "slider_2": slider_2, "slider_3": slider_3}
         # Main automation loop
         while self.should_continue:
             for i, y in enumerate(y_values):
                 slider = sliders[f"slider_{i + 1}"]
-                for x in x_range:
-                    color = self.pixel(x, int(y))
-                    if color == indicator:
-                        self.mouseDown(slider[0], slider[1])
-                        self.moveTo(x + 5, int(y), duration=0.1)
-                        self.mouseUp()
-                        sliders[f"slider_{i + 1}"] = (x, slider[1])
-                        self.sleep(0.1)
-                        break
+                # One strip capture per row instead of a pixel read every 5px
+                found = self.scan.scan_line((int(x1), int(y)), (int(x2), int(y)), is_indicator, step=5)
+                if found is not None:
+                    self.mouseDown(slider[0], slider[1])
+                    self.moveTo(found.x + 5, int(y), duration=0.1)
+                    self.mouseUp()
+                    sliders[f"slider_{i + 1}"] = (found.x, slider[1])
+                    self.sleep(0.1)
             start.click()
             self.sleep(1)
-            while self.should_continue:
-                if self.pixel(pbar[0], pbar[1]) == pbar_color:
-                    self.sleep(0.1)
-                else:
-                    break
+            # Progress bar run time is learned per cycle, so polling tightens only near its end
+            self.scan.wait_for_any([pbar_done], timeout=None, check_interval=0.1, learn="pbar")
 
             if not self.sleep(0.5):
                 break
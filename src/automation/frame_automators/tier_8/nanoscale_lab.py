@@ -9,7 +9,6 @@ import numpy as np
 
 from typing import Any, Dict, Tuple
 from automation.base_automator import BaseAutomator
-from utility.window_utils import get_frame_screenshot
 from utility.coordinate_utils import conv_frame_coords_to_screen_coords, conv_screen_coords_to_frame_coords
 
 
@@ -26,7 +25,7 @@ class NanoscaleLabAutomator(BaseAutomator):
 
         for position in self.slider_start_positions:
             x, y = position
-            color = pyautogui.pixel(x, y)
+            color = self.pixel(x, y)
 
             if color in self.slider_colors:
                 print(f"Found slider at position: {position} with color: {color}")
@@ -45,8 +44,8 @@ class NanoscaleLabAutomator(BaseAutomator):
         mouse_frame_xy = conv_screen_coords_to_frame_coords(mouse_screen_x, mouse_screen_y)
 
         search_radius = 100
-        screenshot = get_frame_screenshot()
-        if screenshot is None:
+        frame = self.capture_frame()
+        if frame is None:
             return None
 
         mx, my = mouse_frame_xy
@@ -54,9 +53,7 @@ class NanoscaleLabAutomator(BaseAutomator):
         fy1 = max(0, int(my - search_radius))
         fx2 = int(mx + search_radius)
         fy2 = int(my + search_radius)
-        cropped = screenshot.crop((fx1, fy1, fx2, fy2))
-        arr = np.array(cropped)
-        arr = arr[..., :3]
+        arr = frame.array[fy1:fy2, fx1:fx2]
 
         # Build mask for all target colors (no tolerance)
         mask = np.zeros(arr.shape[:2], dtype=bool)
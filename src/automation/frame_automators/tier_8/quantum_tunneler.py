@@ -46,6 +46,7 @@ class QuantumTunnelerAutomator(BaseAutomator):
 
         # Main automation loop
         while self.should_continue:
+            self.refresh_snapshot()
             for source in source_shapes.values():
                 for target in target_shapes.values():
                     if self.should_continue and self.pixel(source["location"][0], source["location"][1]) == self.pixel(
@@ -55,5 +56,6 @@ class QuantumTunnelerAutomator(BaseAutomator):
                         self.moveTo(*target["dot"])
                         self.mouseUp()
                         self.sleep(0.1)
+                        self.refresh_snapshot()
             if not self.sleep(2.5):
                 break
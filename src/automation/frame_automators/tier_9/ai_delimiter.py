@@ -10,8 +10,8 @@ import math
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
+from capture.capture_planner import CapturePlanner
 from utility.coordinate_utils import conv_frame_coords_to_screen_coords
-from utility.window_utils import get_frame_screenshot
 
 
 class AiDelimiterAutomator(BaseAutomator):
@@ -24,6 +24,8 @@ class AiDelimiterAutomator(BaseAutomator):
         self._ball_colors_packed = np.array([(c[0] << 16) | (c[1] << 8) | c[2] for c in colors], dtype=np.uint32)
         self._last_ball_frame_xy = None
         self._misses = 0
+        # Grab only the watch box instead of the whole frame
+        self.watch_capture = CapturePlanner.from_frame_data(frame_data, ["watch_bbox"])
 
     def _update_velocity(self, new_pos, now):
         """
@@ -97,17 +99,13 @@ class AiDelimiterAutomator(BaseAutomator):
     def find_ball_fast(self, watch_box, search_radius=40, max_misses_before_full=5, return_frame=True):
         """
         Fast ball tracker:
-        - Crops only watch_box once
+        - Captures only the watch box (screen grab of the same region)
         - If we have last position, restrict search to a local ROI
         - Falls back to full watch_box after several misses
         - Returns screen coordinates of any detected ball pixel or None
         """
         x1, y1, x2, y2 = watch_box
-        screenshot = get_frame_screenshot()
-        if screenshot is None:
-            return None
-        cropped = screenshot.crop((x1, y1, x2, y2)).convert("RGB")
-        arr = np.array(cropped, dtype=np.uint8)
+        arr = self.watch_capture.capture()["watch_bbox"]
 
         h, w, _ = arr.shape
 
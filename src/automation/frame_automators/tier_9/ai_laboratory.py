@@ -8,7 +8,6 @@ import numpy as np
 
 from typing import Any, Dict
 from automation.base_automator import BaseAutomator
-from utility.window_utils import get_frame_screenshot
 from utility.coordinate_utils import conv_frame_coords_to_screen_coords
 
 
@@ -23,11 +22,11 @@ class AiLaboratoryAutomator(BaseAutomator):
         Finds all white blobs (255,255,255) and (219,219,219) in a sea of black within the canvas bbox.
         Returns a list of (frame_x, frame_y) center points for each blob, sorted top-to-bottom.
         """
-        screenshot = get_frame_screenshot()
-        if screenshot is None:
+        frame = self.capture_frame()
+        if frame is None:
             return []
-        cropped = screenshot.crop(self.canvas)
-        arr = np.array(cropped)[..., :3]
+        cx1, cy1, cx2, cy2 = self.canvas
+        arr = frame.array[cy1:cy2, cx1:cx2]
         # Mask for white pixels (255,255,255) or (219,219,219)
         mask = np.all(arr == [255, 255, 255], axis=-1) | np.all(arr == [219, 219, 219], axis=-1)
         # Label blobs (4-connectivity)
@@ -0,0 +1,141 @@
+"""
+Poll Timing
+Learned time-to-change per wait condition and the adaptive poll intervals derived from it.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+POLL_TIMINGS_FILE = Path(__file__).parent.parent.parent / "config" / "cache" / "poll_timings.cache"
+
+
+class AdaptivePoller:
+    """
+    Poll intervals for one wait, shaped around when the change is expected.
+
+    Before the expected window the poller sleeps coarsely (up to coarse_interval) until the
+    window opens; inside it polls every min_interval; past it (or with no history) the interval
+    grows with the time already waited, up to max_interval.
+    """
+
+    def __init__(
+        self,
+        expected: Optional[float] = None,
+        spread: float = 0.0,
+        min_interval: float = 0.025,
+        max_interval: float = 0.25,
+        coarse_interval: float = 1.0,
+        backoff: float = 0.25,
+    ):
+        """
+        Args:
+            expected: Expected seconds until the change (None = no history)
+            spread: Half-width of the window around expected in seconds
+            min_interval: Poll interval inside the expected window
+            max_interval: Largest interval while backing off
+            coarse_interval: Largest single sleep before the window opens
+            backoff: Interval growth per second waited outside the window
+        """
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.coarse_interval = coarse_interval
+        self.backoff = backoff
+        if expected is None:
+            self.window_start = 0.0
+            self.window_end = 0.0
+        else:
+            self.window_start = max(0.0, expected - spread)
+            self.window_end = expected + spread
+
+    def next_interval(self, elapsed: float) -> float:
+        """Seconds to sleep before the next poll, given the seconds waited so far."""
+        if elapsed < self.window_start:
+            return max(self.min_interval, min(self.coarse_interval, self.window_start - elapsed))
+        if elapsed <= self.window_end:
+            return self.min_interval
+        overdue = elapsed - self.window_end
+        return min(self.max_interval, self.min_interval + overdue * self.backoff)
+
+
+class PollTimings:
+    """
+    Exponentially weighted time-to-change per condition key for one frame.
+
+    Timings persist in config/cache/poll_timings.cache keyed by frame ID, so a frame's waits
+    start from what previous runs learned.
+    """
+
+    def __init__(self, frame_id: str, path: Union[str, Path] = POLL_TIMINGS_FILE, alpha: float = 0.3):
+        """
+        Args:
+            frame_id: Frame ID the timings belong to
+            path: Timings cache file shared by all frames
+            alpha: Weight of the newest sample in the moving average
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.frame_id = frame_id
+        self.path = Path(path)
+        self.alpha = alpha
+        self.timings: Dict[str, Dict[str, float]] = self._load_all().get(frame_id, {})
+        self._dirty = False
+
+    def _load_all(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            self.logger.warning(f"Could not load poll timings from {self.path}: {e}")
+            return {}
+
+    # ==============================
+    # Learning
+    # ==============================
+
+    def record(self, key: str, seconds: float):
+        """Add an observed time-to-change for a condition key."""
+        timing = self.timings.get(key)
+        if timing is None:
+            # Start with a wide spread until a few cycles have been seen
+            self.timings[key] = {"mean": seconds, "var": (0.25 * seconds) ** 2, "count": 1}
+        else:
+            delta = seconds - timing["mean"]
+            timing["mean"] += self.alpha * delta
+            timing["var"] = (1 - self.alpha) * (timing["var"] + self.alpha * delta * delta)
+            timing["count"] += 1
+        self._dirty = True
+
+    def expected(self, key: str) -> Optional[float]:
+        """Learned mean seconds until the change, or None without history."""
+        timing = self.timings.get(key)
+        return timing["mean"] if timing else None
+
+    def poller(self, key: str, min_interval: float = 0.025, max_interval: float = 0.25) -> AdaptivePoller:
+        """AdaptivePoller centred on the learned time for key (plain backoff without history)."""
+        timing = self.timings.get(key)
+        if timing is None:
+            return AdaptivePoller(None, min_interval=min_interval, max_interval=max_interval)
+        spread = max(2 * math.sqrt(timing["var"]), 0.1 * timing["mean"], 2 * min_interval)
+        return AdaptivePoller(timing["mean"], spread, min_interval=min_interval, max_interval=max_interval)
+
+    # ==============================
+    # Persistence
+    # ==============================
+
+    def save(self):
+        """Write this frame's timings back to the cache file (other frames are kept)."""
+        if not self._dirty:
+            return
+        try:
+            all_timings = self._load_all()
+            all_timings[self.frame_id] = self.timings
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(all_timings, indent=2), encoding="utf-8")
+            temp_path.replace(self.path)
+            self._dirty = False
+        except Exception as e:
+            self.logger.warning(f"Could not save poll timings to {self.path}: {e}")
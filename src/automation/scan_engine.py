@@ -4,16 +4,409 @@ Handles color detection and scanning operations for automation.
 """
 
 import logging
+import threading
 import time
-import pyautogui
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from capture.backends import BBox, CaptureBackend
+from capture.capture_planner import bbox_union
+from capture.capture_scheduler import get_capture_scheduler
+from capture.color_palette import ColorPalette, get_button_palette, pack_rgb_array
+from capture.frame_ring import CapturedFrame, FrameRingBuffer
+
+from .poll_timing import PollTimings
+
+
+def _as_color_array(colors) -> np.ndarray:
+    """One (r, g, b) color or a list of colors -> (K, 3) int16 array."""
+    array = np.asarray(colors, dtype=np.int16)
+    return array.reshape(-1, array.shape[-1])[:, :3]
+
+
+def _frame_region(frame: CapturedFrame, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
+    """Slice a screen-coordinate region out of a captured frame."""
+    fx1, fy1, fx2, fy2 = frame.bbox
+    if x1 < fx1 or y1 < fy1 or x2 > fx2 or y2 > fy2:
+        raise ValueError(f"Region ({x1}, {y1}, {x2}, {y2}) outside captured bbox {frame.bbox}")
+    return frame.array[y1 - fy1 : y2 - fy1, x1 - fx1 : x2 - fx1]
+
+
+def _covers(outer: BBox, inner: BBox) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] >= inner[2] and outer[3] >= inner[3]
+
+
+# ==============================
+# Scan Conditions
+# ==============================
+
+
+class ScanCondition(ABC):
+    """
+    A predicate evaluated against one captured frame.
+
+    region is the screen bbox the condition reads; waits capture only the union of their
+    conditions' regions. None means the condition needs the whole frame area.
+    """
+
+    region: Optional[BBox] = None
+
+    @abstractmethod
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        """True if the condition holds in frame."""
+
+
+class ColorMatch(ScanCondition):
+    """Fires when the pixel at a screen point matches any of the given colors."""
+
+    def __init__(self, point: Sequence[int], colors, tolerance: int = 0):
+        """
+        Args:
+            point: (x, y) screen coordinates
+            colors: One (r, g, b) color or a list of colors
+            tolerance: Maximum per-channel difference (0 = exact, like pixel() == color)
+        """
+        self.x, self.y = int(point[0]), int(point[1])
+        self.region = (self.x, self.y, self.x + 1, self.y + 1)
+        self.colors = _as_color_array(colors)
+        self.tolerance = tolerance
+
+    def matches(self, frame: CapturedFrame) -> bool:
+        pixel = _frame_region(frame, self.x, self.y, self.x + 1, self.y + 1)[0, 0].astype(np.int16)
+        return bool((np.abs(self.colors - pixel).max(axis=1) <= self.tolerance).any())
+
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        return self.matches(frame)
+
+
+class ColorDiffers(ColorMatch):
+    """Fires when the pixel at a screen point matches none of the given colors."""
+
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        return not self.matches(frame)
+
+
+class RegionFill(ScanCondition):
+    """Fires when at least threshold percent of a screen bbox matches any of the given colors."""
+
+    def __init__(self, bbox: Sequence[int], colors, threshold: float = 100.0, tolerance: int = 0):
+        """
+        Args:
+            bbox: (x1, y1, x2, y2) screen coordinates
+            colors: One (r, g, b) color or a list of colors
+            threshold: Percent of matching pixels needed to fire
+            tolerance: Maximum per-channel difference
+        """
+        self.bbox = tuple(int(v) for v in bbox)
+        self.region = self.bbox
+        self.colors = _as_color_array(colors)
+        self.threshold = threshold
+        self.tolerance = tolerance
+
+    def fill(self, frame: CapturedFrame) -> float:
+        """Percent of the region matching the colors."""
+        region = _frame_region(frame, *self.bbox).astype(np.int16)
+        if not region.size:
+            return 0.0
+        diff = np.abs(region[:, :, None, :] - self.colors[None, None, :, :]).max(axis=3)
+        return float((diff <= self.tolerance).any(axis=2).mean() * 100)
+
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        return self.fill(frame) >= self.threshold
+
+
+class ButtonActive(ScanCondition):
+    """Fires when a button shows its default or focus color."""
+
+    def __init__(self, button_data: list, palette: Optional[ColorPalette] = None):
+        self.x, self.y, self.color = button_data
+        self.region = (self.x, self.y, self.x + 1, self.y + 1)
+        self.palette = palette or get_button_palette()
+
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        pixel = _frame_region(frame, self.x, self.y, self.x + 1, self.y + 1)[0, 0]
+        return self.palette.is_active(pixel.tolist(), self.color)
+
+
+class ButtonInactive(ButtonActive):
+    """Fires when a button shows its inactive color."""
+
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        pixel = _frame_region(frame, self.x, self.y, self.x + 1, self.y + 1)[0, 0]
+        return self.palette.is_inactive(pixel.tolist(), self.color)
+
+
+class FramePredicate(ScanCondition):
+    """Fires when a custom function of the captured frame returns True."""
+
+    def __init__(self, func: Callable[[CapturedFrame], bool]):
+        self.func = func
+
+    def evaluate(self, frame: CapturedFrame) -> bool:
+        return bool(self.func(frame))
+
+
+Conditions = Union[Sequence[ScanCondition], Dict[Hashable, ScanCondition]]
+
+
+# ==============================
+# Line Scan Predicates
+# ==============================
+
+PixelPredicate = Callable[[np.ndarray], np.ndarray]
+
+
+def match_colors(colors, tolerance: int = 0) -> PixelPredicate:
+    """Predicate for scan_line: pixels matching any of the colors (one color, list or set)."""
+    color_array = _as_color_array(list(colors) if isinstance(colors, (set, frozenset)) else colors)
+    if tolerance == 0:
+        # Exact matches against any number of colors with one packed 24-bit lookup
+        keys = np.unique(pack_rgb_array(color_array.astype(np.uint8)))
+        return lambda pixels: np.isin(pack_rgb_array(pixels), keys)
+
+    def predicate(pixels: np.ndarray) -> np.ndarray:
+        diff = np.abs(pixels[:, None, :3].astype(np.int16) - color_array[None, :, :]).max(axis=2)
+        return (diff <= tolerance).any(axis=1)
+
+    return predicate
+
+
+def differs_from(colors, tolerance: int = 0) -> PixelPredicate:
+    """Predicate for scan_line: pixels matching none of the colors."""
+    matches = match_colors(colors, tolerance)
+    return lambda pixels: ~matches(pixels)
+
+
+class LineMatch:
+    """First pixel on a scanned line that satisfied the predicate."""
+
+    __slots__ = ("x", "y", "frame_xy", "color", "index")
+
+    def __init__(self, x: int, y: int, frame_xy: Optional[Tuple[int, int]], color: Tuple[int, int, int], index: int):
+        self.x = x
+        self.y = y
+        self.frame_xy = frame_xy
+        self.color = color
+        self.index = index
+
+    @property
+    def screen_xy(self) -> Tuple[int, int]:
+        return (self.x, self.y)
+
+    def __repr__(self) -> str:
+        return f"LineMatch(x={self.x}, y={self.y}, frame_xy={self.frame_xy}, color={self.color})"
 
 
 class ScanEngine:
     """Provides color detection and scanning capabilities for automation."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        capture: Optional[Callable[[], Optional[CapturedFrame]]] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+        timings: Optional[PollTimings] = None,
+        frame_bbox: Optional[Callable[[], Optional[BBox]]] = None,
+        backend: Optional[CaptureBackend] = None,
+    ):
+        """
+        Args:
+            capture: Returns a fresh frame area CapturedFrame (default: the shared capture scheduler),
+                used by waits with a condition that needs the whole frame
+            should_continue: Polled between ticks; waits end early once it returns False
+            timings: Learned per-frame wait timings used by waits with a learn key
+            frame_bbox: Returns the frame area's screen bbox, for frame coordinates of line matches
+            backend: Capture backend for region waits and line scans (default: the process-wide backend)
+        """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.tolerance = 5  # Default color tolerance
+        self.capture = capture or (lambda: get_capture_scheduler().get_frame())
+        self.should_continue = should_continue or (lambda: True)
+        self.timings = timings
+        self.frame_bbox = frame_bbox
+        self._line_ring = FrameRingBuffer(slots=2, backend=backend)
+        self._wait_ring = FrameRingBuffer(slots=2, backend=backend)
+
+    # ==============================
+    # Multiplexed Waits
+    # ==============================
+
+    def wait_for(
+        self,
+        conditions: Conditions,
+        require_all: bool = False,
+        timeout: Optional[float] = 30.0,
+        check_interval: float = 0.05,
+        stop_event: Optional[threading.Event] = None,
+        learn: Optional[str] = None,
+    ) -> List[Hashable]:
+        """
+        Evaluate every condition against one capture per tick until any (or all) fire.
+
+        Each tick grabs only the union bbox of the conditions' regions (a single pixel for a
+        ColorMatch), or the whole frame area if any condition has no region. A condition whose
+        region is not covered by the capture does not fire. Capture failures count as a tick
+        without a frame.
+
+        Ticks run on a fixed schedule, so wake-up latency is at most check_interval regardless
+        of how long a capture took. With a learn key (and timings) the schedule is adaptive
+        instead: coarse sleeps until shortly before the learned time-to-change, tight polling
+        around it, backoff after it; the observed time is then folded into the timings.
+
+        Args:
+            conditions: List of conditions (keyed by index) or dict of named conditions
+            require_all: Wait until every condition fires in the same capture
+            timeout: Maximum time to wait in seconds (None = until stopped)
+            check_interval: Seconds between captures
+            stop_event: Optional event that ends the wait when set
+            learn: Key this wait's time-to-change is learned under (e.g. "pbar")
+
+        Returns:
+            Keys of the conditions that fired in the final capture; empty on timeout or stop
+        """
+        items = list(conditions.items() if isinstance(conditions, Mapping) else enumerate(conditions))
+        if not items:
+            return []
+
+        poller = None
+        if learn is not None and self.timings is not None:
+            poller = self.timings.poller(learn, max_interval=max(check_interval, 0.25))
+
+        regions = [condition.region for _, condition in items]
+        union = None
+        if all(region is not None for region in regions):
+            union = regions[0]
+            for region in regions[1:]:
+                union = bbox_union(union, region)
+
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        next_tick = start
+        while self.should_continue() and not (stop_event is not None and stop_event.is_set()):
+            frame = self._capture_for_wait(union)
+            if frame is not None:
+                fired = [
+                    key
+                    for key, condition in items
+                    if (condition.region is None or _covers(frame.bbox, condition.region)) and condition.evaluate(frame)
+                ]
+                if fired and (not require_all or len(fired) == len(items)):
+                    if poller is not None:
+                        self.timings.record(learn, max(0.0, frame.timestamp - start))
+                    return fired
+
+            now = time.monotonic()
+            if poller is not None:
+                next_tick = now + poller.next_interval(now - start)
+            else:
+                next_tick += check_interval
+            if deadline is not None and now >= deadline:
+                self.logger.debug(f"Wait timed out after {timeout}s")
+                return []
+            if next_tick < now:
+                # Capture overran the interval - realign instead of bursting to catch up
+                next_tick = now
+            wake_time = min(next_tick, deadline) if deadline is not None else next_tick
+            if not self._sleep_until(wake_time, stop_event):
+                return []
+        return []
+
+    def _capture_for_wait(self, region: Optional[BBox]) -> Optional[CapturedFrame]:
+        """Capture region (None = the whole frame area); None if the capture failed."""
+        try:
+            if region is None:
+                return self.capture()
+            return self._wait_ring.capture(region)
+        except Exception as e:
+            self.logger.debug(f"Capture for wait failed: {e}")
+            return None
+
+    def wait_for_any(self, conditions: Conditions, timeout: Optional[float] = 30.0, **kwargs) -> List[Hashable]:
+        """Wait until at least one condition fires. See wait_for()."""
+        return self.wait_for(conditions, require_all=False, timeout=timeout, **kwargs)
+
+    def wait_for_all(self, conditions: Conditions, timeout: Optional[float] = 30.0, **kwargs) -> bool:
+        """Wait until every condition fires in the same capture. See wait_for()."""
+        return bool(self.wait_for(conditions, require_all=True, timeout=timeout, **kwargs))
+
+    def _sleep_until(self, wake_time: float, stop_event: Optional[threading.Event]) -> bool:
+        """Sleep until wake_time in short slices; False if stopped meanwhile."""
+        while True:
+            remaining = wake_time - time.monotonic()
+            if remaining <= 0:
+                return True
+            if stop_event is not None:
+                if stop_event.wait(min(remaining, 0.01)):
+                    return False
+            else:
+                time.sleep(min(remaining, 0.01))
+            if not self.should_continue():
+                return False
+
+    # ==============================
+    # Line Scans
+    # ==============================
+
+    def scan_line(
+        self,
+        start: Sequence[int],
+        end: Sequence[int],
+        predicate: PixelPredicate,
+        step: int = 1,
+        direction: int = 1,
+        frame: Optional[CapturedFrame] = None,
+    ) -> Optional[LineMatch]:
+        """
+        Find the first pixel on a horizontal or vertical line that satisfies predicate.
+
+        The 1-px strip from start to end (inclusive) is captured once, sampled every step pixels
+        and tested with one vectorized predicate call.
+
+        Args:
+            start, end: (x, y) screen coordinates sharing an x or a y
+            predicate: (N, 3) uint8 pixels -> (N,) bool mask, e.g. match_colors() or differs_from()
+            step: Pixels between samples
+            direction: 1 scans from start towards end, -1 from end towards start
+            frame: Read the strip from this capture instead of grabbing it
+
+        Returns:
+            LineMatch with screen and frame coordinates, or None if no sampled pixel matched
+        """
+        (sx, sy), (ex, ey) = (int(start[0]), int(start[1])), (int(end[0]), int(end[1]))
+        if sx != ex and sy != ey:
+            raise ValueError(f"scan_line needs a horizontal or vertical line, got {start} -> {end}")
+        if direction < 0:
+            (sx, sy), (ex, ey) = (ex, ey), (sx, sy)
+
+        strip_bbox = (min(sx, ex), min(sy, ey), max(sx, ex) + 1, max(sy, ey) + 1)
+        if frame is None:
+            frame = self._line_ring.capture(strip_bbox)
+            if frame is None:
+                return None
+        strip = _frame_region(frame, *strip_bbox).reshape(-1, frame.array.shape[2])
+
+        # Offsets along the strip in scan order
+        length = len(strip)
+        offsets = np.arange(0, length, max(1, step))
+        if (ex - sx) + (ey - sy) < 0:
+            offsets = length - 1 - offsets
+        hits = np.flatnonzero(predicate(strip[offsets]))
+        if not len(hits):
+            return None
+
+        offset = int(offsets[hits[0]])
+        x, y = (strip_bbox[0] + offset, sy) if sy == ey else (sx, strip_bbox[1] + offset)
+        frame_xy = None
+        frame_area = self.frame_bbox() if self.frame_bbox is not None else None
+        if frame_area is not None:
+            frame_xy = (x - frame_area[0], y - frame_area[1])
+        r, g, b = strip[offset][:3].tolist()
+        return LineMatch(x, y, frame_xy, (r, g, b), int(hits[0]))
+
+    # ==============================
+    # Single-Pixel Waits
+    # ==============================
 
     def pixel_watcher(
         self, coords: tuple, expected_color: tuple, timeout: float = 30.0, check_interval: float = 0.1
@@ -31,21 +424,12 @@ class ScanEngine:
             True if pixel changed, False if timeout reached
         """
         x, y = coords
-        start_time = time.time()
-
         self.logger.debug(f"Watching pixel at ({x}, {y}) for change from {expected_color}")
 
-        while time.time() - start_time < timeout:
-            current_color = pyautogui.pixel(x, y)
-
-            # Check if color has changed beyond tolerance
-            color_changed = any(abs(current_color[i] - expected_color[i]) > self.tolerance for i in range(3))
-
-            if color_changed:
-                self.logger.debug(f"Pixel at ({x}, {y}) changed from {expected_color} to {current_color}")
-                return True
-
-            time.sleep(check_interval)
+        changed = ColorDiffers(coords, expected_color, self.tolerance)
+        if self.wait_for_any([changed], timeout, check_interval=check_interval):
+            self.logger.debug(f"Pixel at ({x}, {y}) changed from {expected_color}")
+            return True
 
         self.logger.warning(f"Pixel watcher timed out after {timeout}s - no change detected")
         return False
@@ -66,21 +450,12 @@ class ScanEngine:
             True if target color found, False if timeout reached
         """
         x, y = coords
-        start_time = time.time()
-
         self.logger.debug(f"Waiting for pixel at ({x}, {y}) to become {target_color}")
 
-        while time.time() - start_time < timeout:
-            current_color = pyautogui.pixel(x, y)
-
-            # Check if color matches target within tolerance
-            color_match = all(abs(current_color[i] - target_color[i]) <= self.tolerance for i in range(3))
-
-            if color_match:
-                self.logger.debug(f"Pixel at ({x}, {y}) reached target color {target_color}")
-                return True
-
-            time.sleep(check_interval)
+        reached = ColorMatch(coords, target_color, self.tolerance)
+        if self.wait_for_any([reached], timeout, check_interval=check_interval):
+            self.logger.debug(f"Pixel at ({x}, {y}) reached target color {target_color}")
+            return True
 
         self.logger.warning(f"Color wait timed out after {timeout}s - target color {target_color} not found")
         return False
@@ -0,0 +1,50 @@
+"""
+Screen capture package for Widget Automation Tool.
+
+Contains capture primitives shared by automators and frame detection
+so a single screen read can answer many pixel probes.
+"""
+
+from .backends import (
+    CaptureBackend,
+    ImageGrabBackend,
+    MssBackend,
+    ReplayBackend,
+    XlibBackend,
+    create_backend,
+    get_capture_backend,
+    set_capture_backend,
+)
+from .capture_planner import CapturePlanner
+from .capture_scheduler import CaptureScheduler, CaptureSubscription, get_capture_scheduler
+from .change_detector import ChangeDetector
+from .color_palette import ColorPalette, get_button_palette
+from .frame_recorder import FrameRecorder, FrameRecording, RecordingBackend
+from .frame_ring import CapturedFrame, FrameRingBuffer, get_frame_recorder, set_frame_recorder
+from .frame_snapshot import FrameSnapshot
+
+__all__ = [
+    "CaptureBackend",
+    "CapturePlanner",
+    "CaptureScheduler",
+    "CaptureSubscription",
+    "CapturedFrame",
+    "ChangeDetector",
+    "ColorPalette",
+    "FrameRecorder",
+    "FrameRecording",
+    "FrameRingBuffer",
+    "FrameSnapshot",
+    "ImageGrabBackend",
+    "MssBackend",
+    "RecordingBackend",
+    "ReplayBackend",
+    "XlibBackend",
+    "create_backend",
+    "get_button_palette",
+    "get_capture_backend",
+    "get_capture_scheduler",
+    "get_frame_recorder",
+    "set_capture_backend",
+    "set_frame_recorder",
+]
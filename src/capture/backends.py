@@ -0,0 +1,284 @@
+"""
+Capture Backends
+Interchangeable screen grabbers behind one interface, selectable per machine.
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image, ImageGrab
+
+BBox = Tuple[int, int, int, int]
+
+
+class CaptureBackend(ABC):
+    """
+    Interface every screen grabber implements.
+
+    grab() returns an HxWx3 uint8 RGB array for a screen bbox (x1, y1, x2, y2) with exclusive
+    right/bottom edges. grab_into() writes the same pixels into a caller-owned array.
+    pixel() returns a single RGB tuple and defaults to a 1x1 grab.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @abstractmethod
+    def grab(self, bbox: BBox) -> np.ndarray:
+        """Capture a screen bbox as an HxWx3 uint8 RGB array."""
+
+    def grab_into(self, bbox: BBox, out: np.ndarray) -> np.ndarray:
+        """Capture a screen bbox into a preallocated HxWx3 uint8 array and return it."""
+        np.copyto(out, self.grab(bbox))
+        return out
+
+    def grab_image(self, bbox: BBox) -> Image.Image:
+        """Capture a screen bbox as an RGB PIL image."""
+        return Image.fromarray(self.grab(bbox))
+
+    def pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        """Get the RGB color at screen (x, y)."""
+        r, g, b = self.grab((int(x), int(y), int(x) + 1, int(y) + 1))[0, 0].tolist()
+        return (r, g, b)
+
+    def close(self):
+        """Release any native handles held by the backend."""
+
+
+# ==============================
+# Live Backends
+# ==============================
+
+
+class ImageGrabBackend(CaptureBackend):
+    """PIL ImageGrab with pyautogui pixel reads - the original capture path."""
+
+    name = "imagegrab"
+
+    def grab(self, bbox: BBox) -> np.ndarray:
+        # all_screens=True ensures correct multi-monitor capture
+        image = ImageGrab.grab(bbox=tuple(bbox), all_screens=True)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return np.asarray(image)
+
+    def pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        import pyautogui
+
+        r, g, b = pyautogui.pixel(x, y)[:3]
+        return (r, g, b)
+
+
+class MssBackend(CaptureBackend):
+    """
+    mss grabber (BitBlt on Windows, XGetImage on Linux) reusing one native handle per thread.
+
+    mss handles are not thread-safe, so each thread lazily gets its own.
+    """
+
+    name = "mss"
+
+    def __init__(self):
+        super().__init__()
+        import mss
+
+        self._mss = mss
+        self._local = threading.local()
+
+    def _handle(self):
+        handle = getattr(self._local, "handle", None)
+        if handle is None:
+            handle = self._mss.mss()
+            self._local.handle = handle
+        return handle
+
+    def _grab_bgra(self, bbox: BBox) -> np.ndarray:
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        shot = self._handle().grab({"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1})
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def grab(self, bbox: BBox) -> np.ndarray:
+        return np.ascontiguousarray(self._grab_bgra(bbox)[:, :, 2::-1])
+
+    def grab_into(self, bbox: BBox, out: np.ndarray) -> np.ndarray:
+        # Swizzle BGRA straight into the caller's buffer, no intermediate RGB array
+        np.copyto(out, self._grab_bgra(bbox)[:, :, 2::-1])
+        return out
+
+    def close(self):
+        handle = getattr(self._local, "handle", None)
+        if handle is not None:
+            handle.close()
+            self._local.handle = None
+
+
+class XlibBackend(CaptureBackend):
+    """X11 root-window grabber for Linux desktops and Xvfb (reads $DISPLAY)."""
+
+    name = "xlib"
+
+    def __init__(self, display: Optional[str] = None):
+        super().__init__()
+        from Xlib import X, display as xdisplay
+
+        self._zpixmap = X.ZPixmap
+        self._display = xdisplay.Display(display)
+        self._root = self._display.screen().root
+        self._lock = threading.Lock()
+
+    def _grab_bgrx(self, bbox: BBox) -> np.ndarray:
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        width, height = x2 - x1, y2 - y1
+        with self._lock:
+            reply = self._root.get_image(x1, y1, width, height, self._zpixmap, 0xFFFFFFFF)
+        # 24/32-bit TrueColor visuals deliver BGRX
+        return np.frombuffer(reply.data, dtype=np.uint8).reshape(height, width, 4)
+
+    def grab(self, bbox: BBox) -> np.ndarray:
+        return np.ascontiguousarray(self._grab_bgrx(bbox)[:, :, 2::-1])
+
+    def grab_into(self, bbox: BBox, out: np.ndarray) -> np.ndarray:
+        np.copyto(out, self._grab_bgrx(bbox)[:, :, 2::-1])
+        return out
+
+    def close(self):
+        self._display.close()
+
+
+# ==============================
+# Offline Backends
+# ==============================
+
+
+class ReplayBackend(CaptureBackend):
+    """
+    Serves grabs from image files or arrays instead of the screen.
+
+    Each frame is treated as a full screen whose top-left is `origin`. advance() moves to the
+    next frame (wrapping when loop=True); with auto_advance every grab() consumes one frame.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        frames: Sequence[Union[str, Path, np.ndarray, Image.Image]],
+        origin: Tuple[int, int] = (0, 0),
+        loop: bool = True,
+        auto_advance: bool = False,
+    ):
+        super().__init__()
+        if not frames:
+            raise ValueError("ReplayBackend needs at least one frame")
+        self.frames: List[np.ndarray] = [self._load(frame) for frame in frames]
+        self.origin = origin
+        self.loop = loop
+        self.auto_advance = auto_advance
+        self.index = 0
+
+    @staticmethod
+    def _load(frame: Union[str, Path, np.ndarray, Image.Image]) -> np.ndarray:
+        if isinstance(frame, np.ndarray):
+            return np.ascontiguousarray(frame[:, :, :3], dtype=np.uint8)
+        if not isinstance(frame, Image.Image):
+            frame = Image.open(frame)
+        return np.asarray(frame.convert("RGB"))
+
+    @property
+    def screen(self) -> np.ndarray:
+        """Current frame as a full-screen RGB array."""
+        return self.frames[self.index]
+
+    def advance(self) -> bool:
+        """Move to the next frame. Returns False once a non-looping replay is exhausted."""
+        if self.index + 1 < len(self.frames):
+            self.index += 1
+            return True
+        if self.loop:
+            self.index = 0
+            return True
+        return False
+
+    def grab(self, bbox: BBox) -> np.ndarray:
+        ox, oy = self.origin
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        screen = self.screen
+        height, width = screen.shape[:2]
+        if x1 < ox or y1 < oy or x2 > ox + width or y2 > oy + height:
+            raise ValueError(f"Bbox {bbox} outside replay screen at {self.origin} size {width}x{height}")
+
+        region = screen[y1 - oy : y2 - oy, x1 - ox : x2 - ox]
+        if self.auto_advance:
+            self.advance()
+        return region
+
+
+# ==============================
+# Registry
+# ==============================
+
+
+def _recording_backend(**kwargs) -> CaptureBackend:
+    # Imported lazily - frame_recorder builds on this module
+    from .frame_recorder import RecordingBackend
+
+    return RecordingBackend(**kwargs)
+
+
+def _synthetic_backend(frame_id: str, width: int = 1080, height: int = 720, **kwargs) -> CaptureBackend:
+    # Imported lazily - synthetic_frame builds on this module
+    from .synthetic_frame import SyntheticCaptureBackend, SyntheticFrame
+
+    return SyntheticCaptureBackend(SyntheticFrame(frame_id, width, height), **kwargs)
+
+
+BACKENDS: Dict[str, Callable[..., CaptureBackend]] = {
+    ImageGrabBackend.name: ImageGrabBackend,
+    MssBackend.name: MssBackend,
+    XlibBackend.name: XlibBackend,
+    ReplayBackend.name: ReplayBackend,
+    "recording": _recording_backend,
+    "synthetic": _synthetic_backend,
+}
+
+# Backends that read from disk/memory instead of the screen
+OFFLINE_BACKENDS = ("replay", "recording", "synthetic")
+
+_active_backend: Optional[CaptureBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name: str, **kwargs) -> CaptureBackend:
+    """Instantiate a registered backend by name (optional dependencies import lazily)."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown capture backend '{name}'. Available: {', '.join(BACKENDS)}")
+    return BACKENDS[name](**kwargs)
+
+
+def get_capture_backend() -> CaptureBackend:
+    """Get the process-wide capture backend (ImageGrab until set_capture_backend is called)."""
+    global _active_backend
+    if _active_backend is None:
+        with _backend_lock:
+            if _active_backend is None:
+                _active_backend = ImageGrabBackend()
+    return _active_backend
+
+
+def set_capture_backend(backend: Union[str, CaptureBackend], **kwargs) -> CaptureBackend:
+    """Replace the process-wide capture backend by instance or registered name."""
+    global _active_backend
+    if isinstance(backend, str):
+        backend = create_backend(backend, **kwargs)
+    with _backend_lock:
+        previous, _active_backend = _active_backend, backend
+    if previous is not None and previous is not backend:
+        previous.close()
+    logging.getLogger(__name__).info(f"Capture backend set to '{backend.name}'")
+    return backend
@@ -0,0 +1,143 @@
+"""
+Capture Benchmark
+Measures grabs/sec and p50/p99 latency per capture backend and region size.
+
+Offline backends (replay, recording, synthetic) are benchmarked too and labelled "offline":
+they time the in-memory read path consumers see in tests and replays, not a screen grab.
+
+Usage (from src/):
+    python -m capture.bench_capture
+    python -m capture.bench_capture --backends imagegrab mss --sizes 1 64 512 --iterations 500
+    python -m capture.bench_capture --backends recording --recording ../recordings/20250101_120000
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from capture.backends import BACKENDS, OFFLINE_BACKENDS, BBox, CaptureBackend, create_backend
+
+DEFAULT_SIZES = (1, 16, 64, 256, 1024)
+
+
+def bench_backend(backend: CaptureBackend, bbox: BBox, iterations: int = 200, warmup: int = 5) -> Dict[str, float]:
+    """
+    Time repeated grabs of one bbox.
+
+    Returns:
+        Dict with grabs_per_sec, p50_ms, p99_ms and mean_ms
+    """
+    for _ in range(warmup):
+        backend.grab(bbox)
+
+    samples = np.empty(iterations, dtype=np.float64)
+    start = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        backend.grab(bbox)
+        samples[i] = time.perf_counter() - t0
+    elapsed = time.perf_counter() - start
+
+    return {
+        "grabs_per_sec": iterations / elapsed if elapsed > 0 else float("inf"),
+        "p50_ms": float(np.percentile(samples, 50) * 1000),
+        "p99_ms": float(np.percentile(samples, 99) * 1000),
+        "mean_ms": float(samples.mean() * 1000),
+    }
+
+
+def offline_backend_kwargs(name: str, extent: Sequence[int], recording: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Arguments for an offline backend whose screen covers extent (width, height) from (0, 0).
+
+    Raises:
+        ValueError: If the recording backend is asked for without a recording directory
+    """
+    width, height = extent
+    if name == "replay":
+        return {"frames": [np.zeros((height, width, 3), dtype=np.uint8)]}
+    if name == "synthetic":
+        return {"frame_id": "1.1", "screen_size": (max(width, 1080), max(height, 720))}
+    if name == "recording":
+        if recording is None:
+            raise ValueError("needs --recording DIR")
+        return {"path": recording, "speed": None, "loop": True}
+    return {}
+
+
+def run_benchmark(
+    backend_names: Sequence[str],
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    origin: Sequence[int] = (0, 0),
+    iterations: int = 200,
+    recording: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Benchmark each backend over square regions of the given sizes; unavailable backends are reported.
+    Rows of offline backends are marked offline=True.
+    """
+    logger = logging.getLogger("bench_capture")
+    results = []
+    ox, oy = origin
+    extent = (ox + max(sizes), oy + max(sizes))
+
+    for name in backend_names:
+        offline = name in OFFLINE_BACKENDS
+        try:
+            kwargs = offline_backend_kwargs(name, extent, recording) if offline else {}
+            backend = create_backend(name, **kwargs)
+        except Exception as e:
+            # Optional dependency missing or no display - report and carry on with the others
+            logger.warning(f"Backend '{name}' unavailable: {e}")
+            results.append({"backend": name, "offline": offline, "size": None, "error": str(e)})
+            continue
+
+        try:
+            for size in sizes:
+                stats = bench_backend(backend, (ox, oy, ox + size, oy + size), iterations)
+                results.append({"backend": name, "offline": offline, "size": size, **stats})
+        except Exception as e:
+            # Backend constructed but cannot grab here (e.g. no display connection)
+            logger.warning(f"Backend '{name}' failed: {e}")
+            results.append({"backend": name, "offline": offline, "size": None, "error": str(e)})
+        finally:
+            backend.close()
+
+    return results
+
+
+def format_results(results: List[Dict]) -> str:
+    """Render benchmark results as a plain-text table."""
+    lines = [f"{'backend':<10} {'source':<8} {'region':>11} {'grabs/s':>10} {'p50 ms':>9} {'p99 ms':>9}"]
+    for row in results:
+        source = "offline" if row.get("offline") else "screen"
+        if row.get("error"):
+            lines.append(f"{row['backend']:<10} {source:<8} unavailable: {row['error']}")
+            continue
+        region = f"{row['size']}x{row['size']}"
+        lines.append(
+            f"{row['backend']:<10} {source:<8} {region:>11} {row['grabs_per_sec']:>10.1f} "
+            f"{row['p50_ms']:>9.3f} {row['p99_ms']:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark screen capture backends")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES), help="Square region edge in px")
+    parser.add_argument("--origin", nargs=2, type=int, default=[0, 0], metavar=("X", "Y"))
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--recording", metavar="DIR", help="Recording directory for the recording backend")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmark(args.backends, args.sizes, args.origin, args.iterations, args.recording)
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
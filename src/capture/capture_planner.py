@@ -0,0 +1,128 @@
+"""
+Capture Planner
+Grabs only the screen regions an automator reads, merging nearby regions into shared grabs.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .backends import BBox, CaptureBackend
+from .frame_ring import FrameRingBuffer
+
+
+def bbox_area(bbox: BBox) -> int:
+    """Pixel area of an (x1, y1, x2, y2) bbox with exclusive right/bottom edges."""
+    x1, y1, x2, y2 = bbox
+    return max(0, x2 - x1) * max(0, y2 - y1)
+
+
+def bbox_union(a: BBox, b: BBox) -> BBox:
+    """Smallest bbox covering both a and b."""
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+class CapturePlanner:
+    """
+    Plans the cheapest set of screen grabs covering named regions of interest.
+
+    Each grab is costed as its pixel area plus a fixed per-grab overhead. Regions are merged
+    into a shared union grab while that is cheaper than grabbing them separately, so regions
+    close together share one grab and regions far apart get their own small grabs.
+    capture() returns zero-copy numpy views for every named region.
+    """
+
+    def __init__(
+        self, regions: Dict[str, BBox], grab_overhead: int = 20000, backend: Optional[CaptureBackend] = None
+    ):
+        """
+        Args:
+            regions: Mapping of region name -> screen bbox (x1, y1, x2, y2)
+            grab_overhead: Fixed cost of one extra grab call, in captured-pixel equivalents
+            backend: Capture backend to grab with (default: the process-wide backend)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.grab_overhead = grab_overhead
+        self.backend = backend
+        self.regions: Dict[str, BBox] = {}
+        for name, bbox in regions.items():
+            x1, y1, x2, y2 = (int(v) for v in bbox)
+            if x1 >= x2 or y1 >= y2:
+                raise ValueError(f"Invalid region '{name}': {bbox}")
+            self.regions[name] = (x1, y1, x2, y2)
+
+        self.groups = self._plan()
+        # One preallocated ring per grab so repeated capture() calls do not allocate
+        self._rings = [FrameRingBuffer(slots=2, backend=backend) for _ in self.groups]
+        self.logger.debug(
+            f"Planned {len(self.groups)} grab(s) for {len(self.regions)} region(s), "
+            f"{self.captured_pixels} px per capture"
+        )
+
+    @classmethod
+    def from_frame_data(
+        cls, frame_data: Dict[str, Any], names: Optional[Iterable[str]] = None, **kwargs
+    ) -> "CapturePlanner":
+        """
+        Build a planner from the frame's bbox entries in frames.cache.
+
+        Args:
+            frame_data: Frame data with screen-space "bbox" entries
+            names: Bbox names to capture (default: every bbox of the frame)
+        """
+        bboxes = frame_data["bbox"]
+        if names is None:
+            names = [name for name, bbox in bboxes.items() if isinstance(bbox, (list, tuple)) and len(bbox) == 4]
+        return cls({name: bboxes[name] for name in names}, **kwargs)
+
+    # ==============================
+    # Planning
+    # ==============================
+
+    def _plan(self) -> List[Tuple[BBox, List[str]]]:
+        """Greedily merge the pair of groups with the biggest saving until no merge pays off."""
+        groups = [(bbox, [name]) for name, bbox in self.regions.items()]
+
+        while len(groups) > 1:
+            best_saving = -1
+            best_pair = None
+            for i in range(len(groups)):
+                for j in range(i + 1, len(groups)):
+                    union = bbox_union(groups[i][0], groups[j][0])
+                    separate = bbox_area(groups[i][0]) + bbox_area(groups[j][0]) + self.grab_overhead
+                    saving = separate - bbox_area(union)
+                    if saving > best_saving:
+                        best_saving = saving
+                        best_pair = (i, j, union)
+
+            if best_pair is None:
+                break
+            i, j, union = best_pair
+            merged = (union, groups[i][1] + groups[j][1])
+            groups = [g for k, g in enumerate(groups) if k not in (i, j)] + [merged]
+
+        return groups
+
+    @property
+    def captured_pixels(self) -> int:
+        """Total pixels grabbed per capture() call."""
+        return sum(bbox_area(bbox) for bbox, _ in self.groups)
+
+    # ==============================
+    # Capture
+    # ==============================
+
+    def capture(self) -> Dict[str, np.ndarray]:
+        """
+        Run the planned grabs and return a read-only HxWx3 uint8 view for every region.
+        Views stay valid until the capture after next; copy them to keep the pixels longer.
+        """
+        views: Dict[str, np.ndarray] = {}
+        for ring, ((gx1, gy1, gx2, gy2), names) in zip(self._rings, self.groups):
+            array = ring.capture((gx1, gy1, gx2, gy2)).array
+
+            for name in names:
+                x1, y1, x2, y2 = self.regions[name]
+                views[name] = array[y1 - gy1 : y2 - gy1, x1 - gx1 : x2 - gx1]
+        return views
@@ -0,0 +1,357 @@
+"""
+Capture Scheduler
+Single capture thread that grabs the frame area at a fixed rate or on demand and shares it with subscribers.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .backends import BBox, CaptureBackend
+from .frame_recorder import FrameRecorder
+from .frame_ring import CapturedFrame, FrameRingBuffer, get_frame_recorder, set_frame_recorder
+
+
+class CaptureSubscription:
+    """
+    A consumer's handle on the scheduler's frame stream.
+
+    Tracks which frames this consumer has seen so it can count frames it skipped (dropped)
+    and how old each frame was when it was consumed (its reaction latency).
+    """
+
+    def __init__(self, scheduler: "CaptureScheduler", name: str):
+        self.scheduler = scheduler
+        self.name = name
+
+        self.consumed = 0
+        self.dropped = 0
+        self.last_age = 0.0
+        self.max_age = 0.0
+        self.total_age = 0.0
+        self._last_seq = scheduler.seq
+
+    def _consume(self, frame: Optional[CapturedFrame]) -> Optional[CapturedFrame]:
+        if frame is None or frame.seq == self._last_seq:
+            return frame
+        age = frame.age
+        skipped = max(0, frame.seq - self._last_seq - 1) if self._last_seq else 0
+        self._last_seq = frame.seq
+
+        self.consumed += 1
+        self.dropped += skipped
+        self.last_age = age
+        self.max_age = max(self.max_age, age)
+        self.total_age += age
+        self.scheduler._record_consumption(skipped, age)
+        return frame
+
+    def latest(self) -> Optional[CapturedFrame]:
+        """Newest published frame without waiting (may be one already consumed), or None."""
+        return self._consume(self.scheduler.latest)
+
+    def get(self, max_age: float = 0.0, timeout: float = 1.0) -> Optional[CapturedFrame]:
+        """Frame no older than max_age seconds, capturing on demand if needed. See CaptureScheduler.get_frame()."""
+        return self._consume(self.scheduler.get_frame(max_age, timeout))
+
+    def wait(self, timeout: float = 1.0) -> Optional[CapturedFrame]:
+        """Block until a frame newer than the last one this subscription consumed is published."""
+        return self._consume(self.scheduler.wait_for_frame(self._last_seq, timeout))
+
+    @property
+    def mean_age(self) -> float:
+        return self.total_age / self.consumed if self.consumed else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "consumed": self.consumed,
+            "dropped": self.dropped,
+            "last_age": self.last_age,
+            "mean_age": self.mean_age,
+            "max_age": self.max_age,
+        }
+
+    def close(self):
+        """Stop receiving frames."""
+        self.scheduler.unsubscribe(self)
+
+
+class CaptureScheduler:
+    """
+    Owns the one thread that captures the frame area for every consumer.
+
+    With a rate set the thread captures on a fixed tick; with rate=None it only captures when
+    a consumer asks for a frame newer than the latest. Concurrent requests are coalesced onto
+    the same capture. Frames live in a ring buffer, so consumers that hold a frame for longer
+    than `slots` captures should copy it.
+    """
+
+    def __init__(
+        self,
+        bbox_provider: Callable[[], Optional[BBox]],
+        rate: Optional[float] = None,
+        slots: int = 8,
+        backend: Optional[CaptureBackend] = None,
+    ):
+        """
+        Args:
+            bbox_provider: Callable returning the screen bbox to capture, or None when unavailable
+            rate: Captures per second, or None for on-demand only
+            slots: Ring buffer slots (frames kept alive before reuse)
+            backend: Capture backend to grab with (default: the process-wide backend)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.bbox_provider = bbox_provider
+        self.rate = rate
+        self._ring = FrameRingBuffer(slots=slots, backend=backend)
+
+        self._cond = threading.Condition()
+        self._demand = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._latest: Optional[CapturedFrame] = None
+        self._attempts = 0
+        self._last_attempt_started = 0.0
+        self._subscriptions: List[CaptureSubscription] = []
+        self.recorder: Optional[FrameRecorder] = None
+
+        # Statistics
+        self.produced = 0
+        self.failed = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.total_age = 0.0
+        self.max_age = 0.0
+
+    # ==============================
+    # Lifecycle
+    # ==============================
+
+    def start(self):
+        """Start the capture thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CaptureScheduler", daemon=True)
+        self._thread.start()
+        self.logger.debug(f"Capture scheduler started ({self.rate or 'on-demand'} Hz)")
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the capture thread, finish any recording and release waiting consumers."""
+        self._running = False
+        self._demand.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.stop_recording()
+        with self._cond:
+            self._cond.notify_all()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_rate(self, rate: Optional[float]):
+        """Change the tick rate (None = on-demand only); takes effect on the next tick."""
+        self.rate = rate
+        self._demand.set()
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while self._running:
+            if self.rate:
+                interval = 1.0 / self.rate
+                # Wake on the tick or earlier when a consumer demands a frame
+                self._demand.wait(max(0.0, next_tick - time.monotonic()))
+                now = time.monotonic()
+                if now >= next_tick:
+                    # Skip missed ticks instead of bursting to catch up
+                    next_tick += interval * max(1, int((now - next_tick) / interval) + 1)
+            else:
+                self._demand.wait()
+                next_tick = time.monotonic()
+            self._demand.clear()
+            if not self._running:
+                break
+            self._capture()
+
+    def _capture(self):
+        started = time.monotonic()
+        frame = None
+        try:
+            bbox = self.bbox_provider()
+            if bbox:
+                frame = self._ring.capture(bbox)
+        except Exception as e:
+            self.logger.error(f"Capture failed: {e}")
+
+        with self._cond:
+            self._attempts += 1
+            self._last_attempt_started = started
+            if frame is not None:
+                self._latest = frame
+                self.produced += 1
+            else:
+                self.failed += 1
+            self._cond.notify_all()
+
+    # ==============================
+    # Recording
+    # ==============================
+
+    def start_recording(self, path: Union[str, Path], **kwargs) -> FrameRecorder:
+        """
+        Record every ring capture to a recording directory (see FrameRecorder for kwargs).
+
+        Besides the frames this scheduler produces, that covers capture planner grabs and scan
+        waits, so automations that never subscribe to the scheduler are recorded too.
+        """
+        self.stop_recording()
+        self.recorder = FrameRecorder(path, **kwargs)
+        set_frame_recorder(self.recorder)
+        self.logger.info(f"Recording captured frames to {path}")
+        return self.recorder
+
+    def stop_recording(self):
+        """Finish the active recording, if any."""
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            if get_frame_recorder() is recorder:
+                set_frame_recorder(None)
+            recorder.close()
+
+    # ==============================
+    # Consumers
+    # ==============================
+
+    @property
+    def latest(self) -> Optional[CapturedFrame]:
+        """Most recently published frame, or None."""
+        return self._latest
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the most recently published frame (0 before the first)."""
+        return self._latest.seq if self._latest is not None else 0
+
+    def get_frame(self, max_age: float = 0.0, timeout: float = 1.0) -> Optional[CapturedFrame]:
+        """
+        Return a frame captured no earlier than max_age seconds before this call.
+
+        Reuses the latest frame when it is fresh enough, otherwise requests a capture and waits
+        for it; callers arriving while a capture is pending share it. Returns None if the frame
+        area is unavailable or the timeout expires.
+        """
+        requested = time.monotonic()
+        not_before = requested - max_age
+        frame = self._fresh(not_before)
+        if frame is not None:
+            return frame
+
+        if not self.is_running:
+            # No capture thread (e.g. tests or shutdown) - capture inline
+            self._capture()
+            return self._fresh(not_before)
+
+        deadline = requested + timeout
+        with self._cond:
+            attempts = self._attempts
+            self._demand.set()
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._cond.wait(remaining)
+                if self._attempts == attempts:
+                    continue
+
+                frame = self._fresh(not_before)
+                if frame is not None:
+                    return frame
+                if self._last_attempt_started >= requested:
+                    # A capture started after this request failed - frame area unavailable
+                    return None
+                # The capture that finished was already running before the request; wait for ours
+                attempts = self._attempts
+                self._demand.set()
+
+    def _fresh(self, not_before: float) -> Optional[CapturedFrame]:
+        frame = self._latest
+        if frame is not None and frame.timestamp >= not_before:
+            return frame
+        return None
+
+    def wait_for_frame(self, after_seq: int, timeout: float = 1.0) -> Optional[CapturedFrame]:
+        """Block until a frame with seq > after_seq is published (requests one when on-demand)."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self.seq <= after_seq:
+                if not self.rate:
+                    self._demand.set()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._cond.wait(remaining)
+            return self._latest
+
+    def subscribe(self, name: str) -> CaptureSubscription:
+        """Register a consumer and return its subscription."""
+        subscription = CaptureSubscription(self, name)
+        with self._cond:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: CaptureSubscription):
+        with self._cond:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    # ==============================
+    # Statistics
+    # ==============================
+
+    def _record_consumption(self, dropped: int, age: float):
+        with self._cond:
+            self.consumed += 1
+            self.dropped += dropped
+            self.total_age += age
+            self.max_age = max(self.max_age, age)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for produced/consumed/dropped frames and frame age at consumption."""
+        with self._cond:
+            return {
+                "rate": self.rate,
+                "produced": self.produced,
+                "failed": self.failed,
+                "consumed": self.consumed,
+                "dropped": self.dropped,
+                "mean_age": self.total_age / self.consumed if self.consumed else 0.0,
+                "max_age": self.max_age,
+                "subscriptions": [subscription.stats() for subscription in self._subscriptions],
+            }
+
+
+# ==============================
+# Global Instance
+# ==============================
+
+_scheduler: Optional[CaptureScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_capture_scheduler() -> CaptureScheduler:
+    """Get the process-wide scheduler for the game frame area, starting it on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                from utility.window_utils import get_frame_bbox
+
+                _scheduler = CaptureScheduler(get_frame_bbox)
+                _scheduler.start()
+    return _scheduler
@@ -0,0 +1,165 @@
+"""
+Change Detector
+Tile-level diff of consecutive captures so consumers only process frames that actually changed.
+"""
+
+import logging
+import time
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+from .backends import BBox
+from .frame_ring import CapturedFrame
+
+FrameLike = Union[CapturedFrame, np.ndarray]
+
+
+class ChangeDetector:
+    """
+    Compares each capture against the previous one on a grid of tiles.
+
+    update() diffs the (optionally strided) frame against a preallocated copy of the previous
+    one and records which tiles changed. changed() / changed_regions answer "did anything in
+    this region move?", and wait_for_change() polls a frame source until it does. Regions are
+    in the captured array's coordinates (frame coordinates for frame-area captures).
+    """
+
+    def __init__(
+        self,
+        tile: int = 16,
+        stride: int = 1,
+        threshold: int = 0,
+        frame_source: Optional[Callable[[], Optional[FrameLike]]] = None,
+    ):
+        """
+        Args:
+            tile: Tile edge in captured pixels
+            stride: Compare every Nth pixel in each axis (1 = exact, higher = cheaper, coarser)
+            threshold: Per-channel difference that counts as a change (0 = any difference)
+            frame_source: Callable returning the next capture, used by wait_for_change()
+        """
+        if tile < 1 or stride < 1 or tile % stride:
+            raise ValueError("tile and stride must be positive and tile a multiple of stride")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.tile = tile
+        self.stride = stride
+        self.threshold = threshold
+        self.frame_source = frame_source
+
+        self._previous: Optional[np.ndarray] = None
+        self._tiles: Optional[np.ndarray] = None  # bool (rows, cols) of tiles changed by the last update
+        self._padded: Optional[np.ndarray] = None  # Per-pixel change mask padded to whole tiles
+        self._shape = None
+        self._last_seq = None
+
+    # ==============================
+    # Diffing
+    # ==============================
+
+    def reset(self):
+        """Forget the previous frame so the next update reports everything as changed."""
+        self._previous = None
+        self._tiles = None
+        self._padded = None
+        self._shape = None
+        self._last_seq = None
+
+    def update(self, frame: FrameLike) -> bool:
+        """Diff a capture against the previous one. Returns True if any tile changed."""
+        if isinstance(frame, CapturedFrame):
+            if frame.seq == self._last_seq:
+                # Same capture handed over twice - nothing new to compare
+                self._tiles[:] = False
+                return False
+            self._last_seq = frame.seq
+            frame = frame.array
+
+        sample = frame[:: self.stride, :: self.stride]
+        if self._previous is None or self._shape != frame.shape:
+            self._previous = np.array(sample)
+            self._shape = frame.shape
+            rows, cols = self._grid(frame.shape)
+            step = self.tile // self.stride
+            self._tiles = np.ones((rows, cols), dtype=bool)
+            self._padded = np.zeros((rows * step, cols * step), dtype=bool)
+            return True
+
+        if self.threshold:
+            diff = np.abs(sample.astype(np.int16) - self._previous) > self.threshold
+        else:
+            diff = sample != self._previous
+        pixels = diff.any(axis=-1) if diff.ndim == 3 else diff
+
+        # Pad to whole tiles, then reduce each tile to a single flag
+        step = self.tile // self.stride
+        rows, cols = self._tiles.shape
+        self._padded[: pixels.shape[0], : pixels.shape[1]] = pixels
+        self._tiles = self._padded.reshape(rows, step, cols, step).any(axis=(1, 3))
+
+        np.copyto(self._previous, sample)
+        return bool(self._tiles.any())
+
+    def _grid(self, shape) -> tuple:
+        return (-(-shape[0] // self.tile), -(-shape[1] // self.tile))
+
+    # ==============================
+    # Queries
+    # ==============================
+
+    def changed(self, region: Optional[BBox] = None) -> bool:
+        """Check whether the last update changed anything inside region (None = anywhere)."""
+        if self._tiles is None:
+            return True
+        if region is None:
+            return bool(self._tiles.any())
+        x1, y1, x2, y2 = region
+        r1, c1 = max(0, int(y1) // self.tile), max(0, int(x1) // self.tile)
+        r2, c2 = -(-int(y2) // self.tile), -(-int(x2) // self.tile)
+        return bool(self._tiles[r1:r2, c1:c2].any())
+
+    @property
+    def changed_regions(self) -> List[BBox]:
+        """Bboxes of changed tiles from the last update, merged into horizontal runs per tile row."""
+        if self._tiles is None:
+            return []
+        height, width = self._shape[:2]
+        regions = []
+        for row in np.flatnonzero(self._tiles.any(axis=1)):
+            flags = np.concatenate(([False], self._tiles[row], [False]))
+            edges = np.flatnonzero(flags[1:] != flags[:-1])
+            y1 = int(row) * self.tile
+            y2 = min(height, y1 + self.tile)
+            for start, stop in zip(edges[::2], edges[1::2]):
+                regions.append((int(start) * self.tile, y1, min(width, int(stop) * self.tile), y2))
+        return regions
+
+    def wait_for_change(
+        self,
+        region: Optional[BBox] = None,
+        timeout: float = 10.0,
+        interval: float = 0.02,
+        should_continue: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """
+        Poll frame_source until something inside region changes.
+
+        Without a previous frame the first capture becomes the baseline. Returns True on a
+        change, False on timeout or when should_continue() turns False.
+        """
+        if self.frame_source is None:
+            raise ValueError("wait_for_change needs a frame_source")
+
+        deadline = time.monotonic() + timeout
+        primed = self._previous is not None
+        while should_continue is None or should_continue():
+            frame = self.frame_source()
+            if frame is not None:
+                # The first frame only establishes the baseline
+                if self.update(frame) and primed and self.changed(region):
+                    return True
+                primed = True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+        return False
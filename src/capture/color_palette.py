@@ -0,0 +1,141 @@
+"""
+Color Palette
+Precompiled button color-state classifier over packed 24-bit RGB values.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Button state colors as read from WidgetInc - the single definition used by all engines
+BUTTON_COLORS = {
+    "red": {"default": (199, 35, 21), "focus": (251, 36, 18), "inactive": (57, 23, 20)},
+    "blue": {"default": (21, 87, 199), "focus": (18, 104, 251), "inactive": (20, 34, 57)},
+    "green": {"default": (17, 162, 40), "focus": (15, 204, 45), "inactive": (16, 46, 22)},
+    "yellow": {"default": (242, 151, 0), "focus": (198, 125, 0), "inactive": (60, 39, 8)},
+}
+
+COLOR_TOLERANCE = 5
+ACTIVE_STATES = ("default", "focus")
+
+Label = Tuple[str, str]
+
+
+def pack_rgb(rgb: Sequence[int]) -> int:
+    """Pack an (r, g, b) color into a 24-bit integer."""
+    return (int(rgb[0]) << 16) | (int(rgb[1]) << 8) | int(rgb[2])
+
+
+def pack_rgb_array(pixels: np.ndarray) -> np.ndarray:
+    """Pack an (..., 3+) uint8 RGB array into (...) uint32 24-bit values."""
+    pixels = np.asarray(pixels)
+    return (
+        (pixels[..., 0].astype(np.uint32) << 16) | (pixels[..., 1].astype(np.uint32) << 8) | pixels[..., 2]
+    ).astype(np.uint32)
+
+
+class ColorPalette:
+    """
+    Maps colors to (family, state) labels, e.g. ("red", "focus").
+
+    Every color within the per-channel tolerance of a palette entry is expanded once into a
+    sparse table keyed by its packed 24-bit value, so a single pixel classifies with one dict
+    lookup. Arrays of pixels are classified with a binary search over the sorted table keys.
+    Colors within tolerance of several entries keep all of them, in palette order.
+    """
+
+    def __init__(self, colors: Optional[Dict[str, Dict[str, Sequence[int]]]] = None, tolerance: int = COLOR_TOLERANCE):
+        """
+        Args:
+            colors: {family: {state: (r, g, b)}} (default: BUTTON_COLORS)
+            tolerance: Maximum per-channel difference for a match
+        """
+        self.colors = {
+            family: {state: tuple(rgb) for state, rgb in states.items()}
+            for family, states in (colors or BUTTON_COLORS).items()
+        }
+        self.tolerance = tolerance
+        self.labels: List[Label] = [(family, state) for family, states in self.colors.items() for state in states]
+
+        table: Dict[int, Tuple[int, ...]] = {}
+        offsets = range(-tolerance, tolerance + 1)
+        for index, (family, state) in enumerate(self.labels):
+            r, g, b = self.colors[family][state]
+            for rv in (r + d for d in offsets if 0 <= r + d <= 255):
+                for gv in (g + d for d in offsets if 0 <= g + d <= 255):
+                    base = (rv << 16) | (gv << 8)
+                    for bv in (b + d for d in offsets if 0 <= b + d <= 255):
+                        key = base | bv
+                        table[key] = table.get(key, ()) + (index,)
+        self._table = table
+
+        # Sorted keys with the first matching label per key for the vectorized path
+        self._keys = np.fromiter(sorted(table), dtype=np.uint32, count=len(table))
+        self._key_labels = np.array([table[int(key)][0] for key in self._keys], dtype=np.int16)
+        self._match_keys: Dict[Tuple[str, Optional[Tuple[str, ...]]], np.ndarray] = {}
+
+    # ==============================
+    # Single pixels
+    # ==============================
+
+    def label_indices(self, rgb: Sequence[int]) -> Tuple[int, ...]:
+        """Indices into self.labels of every entry the color matches."""
+        return self._table.get(pack_rgb(rgb), ())
+
+    def classify(self, rgb: Sequence[int]) -> Optional[Label]:
+        """(family, state) of the color, or None if it is not a palette color."""
+        indices = self._table.get(pack_rgb(rgb))
+        return self.labels[indices[0]] if indices else None
+
+    def matches(self, rgb: Sequence[int], family: str, states: Optional[Iterable[str]] = None) -> bool:
+        """True if the color matches the family in any of the given states (default: any state)."""
+        for index in self._table.get(pack_rgb(rgb), ()):
+            label_family, label_state = self.labels[index]
+            if label_family == family and (states is None or label_state in states):
+                return True
+        return False
+
+    def is_active(self, rgb: Sequence[int], family: str) -> bool:
+        return self.matches(rgb, family, ACTIVE_STATES)
+
+    def is_inactive(self, rgb: Sequence[int], family: str) -> bool:
+        return self.matches(rgb, family, ("inactive",))
+
+    # ==============================
+    # Arrays
+    # ==============================
+
+    def classify_array(self, pixels: np.ndarray) -> np.ndarray:
+        """
+        Classify an (..., 3) RGB array.
+
+        Returns:
+            (...) int16 array of indices into self.labels, -1 where no palette color matches
+        """
+        packed = pack_rgb_array(pixels)
+        if not len(self._keys):
+            return np.full(packed.shape, -1, dtype=np.int16)
+        positions = np.searchsorted(self._keys, packed).clip(max=len(self._keys) - 1)
+        return np.where(self._keys[positions] == packed, self._key_labels[positions], np.int16(-1))
+
+    def match_array(self, pixels: np.ndarray, family: str, states: Optional[Iterable[str]] = None) -> np.ndarray:
+        """Boolean (...) mask of pixels matching the family in any of the given states."""
+        cache_key = (family, tuple(states) if states is not None else None)
+        keys = self._match_keys.get(cache_key)
+        if keys is None:
+            wanted = {
+                i
+                for i, (label_family, label_state) in enumerate(self.labels)
+                if label_family == family and (states is None or label_state in cache_key[1])
+            }
+            keys = sorted(key for key, indices in self._table.items() if wanted.intersection(indices))
+            keys = np.array(keys, dtype=np.uint32)
+            self._match_keys[cache_key] = keys
+        return np.isin(pack_rgb_array(pixels), keys)
+
+
+@lru_cache(maxsize=1)
+def get_button_palette() -> ColorPalette:
+    """Shared palette of the standard button colors, built once per process."""
+    return ColorPalette(BUTTON_COLORS, COLOR_TOLERANCE)
@@ -0,0 +1,305 @@
+"""
+Frame Recorder
+Chunked on-disk recordings of captured frames, memory-mapped replay and a replay capture backend.
+
+Layout of a recording directory:
+    index.json          - format version, written when the recording starts
+    chunks.jsonl        - one line per finished chunk: file, shape and its frames' metadata
+    chunk_00000.npy     - raw (N, H, W, 3) uint8 frames, memory-mappable
+    chunk_00001.npz     - same, zlib-compressed (compress=True), loaded per chunk on demand
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .backends import BBox, CaptureBackend
+from .frame_ring import CapturedFrame
+
+INDEX_FILE = "index.json"
+CHUNKS_FILE = "chunks.jsonl"
+FORMAT_VERSION = 2
+
+
+class _OpenChunk:
+    """Chunk still being filled: its buffer and the metadata of the frames in it."""
+
+    __slots__ = ("index", "file", "buffer", "frames")
+
+    def __init__(self, index: int, file: str, buffer: np.ndarray):
+        self.index = index
+        self.file = file
+        self.buffer = buffer
+        self.frames: List[Dict[str, Any]] = []
+
+
+class FrameRecorder:
+    """
+    Appends frames with timestamps, frame ID and screen bbox to a recording directory.
+
+    Frames go into chunks of up to chunk_frames frames of one size. One chunk per frame size is
+    kept open, so captures of different regions interleaving (e.g. capture planner grabs) do not
+    split chunks; at most max_open_chunks are open, the oldest is closed to make room. Raw
+    chunks are written straight into a preallocated .npy memmap; compressed chunks are buffered
+    and saved as .npz when full. A closing chunk appends one line to chunks.jsonl, so the
+    index costs O(frames in the chunk) per chunk and a crashed recording keeps its closed chunks.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        chunk_frames: int = 64,
+        compress: bool = False,
+        max_open_chunks: int = 8,
+    ):
+        """
+        Args:
+            path: Recording directory (created if missing; must not already hold a recording)
+            chunk_frames: Frames per chunk file
+            compress: Save chunks as compressed .npz instead of raw memory-mappable .npy
+            max_open_chunks: Frame sizes recorded into concurrently before the oldest chunk is closed
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        if (self.path / INDEX_FILE).exists():
+            raise FileExistsError(f"Recording already exists at {self.path}")
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / INDEX_FILE).write_text(json.dumps({"version": FORMAT_VERSION}))
+
+        self.chunk_frames = chunk_frames
+        self.compress = compress
+        self.max_open_chunks = max_open_chunks
+        self.frame_id: Optional[str] = None  # Default label for recorded frames
+
+        self._open: Dict[Tuple[int, ...], _OpenChunk] = {}  # By frame shape, oldest first
+        self._chunk_count = 0
+        self._frame_count = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._frame_count
+
+    # ==============================
+    # Writing
+    # ==============================
+
+    def record(
+        self,
+        frame: Union[CapturedFrame, np.ndarray],
+        frame_id: Optional[str] = None,
+        timestamp: Optional[float] = None,
+        bbox: Optional[BBox] = None,
+    ):
+        """Append one frame. CapturedFrame supplies timestamp and bbox unless given explicitly."""
+        if isinstance(frame, CapturedFrame):
+            timestamp = frame.timestamp if timestamp is None else timestamp
+            bbox = frame.bbox if bbox is None else bbox
+            frame = frame.array
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if bbox is None:
+            bbox = (0, 0, frame.shape[1], frame.shape[0])
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("Recorder is closed")
+            chunk = self._open.get(frame.shape)
+            if chunk is None:
+                chunk = self._open_chunk(frame.shape)
+
+            chunk.buffer[len(chunk.frames)] = frame
+            chunk.frames.append(
+                {
+                    "t": float(timestamp),
+                    "frame_id": frame_id if frame_id is not None else self.frame_id,
+                    "bbox": [int(v) for v in bbox],
+                }
+            )
+            self._frame_count += 1
+            if len(chunk.frames) == self.chunk_frames:
+                self._close_chunk(frame.shape)
+
+    def _open_chunk(self, shape) -> _OpenChunk:
+        if len(self._open) >= self.max_open_chunks:
+            self._close_chunk(next(iter(self._open)))
+
+        name = f"chunk_{self._chunk_count:05d}.{'npz' if self.compress else 'npy'}"
+        full_shape = (self.chunk_frames, *shape)
+        if self.compress:
+            buffer = np.empty(full_shape, dtype=np.uint8)
+        else:
+            buffer = np.lib.format.open_memmap(self.path / name, mode="w+", dtype=np.uint8, shape=full_shape)
+        chunk = self._open[shape] = _OpenChunk(self._chunk_count, name, buffer)
+        self._chunk_count += 1
+        return chunk
+
+    def _close_chunk(self, shape):
+        chunk = self._open.pop(shape)
+        count = len(chunk.frames)
+        if self.compress:
+            np.savez_compressed(self.path / chunk.file, frames=chunk.buffer[:count])
+        else:
+            chunk.buffer.flush()
+        entry = {
+            "index": chunk.index,
+            "file": chunk.file,
+            "count": count,
+            "shape": list(shape),
+            "compressed": self.compress,
+            "frames": chunk.frames,
+        }
+        with open(self.path / CHUNKS_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def close(self):
+        """Finish every open chunk."""
+        with self._lock:
+            if self._closed:
+                return
+            for shape in list(self._open):
+                self._close_chunk(shape)
+            self._closed = True
+        self.logger.info(f"Recorded {self._frame_count} frame(s) in {self._chunk_count} chunk(s) to {self.path}")
+
+
+class FrameRecording:
+    """
+    Reads a recording directory. Raw chunks are memory-mapped, compressed chunks load on first use.
+
+    Frames are ordered by timestamp across chunks.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        index = json.loads((self.path / INDEX_FILE).read_text())
+        if index.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {index.get('version')}")
+
+        entries = []
+        chunks_path = self.path / CHUNKS_FILE
+        if chunks_path.exists():
+            for line in chunks_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break  # Line cut short by a crash; everything before it is complete
+        entries.sort(key=lambda entry: entry["index"])
+
+        self.chunks: List[Dict[str, Any]] = []
+        self.frames: List[Dict[str, Any]] = []
+        for position, entry in enumerate(entries):
+            frames = entry.pop("frames")
+            self.chunks.append(entry)
+            self.frames.extend(dict(meta, chunk=position, offset=offset) for offset, meta in enumerate(frames))
+        self.frames.sort(key=lambda meta: meta["t"])
+        self._loaded: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self.frame(i)
+
+    def _chunk(self, index: int) -> np.ndarray:
+        data = self._loaded.get(index)
+        if data is None:
+            chunk = self.chunks[index]
+            file_path = self.path / chunk["file"]
+            if chunk["compressed"]:
+                with np.load(file_path, allow_pickle=False) as archive:
+                    data = archive["frames"]
+            else:
+                data = np.load(file_path, mmap_mode="r", allow_pickle=False)
+            self._loaded[index] = data
+        return data
+
+    def frame(self, i: int) -> np.ndarray:
+        """Read-only HxWx3 array of frame i (a view into the memory-mapped chunk when raw)."""
+        meta = self.frames[i]
+        return self._chunk(meta["chunk"])[meta["offset"]]
+
+    def meta(self, i: int) -> Dict[str, Any]:
+        """Timestamp, frame ID and screen bbox of frame i."""
+        return self.frames[i]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return np.array([meta["t"] for meta in self.frames], dtype=np.float64)
+
+    @property
+    def duration(self) -> float:
+        if not self.frames:
+            return 0.0
+        return self.frames[-1]["t"] - self.frames[0]["t"]
+
+
+class RecordingBackend(CaptureBackend):
+    """
+    Capture backend that replays a recording.
+
+    With a speed the frame shown follows the recorded timestamps (speed=4 plays four times
+    faster than real time); with speed=None each grab steps to the next frame. Grab bboxes are
+    in screen coordinates and are cropped out of the most recent recorded frame whose bbox
+    contains them, since recordings interleave the regions grabbed by different rings.
+    """
+
+    name = "recording"
+
+    def __init__(self, path: Union[str, Path, FrameRecording], speed: Optional[float] = 1.0, loop: bool = False):
+        super().__init__()
+        self.recording = path if isinstance(path, FrameRecording) else FrameRecording(path)
+        if not len(self.recording):
+            raise ValueError(f"Recording at {self.recording.path} has no frames")
+        self.speed = speed
+        self.loop = loop
+        self._timestamps = self.recording.timestamps - self.recording.frames[0]["t"]
+        self._started: Optional[float] = None
+        self._step = -1
+
+    def restart(self):
+        """Start playback again from the first frame."""
+        self._started = None
+        self._step = -1
+
+    @property
+    def index(self) -> int:
+        """Index of the frame the next grab returns."""
+        if self.speed is None:
+            return min(max(self._step, 0), len(self.recording) - 1)
+        if self._started is None:
+            self._started = time.monotonic()
+        elapsed = (time.monotonic() - self._started) * self.speed
+        if self.loop and self.recording.duration > 0:
+            elapsed %= self.recording.duration
+        return max(0, int(np.searchsorted(self._timestamps, elapsed, side="right")) - 1)
+
+    @property
+    def finished(self) -> bool:
+        """True once a non-looping replay has reached its last frame."""
+        return not self.loop and self.index == len(self.recording) - 1
+
+    def grab(self, bbox: BBox) -> np.ndarray:
+        if self.speed is None:
+            self._step += 1
+            if self._step >= len(self.recording):
+                self._step = 0 if self.loop else len(self.recording) - 1
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        index = self.index
+        for i in range(index, -1, -1):
+            fx1, fy1, fx2, fy2 = self.recording.frames[i]["bbox"]
+            if fx1 <= x1 and fy1 <= y1 and x2 <= fx2 and y2 <= fy2:
+                return self.recording.frame(i)[y1 - fy1 : y2 - fy1, x1 - fx1 : x2 - fx1]
+        raise ValueError(f"Bbox {bbox} outside every recorded frame up to {index}")
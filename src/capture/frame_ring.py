@@ -0,0 +1,181 @@
+"""
+Frame Ring Buffer
+Preallocated capture slots so hot loops reuse the same arrays instead of allocating per frame.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .backends import BBox, CaptureBackend, get_capture_backend
+
+# Recorder every ring capture is appended to (see set_frame_recorder)
+_frame_recorder = None
+
+
+class CapturedFrame:
+    """
+    Read-only view of one captured frame plus its sequence number, timestamp and screen bbox.
+
+    The view points into a ring slot and is overwritten once the ring wraps around to it;
+    check current (after reading, to catch a capture racing the read), or copy() to keep the pixels.
+    """
+
+    __slots__ = ("array", "seq", "timestamp", "bbox", "ring")
+
+    def __init__(
+        self, array: np.ndarray, seq: int, timestamp: float, bbox: BBox, ring: Optional["FrameRingBuffer"] = None
+    ):
+        self.array = array
+        self.seq = seq
+        self.timestamp = timestamp
+        self.bbox = bbox
+        self.ring = ring
+
+    @property
+    def current(self) -> bool:
+        """False once the ring slot holding the pixels has been reused by a newer capture."""
+        return self.ring is None or self.ring.is_current(self)
+
+    @property
+    def origin(self) -> Tuple[int, int]:
+        """Screen coordinates of the top-left pixel."""
+        return (self.bbox[0], self.bbox[1])
+
+    @property
+    def width(self) -> int:
+        return self.array.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.array.shape[0]
+
+    @property
+    def age(self) -> float:
+        """Seconds since the frame was captured."""
+        return time.monotonic() - self.timestamp
+
+    def copy(self) -> np.ndarray:
+        """Writable copy of the pixels that survives the ring wrapping around."""
+        return self.array.copy()
+
+
+class FrameRingBuffer:
+    """
+    Ring of preallocated HxWx3 uint8 slots that the capture backend writes into directly.
+
+    Slots are (re)allocated only when the capture size changes, e.g. after the game window is
+    resized, so steady-state capture loops do not allocate. Consumers get read-only views.
+    """
+
+    def __init__(self, slots: int = 3, backend: Optional[CaptureBackend] = None):
+        """
+        Args:
+            slots: Number of frames kept alive before the oldest slot is reused
+            backend: Capture backend to grab with (default: the process-wide backend)
+        """
+        if slots < 1:
+            raise ValueError("FrameRingBuffer needs at least one slot")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.backend = backend
+        self.slots = slots
+
+        self._buffers: list = []
+        self._shape: Optional[Tuple[int, int, int]] = None
+        self._seq = 0
+        self._writing = 0  # Seq of the capture that last claimed a slot, set before its write starts
+        self._latest: Optional[CapturedFrame] = None
+        self._lock = threading.Lock()
+
+    def _ensure_shape(self, height: int, width: int):
+        shape = (height, width, 3)
+        if shape != self._shape:
+            self.logger.debug(f"Allocating {self.slots} capture slot(s) of {width}x{height}")
+            self._buffers = [np.empty(shape, dtype=np.uint8) for _ in range(self.slots)]
+            self._shape = shape
+
+    # ==============================
+    # Capture
+    # ==============================
+
+    def capture(self, bbox: BBox) -> CapturedFrame:
+        """Grab a screen bbox into the next slot and return a read-only view of it."""
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        if x1 >= x2 or y1 >= y2:
+            raise ValueError(f"Invalid capture bbox: {bbox}")
+
+        with self._lock:
+            self._ensure_shape(y2 - y1, x2 - x1)
+            seq = self._seq + 1
+            buffer = self._buffers[seq % self.slots]
+
+            # Frames held in this slot go stale before the first byte is written, so a read
+            # racing the grab sees current=False afterwards. A failed grab keeps the claim (the
+            # slot may be half written) and the next capture retries the same seq and slot.
+            self._writing = seq
+            backend = self.backend or get_capture_backend()
+            backend.grab_into((x1, y1, x2, y2), buffer)
+
+            view = buffer.view()
+            view.flags.writeable = False
+            frame = CapturedFrame(view, seq, time.monotonic(), (x1, y1, x2, y2), self)
+            self._seq = seq
+            self._latest = frame
+
+            # Recorded while the slot is locked, before a later capture can reuse it
+            recorder = _frame_recorder
+            if recorder is not None:
+                self._record(recorder, frame)
+        return frame
+
+    def _record(self, recorder, frame: CapturedFrame):
+        try:
+            recorder.record(frame)
+        except Exception as e:
+            self.logger.error(f"Recording failed, detaching recorder: {e}")
+            if get_frame_recorder() is recorder:
+                set_frame_recorder(None)
+
+    # ==============================
+    # State
+    # ==============================
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the most recent capture (0 before the first)."""
+        return self._seq
+
+    @property
+    def latest(self) -> Optional[CapturedFrame]:
+        """Most recent captured frame, or None."""
+        return self._latest
+
+    def is_current(self, frame: CapturedFrame) -> bool:
+        """
+        Check that a frame's slot has not been claimed by a newer capture.
+
+        A slot counts as overwritten from the moment a capture starts writing it, so checking
+        after a read tells whether the read may have been torn.
+        """
+        if not any(frame.array.base is buffer for buffer in self._buffers):
+            # Slot was dropped by a resize, so nothing can overwrite it any more
+            return True
+        return self._writing - frame.seq < self.slots
+
+
+def get_frame_recorder():
+    """Recorder that ring captures are appended to, or None."""
+    return _frame_recorder
+
+
+def set_frame_recorder(recorder):
+    """
+    Append every FrameRingBuffer capture (scheduler ticks, capture planners, scan waits) to recorder.
+
+    recorder needs a record(CapturedFrame) method, e.g. a FrameRecorder; None stops recording.
+    """
+    global _frame_recorder
+    _frame_recorder = recorder
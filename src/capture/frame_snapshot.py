@@ -0,0 +1,140 @@
+"""
+Frame Snapshot
+Captures the frame area once so repeated pixel probes read from memory instead of the screen.
+"""
+
+import logging
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from .backends import BBox, CaptureBackend
+from .frame_ring import CapturedFrame, FrameRingBuffer
+
+
+class FrameSnapshot:
+    """
+    Numpy-backed capture of a screen region that answers pixel probes without screen reads.
+
+    The snapshot is only re-captured by refresh(), or automatically on the next probe once it
+    is older than max_age. Probes outside the captured region (or with no capture) return None
+    so callers can fall back to a live read. A loaded frame lives in its producer's ring (e.g.
+    the capture scheduler's); once that slot is reused the snapshot drops it instead of
+    answering from overwritten pixels.
+    """
+
+    def __init__(
+        self,
+        bbox_provider: Callable[[], Optional[BBox]],
+        max_age: Optional[float] = None,
+        backend: Optional[CaptureBackend] = None,
+    ):
+        """
+        Args:
+            bbox_provider: Callable returning the screen bbox (x1, y1, x2, y2) to capture, or None
+            max_age: Seconds before a probe re-captures automatically (None = only via refresh())
+            backend: Capture backend to grab with (default: the process-wide backend)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.bbox_provider = bbox_provider
+        self.max_age = max_age
+        self._ring = FrameRingBuffer(slots=2, backend=backend)
+        self._frame: Optional[CapturedFrame] = None
+
+    # ==============================
+    # Capture Control
+    # ==============================
+
+    def refresh(self) -> bool:
+        """Capture the region now. Returns False (and drops the old capture) if no region is available."""
+        bbox = self.bbox_provider()
+        if not bbox:
+            self.invalidate()
+            return False
+
+        x1, y1, x2, y2 = bbox
+        if x1 >= x2 or y1 >= y2:
+            self.logger.warning(f"Invalid snapshot bbox: {bbox}")
+            self.invalidate()
+            return False
+
+        self._frame = self._ring.capture((x1, y1, x2, y2))
+        return True
+
+    def load(self, frame: Optional[CapturedFrame]) -> bool:
+        """Adopt a frame captured elsewhere (e.g. by the capture scheduler). Returns False for None."""
+        self._frame = frame
+        return frame is not None
+
+    def invalidate(self):
+        """Drop the current capture so probes fall back to live reads until the next refresh()."""
+        self._frame = None
+
+    # ==============================
+    # State
+    # ==============================
+
+    @property
+    def frame(self) -> Optional[CapturedFrame]:
+        """Current captured frame, or None (also once its ring slot has been reused)."""
+        if self._frame is not None and not self._frame.current:
+            self._drop_overwritten()
+        return self._frame
+
+    @property
+    def array(self) -> Optional[np.ndarray]:
+        """Captured read-only HxWx3 uint8 RGB array, or None."""
+        frame = self.frame
+        return frame.array if frame is not None else None
+
+    def _drop_overwritten(self):
+        self.logger.debug(f"Snapshot frame {self._frame.seq} was overwritten by a newer capture, dropping it")
+        self._frame = None
+
+    @property
+    def origin(self) -> Tuple[int, int]:
+        """Screen coordinates of the top-left captured pixel."""
+        return self._frame.origin if self._frame is not None else (0, 0)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the last capture (inf if there is none)."""
+        if self._frame is None:
+            return float("inf")
+        return self._frame.age
+
+    def contains(self, x: int, y: int) -> bool:
+        """Check if screen coordinates fall inside the captured region."""
+        if self._frame is None:
+            return False
+        x1, y1, x2, y2 = self._frame.bbox
+        return x1 <= x < x2 and y1 <= y < y2
+
+    # ==============================
+    # Probes
+    # ==============================
+
+    def pixel(self, x: int, y: int) -> Optional[Tuple[int, int, int]]:
+        """Get the RGB color at screen (x, y) from the capture, or None if it cannot answer."""
+        if self._frame is None:
+            return None
+        if self.max_age is not None and self.age > self.max_age and not self.refresh():
+            return None
+        if not self.contains(x, y):
+            return None
+
+        frame = self._frame
+        ox, oy = frame.origin
+        r, g, b = frame.array[int(y) - oy, int(x) - ox].tolist()
+        if not frame.current:
+            # The slot was reused before or during the read
+            self._drop_overwritten()
+            return None
+        return (r, g, b)
+
+    def pixel_matches_color(self, x: int, y: int, color: Tuple[int, ...], tolerance: int = 0) -> Optional[bool]:
+        """Check the captured color at screen (x, y) against color, or None if it cannot answer."""
+        actual = self.pixel(x, y)
+        if actual is None:
+            return None
+        return all(abs(actual[i] - color[i]) <= tolerance for i in range(3))
@@ -0,0 +1,239 @@
+"""
+Synthetic Frame
+Renders WidgetInc frames from frames_database.json so capture consumers can run without the game.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .backends import BBox, CaptureBackend
+from .color_palette import BUTTON_COLORS
+
+CONFIG_DATA_DIR = Path(__file__).parent.parent.parent / "config" / "data"
+FRAMES_DATABASE_FILE = CONFIG_DATA_DIR / "frames_database.json"
+FRAME_DETECTION_FILE = CONFIG_DATA_DIR / "frame_detection.json"
+
+Color = Tuple[int, int, int]
+
+# Same sampling geometry as FrameDetector.analyze_frame_borders
+BORDER_INSET = 0.05
+
+
+def load_frames_database(path: Union[str, Path] = FRAMES_DATABASE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Load frames_database.json as a dict keyed by frame ID."""
+    with open(path, "r", encoding="utf-8") as f:
+        return {frame["id"]: frame for frame in json.load(f)["frames"]}
+
+
+def load_border_colors(path: Union[str, Path] = FRAME_DETECTION_FILE) -> Dict[str, Tuple[Color, Color]]:
+    """Load (left, right) average border colors from frame_detection.json keyed by frame ID."""
+    with open(path, "r", encoding="utf-8") as f:
+        detection = json.load(f)
+    colors = {}
+    for entry in detection.values():
+        left = tuple(int(round(c)) for c in entry["left_border"]["average_color"][:3])
+        right = tuple(int(round(c)) for c in entry["right_border"]["average_color"][:3])
+        colors[entry["frame_id"]] = (left, right)
+    return colors
+
+
+class SyntheticFrame:
+    """
+    Scriptable rendering of one frame at any resolution.
+
+    Borders use the frame's average border colors from frame_detection.json so FrameDetector
+    recognises it; buttons are drawn as squares in their current state color at the stored
+    percent coordinates. Extra elements (progress bars, pistons, ...) can be painted by percent
+    bbox. The image is re-rendered only after a state change.
+    """
+
+    def __init__(
+        self,
+        frame_id: str,
+        width: int = 1080,
+        height: int = 720,
+        background: Color = (24, 20, 28),
+        button_size: float = 0.012,
+        frames_database: Optional[Dict[str, Dict[str, Any]]] = None,
+        border_colors: Optional[Dict[str, Tuple[Color, Color]]] = None,
+    ):
+        """
+        Args:
+            frame_id: Frame ID from frames_database.json (e.g. "1.1")
+            width, height: Rendered frame-area size in pixels
+            background: Fill color inside the borders
+            button_size: Button half-size as a fraction of the frame width
+            frames_database: Preloaded database (default: load config/data/frames_database.json)
+            border_colors: Preloaded border colors (default: load config/data/frame_detection.json)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        frames_database = frames_database if frames_database is not None else load_frames_database()
+        if frame_id not in frames_database:
+            raise ValueError(f"Unknown frame ID '{frame_id}'")
+        border_colors = border_colors if border_colors is not None else load_border_colors()
+
+        self.frame_id = frame_id
+        self.frame_data = frames_database[frame_id]
+        self.width = width
+        self.height = height
+        self.background = background
+        self.button_half = max(2, int(round(button_size * width)))
+        self.left_border, self.right_border = border_colors.get(frame_id, (background, background))
+
+        # Unprogrammed frames carry placeholder buttons like [1, 1, 1]; only real colors are drawn
+        self.buttons: Dict[str, list] = {
+            name: button
+            for name, button in self.frame_data.get("buttons", {}).items()
+            if len(button) == 3 and button[2] in BUTTON_COLORS
+        }
+        self.button_states: Dict[str, str] = {name: "default" for name in self.buttons}
+        self._paint: List[Tuple[Tuple[float, float, float, float], Color]] = []
+        self._paint_pixels: List[Tuple[BBox, Color]] = []
+        self._image: Optional[np.ndarray] = None
+
+    # ==============================
+    # State API
+    # ==============================
+
+    def set_button_state(self, name: str, state: str):
+        """Set a button to 'default', 'focus' or 'inactive'."""
+        if name not in self.buttons:
+            raise KeyError(f"Frame {self.frame_id} has no button '{name}'")
+        color = self.buttons[name][2]
+        if state not in BUTTON_COLORS[color]:
+            raise ValueError(f"Invalid button state '{state}'")
+        self.button_states[name] = state
+        self._image = None
+
+    def set_all_buttons(self, state: str):
+        for name in self.buttons:
+            self.set_button_state(name, state)
+
+    def set_border_colors(self, left: Color, right: Color):
+        """Override the border colors (e.g. to render a frame the detector should not match)."""
+        self.left_border, self.right_border = tuple(left), tuple(right)
+        self._image = None
+
+    def paint(self, bbox: Union[str, Sequence[float]], color: Color):
+        """Fill a percent bbox (or the name of one of the frame's bboxes) with a solid color."""
+        if isinstance(bbox, str):
+            bbox = self.frame_data["bbox"][bbox]
+        self._paint.append((tuple(bbox), tuple(color)))
+        self._image = None
+
+    def paint_point(self, point: Union[str, Sequence[float]], color: Color, radius: int = 0):
+        """Set the pixel at a percent point (or named interaction) and a square radius around it."""
+        if isinstance(point, str):
+            point = self.frame_data["interactions"][point]
+        x, y = self.to_pixels(point[0], point[1])
+        self._paint_pixels.append(((x - radius, y - radius, x + radius + 1, y + radius + 1), tuple(color)))
+        self._image = None
+
+    def clear_paint(self):
+        self._paint = []
+        self._paint_pixels = []
+        self._image = None
+
+    # ==============================
+    # Rendering
+    # ==============================
+
+    def to_pixels(self, x_percent: float, y_percent: float) -> Tuple[int, int]:
+        """Frame percent -> frame pixel coordinates (truncated like the coordinate utilities)."""
+        return (int(x_percent * self.width), int(y_percent * self.height))
+
+    def button_position(self, name: str) -> Tuple[int, int]:
+        """Frame pixel coordinates of a button's sample point."""
+        x, y, _ = self.buttons[name]
+        return self.to_pixels(x, y)
+
+    def render(self) -> np.ndarray:
+        """Render (or return the cached) read-only HxWx3 uint8 frame image."""
+        if self._image is not None:
+            return self._image
+
+        image = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        image[:] = self.background
+
+        inset = max(1, int(self.width * BORDER_INSET))
+        image[:, :inset] = self.left_border
+        image[:, self.width - inset :] = self.right_border
+
+        half = self.button_half
+        for name, (_, _, color) in self.buttons.items():
+            x, y = self.button_position(name)
+            image[max(0, y - half) : y + half + 1, max(0, x - half) : x + half + 1] = BUTTON_COLORS[color][
+                self.button_states[name]
+            ]
+
+        for (x1, y1, x2, y2), color in self._paint:
+            px1, py1 = self.to_pixels(x1, y1)
+            px2, py2 = self.to_pixels(x2, y2)
+            image[max(0, py1) : py2, max(0, px1) : px2] = color
+        for (px1, py1, px2, py2), color in self._paint_pixels:
+            image[max(0, py1) : py2, max(0, px1) : px2] = color
+
+        image.flags.writeable = False
+        self._image = image
+        return image
+
+
+class SyntheticCaptureBackend(CaptureBackend):
+    """
+    Capture backend serving a SyntheticFrame placed at a screen origin.
+
+    Pixels outside the frame area but inside screen_size read as black, like the desktop
+    around the game window; grabs outside the screen raise ValueError.
+    """
+
+    name = "synthetic"
+
+    def __init__(
+        self,
+        frame: SyntheticFrame,
+        origin: Tuple[int, int] = (0, 0),
+        screen_size: Optional[Tuple[int, int]] = None,
+    ):
+        super().__init__()
+        self.frame = frame
+        self.origin = origin
+        self.screen_size = screen_size or (origin[0] + frame.width, origin[1] + frame.height)
+
+    @property
+    def frame_bbox(self) -> BBox:
+        """Screen bbox of the rendered frame area."""
+        ox, oy = self.origin
+        return (ox, oy, ox + self.frame.width, oy + self.frame.height)
+
+    def button_screen_position(self, name: str) -> Tuple[int, int]:
+        x, y = self.frame.button_position(name)
+        return (self.origin[0] + x, self.origin[1] + y)
+
+    def grab(self, bbox: BBox) -> np.ndarray:
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        screen_width, screen_height = self.screen_size
+        if x1 < 0 or y1 < 0 or x2 > screen_width or y2 > screen_height or x1 >= x2 or y1 >= y2:
+            raise ValueError(f"Bbox {bbox} outside synthetic screen {self.screen_size}")
+
+        image = self.frame.render()
+        fx1, fy1, fx2, fy2 = self.frame_bbox
+        if fx1 <= x1 and fy1 <= y1 and x2 <= fx2 and y2 <= fy2:
+            return image[y1 - fy1 : y2 - fy1, x1 - fx1 : x2 - fx1]
+
+        # Partly outside the frame area - compose onto black
+        out = np.zeros((y2 - y1, x2 - x1, 3), dtype=np.uint8)
+        ix1, iy1, ix2, iy2 = max(x1, fx1), max(y1, fy1), min(x2, fx2), min(y2, fy2)
+        if ix1 < ix2 and iy1 < iy2:
+            out[iy1 - y1 : iy2 - y1, ix1 - x1 : ix2 - x1] = image[iy1 - fy1 : iy2 - fy1, ix1 - fx1 : ix2 - fx1]
+        return out
+
+    def pixel(self, x: int, y: int) -> Tuple[int, int, int]:
+        fx1, fy1, fx2, fy2 = self.frame_bbox
+        if fx1 <= x < fx2 and fy1 <= y < fy2:
+            r, g, b = self.frame.render()[int(y) - fy1, int(x) - fx1].tolist()
+            return (r, g, b)
+        return super().pixel(x, y)
@@ -5,6 +5,18 @@ Contains classes and utilities for detecting frames and managing
 frame detection overlays.
 """
 
+from .border_classifier import BorderClassifier, border_signature
+from .detection_store import DetectionStore, load_detection_store
+from .detection_worker import DetectionWorker
+from .disambiguation import DisambiguationProbes
 from .frame_detector import FrameDetector
 
-__all__ = ["FrameDetector"]
+__all__ = [
+    "BorderClassifier",
+    "DetectionStore",
+    "DetectionWorker",
+    "DisambiguationProbes",
+    "FrameDetector",
+    "border_signature",
+    "load_detection_store",
+]
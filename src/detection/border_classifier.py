@@ -0,0 +1,181 @@
+"""
+Border Classifier
+Nearest-neighbour frame classification over compiled left/right border colors.
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Same sampling geometry as the analyze package
+BORDER_INSET = 0.05  # 5% inset from edge
+CENTER_STRIP = 0.2  # 20% center strip
+
+# Combined left + right RGB distance above which no frame matches
+MAX_SCORE = 100.0
+
+# Pixel stride of the border-strip fingerprint
+FINGERPRINT_STEP = 4
+
+BBox = Tuple[int, int, int, int]
+
+
+def border_strip_boxes(width: int, height: int) -> Tuple[BBox, BBox]:
+    """(left, right) border strip boxes (x1, y1, x2, y2) within a width x height frame."""
+    inset_width = int(width * BORDER_INSET)
+    strip_height = int(height * CENTER_STRIP)
+    start_y = height // 2 - strip_height // 2
+    end_y = start_y + strip_height
+    return (0, start_y, inset_width, end_y), (width - inset_width, start_y, width, end_y)
+
+
+def strip_signature(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Average colors of the left and right border strips.
+
+    Returns:
+        (6,) float32 array [left_r, left_g, left_b, right_r, right_g, right_b]
+    """
+    return np.concatenate([left[..., :3].mean(axis=(0, 1)), right[..., :3].mean(axis=(0, 1))]).astype(np.float32)
+
+
+def strip_fingerprint(left: np.ndarray, right: np.ndarray, step: int = FINGERPRINT_STEP) -> bytes:
+    """Hash of the border strips sampled every step pixels; changes whenever the borders do."""
+    digest = hashlib.blake2b(digest_size=16)
+    for strip in (left, right):
+        sampled = np.ascontiguousarray(strip[::step, ::step, :3])
+        digest.update(np.array(sampled.shape, dtype=np.int32).tobytes())
+        digest.update(sampled.tobytes())
+    return digest.digest()
+
+
+def border_signature(image: np.ndarray) -> np.ndarray:
+    """Average left and right border colors of a full frame image (see strip_signature)."""
+    (lx1, ly1, lx2, ly2), (rx1, ry1, rx2, ry2) = border_strip_boxes(image.shape[1], image.shape[0])
+    return strip_signature(image[ly1:ly2, lx1:lx2], image[ry1:ry2, rx1:rx2])
+
+
+def border_features(detection_data: Dict[str, Dict[str, Any]]) -> Tuple[List[str], List[str], List[str], np.ndarray]:
+    """
+    Extract the detection features from border analysis data.
+
+    Args:
+        detection_data: Border analysis results keyed by frame key (frames without both borders
+            are skipped)
+
+    Returns:
+        (keys, frame_ids, frame_names, (N, 6) float32 left + right average colors)
+    """
+    keys, frame_ids, frame_names, rows = [], [], [], []
+    for frame_key, frame_data in detection_data.items():
+        if "left_border" not in frame_data or "right_border" not in frame_data:
+            continue
+        keys.append(frame_key)
+        frame_ids.append(frame_data.get("frame_id", frame_key))
+        frame_names.append(frame_data.get("frame_name", frame_key))
+        rows.append(
+            list(frame_data["left_border"]["average_color"][:3]) + list(frame_data["right_border"]["average_color"][:3])
+        )
+    return keys, frame_ids, frame_names, np.array(rows, dtype=np.float32).reshape(-1, 6)
+
+
+class BorderClassifier:
+    """
+    Frame border colors compiled into one (N, 6) float32 matrix.
+
+    A signature is scored against every frame with a single broadcast: the Euclidean distance
+    of the left and right border colors, summed. The best frame is accepted when its score is
+    under max_score; its confidence is discounted when the runner-up is about as close as it
+    is, so frames with near-identical borders report low confidence.
+    """
+
+    def __init__(self, detection_data: Dict[str, Dict[str, Any]], max_score: float = MAX_SCORE):
+        """
+        Args:
+            detection_data: frame_detection.json contents keyed by frame key
+            max_score: Largest combined distance accepted as a match
+        """
+        self._setup(*border_features(detection_data), max_score=max_score)
+
+    @classmethod
+    def from_store(cls, store, max_score: float = MAX_SCORE) -> "BorderClassifier":
+        """Build from a compiled DetectionStore without re-reading the analysis data."""
+        classifier = cls.__new__(cls)
+        classifier._setup(store.keys, store.frame_ids, store.frame_names, store.features, max_score=max_score)
+        return classifier
+
+    def _setup(self, keys, frame_ids, frame_names, features: np.ndarray, max_score: float):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_score = max_score
+        self.keys: List[str] = list(keys)
+        self.frame_ids: List[str] = list(frame_ids)
+        self.frame_names: List[str] = list(frame_names)
+        self.matrix = np.ascontiguousarray(features, dtype=np.float32).reshape(-1, 6)
+        self._colors = self.matrix.reshape(-1, 2, 3)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    # ==============================
+    # Scoring
+    # ==============================
+
+    def scores(self, signature: np.ndarray) -> np.ndarray:
+        """(N,) combined left + right border distance per frame (lower = better)."""
+        diff = self._colors - np.asarray(signature, dtype=np.float32).reshape(1, 2, 3)
+        return np.sqrt(np.einsum("nsc,nsc->ns", diff, diff)).sum(axis=1)
+
+    def rank(self, signature: np.ndarray, top: int = 3) -> List[Dict[str, Any]]:
+        """Best top frames for the signature, best first, as {frame_id, frame_name, score}."""
+        scores = self.scores(signature)
+        return self._ranked(scores, self._order(scores, top))
+
+    def classify(self, signature: np.ndarray, top: int = 3) -> Optional[Dict[str, Any]]:
+        """
+        Best matching frame for a border signature.
+
+        Returns:
+            {frame_id, frame_name, confidence, score, margin, candidates} or None if no frame
+            scores under max_score
+        """
+        if not len(self):
+            return None
+
+        scores = self.scores(signature)
+        order = self._order(scores, max(top, 2))
+        best_score = float(scores[order[0]])
+        if best_score >= self.max_score:
+            return None
+
+        margin = float(scores[order[1]]) - best_score if len(order) > 1 else float("inf")
+        # Closeness as before; discounted only when the runner-up is within the best frame's own distance
+        closeness = max(0.0, min(1.0, 1.0 - best_score / (2 * self.max_score)))
+        separation = min(1.0, margin / max(best_score, 1e-6))
+        best = int(order[0])
+        return {
+            "frame_id": self.frame_ids[best],
+            "frame_name": self.frame_names[best],
+            "confidence": closeness * separation,
+            "score": best_score,
+            "margin": margin,
+            "candidates": self._ranked(scores, order[:top]),
+        }
+
+    def _order(self, scores: np.ndarray, top: int) -> np.ndarray:
+        """Indices of the top lowest scores, sorted (ties keep data order)."""
+        if top < len(scores):
+            candidates = np.argpartition(scores, top)[:top]
+            return candidates[np.lexsort((candidates, scores[candidates]))]
+        return np.argsort(scores, kind="stable")
+
+    def _ranked(self, scores: np.ndarray, order: np.ndarray) -> List[Dict[str, Any]]:
+        return [
+            {
+                "frame_id": self.frame_ids[i],
+                "frame_name": self.frame_names[i],
+                "score": float(scores[i]),
+            }
+            for i in order.tolist()
+        ]
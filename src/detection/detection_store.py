@@ -0,0 +1,142 @@
+"""
+Detection Store
+Compiled frame detection features, rebuilt from the border analysis JSON when it changes.
+
+Layout of frame_detection.npz (uncompressed, loaded with allow_pickle=False):
+    schema_version  - int32 scalar, SCHEMA_VERSION at build time
+    source_hash     - sha256 hex digest of the source JSON bytes
+    keys            - (N,) unicode frame keys ("1.1_Iron_Mine")
+    frame_ids       - (N,) unicode frame IDs ("1.1")
+    frame_names     - (N,) unicode frame names ("Iron Mine")
+    features        - (N, 6) float32 left + right average border colors
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from .border_classifier import border_features
+
+CONFIG_DATA_DIR = Path(__file__).parent.parent.parent / "config" / "data"
+FRAME_DETECTION_JSON = CONFIG_DATA_DIR / "frame_detection.json"
+DETECTION_STORE_FILE = CONFIG_DATA_DIR / "frame_detection.npz"
+
+SCHEMA_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def source_hash(path: Union[str, Path]) -> str:
+    """sha256 hex digest of a file's bytes."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+class DetectionStore:
+    """
+    The numeric features frame detection needs, and nothing else.
+
+    Built from a border analysis JSON (either frame_detection.json keyed by frame, or an
+    AnalysisDatabase file with an "analyses" section) and saved as a small .npz of plain
+    arrays, so loading never unpickles anything.
+    """
+
+    def __init__(self, keys, frame_ids, frame_names, features: np.ndarray, source_hash: str = ""):
+        self.keys = [str(key) for key in keys]
+        self.frame_ids = [str(frame_id) for frame_id in frame_ids]
+        self.frame_names = [str(name) for name in frame_names]
+        self.features = np.ascontiguousarray(features, dtype=np.float32).reshape(-1, 6)
+        self.source_hash = source_hash
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_json(cls, source: Union[str, Path]) -> "DetectionStore":
+        """Compile the store from a border analysis JSON file."""
+        raw = Path(source).read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        if "analyses" in data:
+            data = data["analyses"]
+        keys, frame_ids, frame_names, features = border_features(data)
+        return cls(keys, frame_ids, frame_names, features, hashlib.sha256(raw).hexdigest())
+
+    # ==============================
+    # Persistence
+    # ==============================
+
+    def save(self, path: Union[str, Path] = DETECTION_STORE_FILE):
+        """Write the store atomically as an uncompressed .npz."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            temp_path,
+            schema_version=np.int32(SCHEMA_VERSION),
+            source_hash=np.array(self.source_hash),
+            keys=np.array(self.keys, dtype=str),
+            frame_ids=np.array(self.frame_ids, dtype=str),
+            frame_names=np.array(self.frame_names, dtype=str),
+            features=self.features,
+        )
+        temp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DETECTION_STORE_FILE) -> "DetectionStore":
+        """
+        Read a saved store.
+
+        Raises:
+            ValueError: If the file was written with a different schema version
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            version = int(archive["schema_version"])
+            if version != SCHEMA_VERSION:
+                raise ValueError(f"Detection store schema {version} != {SCHEMA_VERSION}")
+            return cls(
+                archive["keys"].tolist(),
+                archive["frame_ids"].tolist(),
+                archive["frame_names"].tolist(),
+                archive["features"],
+                str(archive["source_hash"]),
+            )
+
+
+def load_detection_store(
+    source: Union[str, Path] = FRAME_DETECTION_JSON, path: Union[str, Path] = DETECTION_STORE_FILE
+) -> Optional[DetectionStore]:
+    """
+    Load the compiled detection store, rebuilding it when the source analysis has changed.
+
+    The saved store is used only if its schema version matches and its source hash equals the
+    current source file's; otherwise it is recompiled from source and saved. Without a source
+    file an existing store is used as-is.
+
+    Returns:
+        The store, or None if neither a usable store nor the source exists
+    """
+    source, path = Path(source), Path(path)
+    current_hash = source_hash(source) if source.exists() else None
+
+    if path.exists():
+        try:
+            store = DetectionStore.load(path)
+            if current_hash is None or store.source_hash == current_hash:
+                return store
+            logger.debug(f"{source.name} changed since {path.name} was built, rebuilding")
+        except Exception as e:
+            logger.warning(f"Could not load detection store {path}: {e}")
+
+    if current_hash is None:
+        return None
+
+    store = DetectionStore.from_json(source)
+    try:
+        store.save(path)
+        logger.debug(f"Compiled {len(store)} frames from {source.name} into {path.name}")
+    except Exception as e:
+        logger.warning(f"Could not save detection store {path}: {e}")
+    return store
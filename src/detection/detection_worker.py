@@ -0,0 +1,96 @@
+"""
+Detection Worker
+Runs frame detection on a background thread and publishes results to the GUI via signals.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+DetectionResult = Tuple[bool, Optional[Dict[str, Any]]]
+
+
+class DetectionWorker(QObject):
+    """
+    Background frame detection with coalesced requests.
+
+    request() only flags that a detection is wanted; the worker thread runs the detect callable
+    once per flag, so requests arriving while a detection is in progress collapse into a single
+    follow-up run. Results are emitted through detection_ready, which Qt delivers on the
+    receiver's (GUI) thread.
+    """
+
+    detection_ready = pyqtSignal(bool, object)  # (detected, frame_info or None)
+
+    def __init__(self, detect: Callable[[], DetectionResult]):
+        """
+        Args:
+            detect: Callable run on the worker thread, returning (detected, frame_info)
+        """
+        super().__init__()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._detect = detect
+
+        self._requested = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Statistics
+        self.requests = 0
+        self.runs = 0
+
+    # ==============================
+    # Lifecycle
+    # ==============================
+
+    def start(self):
+        """Start the worker thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="DetectionWorker", daemon=True)
+        self._thread.start()
+        self.logger.debug("Detection worker started")
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the worker thread; a detection in progress finishes but is not followed by another."""
+        self._running = False
+        self._requested.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==============================
+    # Requests
+    # ==============================
+
+    def request(self):
+        """Ask for a detection; coalesces with any request not yet started."""
+        self.requests += 1
+        self._requested.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "runs": self.runs, "coalesced": max(0, self.requests - self.runs)}
+
+    def _run(self):
+        while self._running:
+            self._requested.wait()
+            self._requested.clear()
+            if not self._running:
+                break
+
+            try:
+                detected, frame_info = self._detect()
+            except Exception as e:
+                self.logger.error(f"Frame detection failed: {e}")
+                detected, frame_info = False, None
+
+            self.runs += 1
+            if self._running:
+                self.detection_ready.emit(detected, frame_info)
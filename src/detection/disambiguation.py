@@ -0,0 +1,187 @@
+"""
+Disambiguation
+Probe points that tell apart frames whose border colors collide, evaluated in one gather.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from capture.color_palette import BUTTON_COLORS
+
+from .border_classifier import BorderClassifier
+
+# Combined border distance under which two frames cannot be told apart by their borders
+COLLISION_DISTANCE = 2.0
+
+# Per-channel tolerance of a probe match (looser than automation to absorb hover/state shading)
+PROBE_TOLERANCE = 15
+
+
+class ProbeGroup:
+    """
+    Probes for one group of frames with colliding borders.
+
+    Every button of every frame in the group is a probe: a percent position and the colors
+    (any state) that button's family shows. Probes are stored as flat arrays so one gather
+    reads them all from a frame image.
+    """
+
+    __slots__ = ("frame_ids", "frame_names", "px", "py", "owner", "expected")
+
+    def __init__(self, frame_ids: List[str], frame_names: List[str], probes: List[Tuple[float, float, int, list]]):
+        """
+        Args:
+            frame_ids: Frame IDs in the group (data order; the first wins ties)
+            frame_names: Matching frame names
+            probes: (x_percent, y_percent, owner index into frame_ids, [(r, g, b), ...])
+        """
+        self.frame_ids = frame_ids
+        self.frame_names = frame_names
+        self.px = np.array([p[0] for p in probes], dtype=np.float64)
+        self.py = np.array([p[1] for p in probes], dtype=np.float64)
+        self.owner = np.array([p[2] for p in probes], dtype=np.intp)
+        states = max((len(p[3]) for p in probes), default=1)
+        # Pad families with fewer states by repeating their first color
+        self.expected = np.array(
+            [list(p[3]) + [p[3][0]] * (states - len(p[3])) for p in probes], dtype=np.int16
+        ).reshape(-1, states, 3)
+
+
+class DisambiguationProbes:
+    """
+    Data-driven secondary detection.
+
+    Collision groups come from the compiled border features: frames closer than
+    collision_distance are grouped (transitively). Each group's probes are generated from the
+    frames_database button definitions, so frames that share borders are resolved without any
+    frame-specific code. resolve() gathers every probe of the group from a single frame image
+    and picks the frame whose own buttons match best.
+    """
+
+    def __init__(
+        self,
+        classifier: BorderClassifier,
+        frames_database: Dict[str, Dict[str, Any]],
+        collision_distance: float = COLLISION_DISTANCE,
+        tolerance: int = PROBE_TOLERANCE,
+        colors: Optional[Dict[str, Dict[str, Tuple[int, int, int]]]] = None,
+    ):
+        """
+        Args:
+            classifier: Border classifier whose features define the collisions
+            frames_database: frames_database.json frames keyed by frame ID
+            collision_distance: Largest combined border distance treated as a collision
+            tolerance: Per-channel tolerance of a probe match
+            colors: {family: {state: (r, g, b)}} (default: BUTTON_COLORS)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.tolerance = tolerance
+        self.colors = colors or BUTTON_COLORS
+        self.groups: List[ProbeGroup] = []
+        self._group_of: Dict[str, ProbeGroup] = {}
+
+        for members in self._collision_groups(classifier, collision_distance):
+            frame_ids = [classifier.frame_ids[i] for i in members]
+            frame_names = [classifier.frame_names[i] for i in members]
+            probes = []
+            for owner, frame_id in enumerate(frame_ids):
+                for name, button in frames_database.get(frame_id, {}).get("buttons", {}).items():
+                    # Placeholder buttons ("1": [1, 1, 1]) have no color family
+                    if len(button) != 3 or button[2] not in self.colors:
+                        continue
+                    probes.append((button[0], button[1], owner, list(self.colors[button[2]].values())))
+            if not probes:
+                self.logger.warning(f"No button probes to tell apart frames {frame_ids}")
+                continue
+            group = ProbeGroup(frame_ids, frame_names, probes)
+            self.groups.append(group)
+            self._group_of.update((frame_id, group) for frame_id in frame_ids)
+
+    @staticmethod
+    def _collision_groups(classifier: BorderClassifier, collision_distance: float) -> List[List[int]]:
+        """Indices of frames whose borders collide, grouped transitively, in data order."""
+        parent = list(range(len(classifier)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i in range(len(classifier)):
+            close = np.flatnonzero(classifier.scores(classifier.matrix[i]) < collision_distance)
+            for j in close[close > i].tolist():
+                parent[find(j)] = find(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(classifier)):
+            groups.setdefault(find(i), []).append(i)
+        return [members for members in groups.values() if len(members) > 1]
+
+    def needs_disambiguation(self, frame_id: str) -> bool:
+        """True if the frame shares its borders with another frame."""
+        return frame_id in self._group_of
+
+    def _pixels(self, group: ProbeGroup, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Frame pixel (x, y) of every probe of group for a width x height frame."""
+        xs = np.clip((group.px * width).astype(np.intp), 0, width - 1)
+        ys = np.clip((group.py * height).astype(np.intp), 0, height - 1)
+        return xs, ys
+
+    def probe_region(self, frame_id: str, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Frame-relative (x1, y1, x2, y2) bbox covering every probe that could resolve frame_id.
+
+        Capturing just this region is enough for resolve(); None if the frame has no collisions.
+        """
+        group = self._group_of.get(frame_id)
+        if group is None:
+            return None
+        xs, ys = self._pixels(group, width, height)
+        return (int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1)
+
+    def resolve(
+        self,
+        frame_id: str,
+        image: np.ndarray,
+        frame_size: Optional[Tuple[int, int]] = None,
+        offset: Tuple[int, int] = (0, 0),
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Decide between the frames colliding with frame_id from one frame image.
+
+        Args:
+            frame_id: Frame ID from primary (border) detection
+            image: (H, W, 3) RGB array of the frame area, or of the part given by offset
+            frame_size: (width, height) of the whole frame area (default: the image size)
+            offset: Frame-relative (x, y) of the image's top-left pixel, e.g. a probe_region() capture
+
+        Returns:
+            {frame_id, frame_name, scores: {frame_id: fraction of its probes matched}}, or None
+            if the frame has no collisions or no frame is ahead of the others
+        """
+        group = self._group_of.get(frame_id)
+        if group is None:
+            return None
+
+        width, height = frame_size if frame_size is not None else (image.shape[1], image.shape[0])
+        xs, ys = self._pixels(group, width, height)
+        xs, ys = xs - offset[0], ys - offset[1]
+        if xs.min() < 0 or ys.min() < 0 or xs.max() >= image.shape[1] or ys.max() >= image.shape[0]:
+            raise ValueError(f"Image at offset {offset} does not cover the probes of {group.frame_ids}")
+        pixels = image[ys, xs, :3].astype(np.int16)
+
+        # (P,) probe matches any state color of its family within tolerance
+        matched = (np.abs(pixels[:, None, :] - group.expected) <= self.tolerance).all(axis=2).any(axis=1)
+        counts = np.bincount(group.owner, minlength=len(group.frame_ids))
+        hits = np.bincount(group.owner, weights=matched, minlength=len(group.frame_ids))
+        fractions = np.divide(hits, counts, out=np.zeros(len(counts)), where=counts > 0)
+
+        scores = dict(zip(group.frame_ids, fractions.tolist()))
+        best = int(np.argmax(fractions))
+        if fractions[best] <= 0 or np.count_nonzero(fractions == fractions[best]) > 1:
+            self.logger.debug(f"Probes could not separate {group.frame_ids}: {scores}")
+            return None
+        return {"frame_id": group.frame_ids[best], "frame_name": group.frame_names[best], "scores": scores}
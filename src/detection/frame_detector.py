@@ -1,15 +1,17 @@
 import logging
 import json
-import pickle
 import os
-import time
-import numpy as np
 from pathlib import Path
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QWidget, QPushButton, QLabel
 
 from utility.logging_utils import LoggerMixin
-from utility.window_utils import get_frame_screenshot
+from capture.backends import get_capture_backend
+from detection.border_classifier import BorderClassifier, border_strip_boxes, strip_fingerprint, strip_signature
+from capture.synthetic_frame import load_frames_database
+from detection.detection_store import load_detection_store
+from detection.disambiguation import DisambiguationProbes
+from detection.detection_worker import DetectionWorker
 from utility.coordinate_utils import conv_frame_percent_to_screen_coords
 
 
@@ -52,8 +54,15 @@ class FrameDetector(QWidget, LoggerMixin):
 
         # Frame detection data cache
         self._frame_detection_data = None  # Cached data to avoid repeated loading
+        self._border_classifier = None  # Border colors compiled from the detection data
+        self._disambiguation = None  # Probes for frames whose borders collide
         self._current_frame_info = None  # Cache current frame detection result
-        self._last_detection_time = 0  # Timestamp of last detection
+        self._border_fingerprint = None  # (frame area, border strip hash) the cached result belongs to
+
+        # Detection runs on a worker thread; the GUI only sees the latest published result
+        self._detection = (False, None)
+        self._detection_worker = DetectionWorker(self.detect_current_frame)
+        self._detection_worker.detection_ready.connect(self.on_detection_ready)
 
         # Logging throttling to prevent spam
         self._last_log_message = None
@@ -72,7 +81,8 @@ class FrameDetector(QWidget, LoggerMixin):
         # Create the green start button
         self.setup_button()
 
-        # Setup visibility update timer
+        # Start background detection and the visibility update timer
+        self._detection_worker.start()
         self.setup_visibility_timer()
 
         self.logging.debug("FrameDetector initialized")
@@ -166,6 +176,7 @@ class FrameDetector(QWidget, LoggerMixin):
     def setup_visibility_timer(self):
         """Setup timer to regularly check visibility conditions."""
         self.visibility_timer = QTimer()
+        self.visibility_timer.timeout.connect(self._detection_worker.request)
         self.visibility_timer.timeout.connect(self.update_visibility)
         self.visibility_timer.start(1000)  # Check every 1 second (reduced from 500ms)
 
@@ -234,8 +245,8 @@ class FrameDetector(QWidget, LoggerMixin):
         if not self.main_window.isVisible():
             return False
 
-        # Frame detection - implement actual detection logic
-        frame_detected, detected_frame = self.detect_current_frame()
+        # Frame detection - latest result published by the detection worker
+        frame_detected, detected_frame = self._detection
         if not frame_detected:
             return False
 
@@ -255,16 +266,18 @@ class FrameDetector(QWidget, LoggerMixin):
         # All conditions met - button should be visible
         return True
 
+    def on_detection_ready(self, detected, frame_info):
+        """Store a detection result published by the worker and refresh the button (GUI thread)."""
+        self._detection = (detected, frame_info)
+        self.update_visibility()
+
     def detect_current_frame(self):
         """
         Detect the current frame using border analysis data.
+        Runs on the detection worker thread. Border strips are captured and fingerprinted each
+        call; classification re-runs only when the fingerprint or the frame area changes.
         Returns (detected: bool, frame_info: dict or None)
         """
-        # Cache detection results for 2 seconds to avoid repeated analysis
-        current_time = time.time()
-        if self._current_frame_info is not None and current_time - self._last_detection_time < 2.0:
-            return True, self._current_frame_info
-
         # Load frame detection data once and cache it
         if self._frame_detection_data is None:
             self._frame_detection_data = self.load_frame_detection_data()
@@ -280,42 +293,39 @@ class FrameDetector(QWidget, LoggerMixin):
         if not frame_area:
             return False, None
 
+        # Only the two border strips are captured each tick, plus the probe region of the current
+        # frame when it shares its borders with another frame
+        current = self._current_frame_info
+        captured = self.capture_border_strips(frame_area, current.get("frame_id") if current else None)
+        if captured is None:
+            self._border_fingerprint = None
+            return False, None
+        left, right, probes = captured
+
+        # Same frame area and identical borders - keep the previous result
+        fingerprint = (self._area_key(frame_area), strip_fingerprint(left, right))
+        if fingerprint == self._border_fingerprint:
+            detected_frame = self._current_frame_info
+            if detected_frame and self.needs_secondary_detection(detected_frame):
+                # Identical-border frames can switch without the borders changing
+                detected_frame = self._run_secondary_detection(detected_frame, frame_area, probes)
+                self._log_detection_change(detected_frame)
+                self._current_frame_info = detected_frame
+            return (True, detected_frame) if detected_frame else (False, None)
+
         try:
             # Primary detection: Analyze borders using cached frame detection data
-            detected_frame = self.analyze_frame_borders(frame_area)
+            detected_frame = self.analyze_frame_borders(left, right)
 
-            # Secondary detection for identical frames (Gyroscope Fabricator vs Widget Spinner)
+            # Secondary detection for frames with identical borders (e.g. Gyroscope Fabricator vs Widget Spinner)
             if detected_frame and self.needs_secondary_detection(detected_frame):
-                secondary_result = self.secondary_frame_detection(detected_frame, frame_area)
-                detected_frame = secondary_result
+                detected_frame = self._run_secondary_detection(detected_frame, frame_area, probes)
 
-            # Log only on state changes (frame ID or detection method change)
-            if detected_frame:
-                current_frame_id = detected_frame.get("frame_id")
-                current_method = detected_frame.get("detection_method")
-
-                # Check if this is a state change worth logging
-                if current_frame_id != self._last_detected_frame_id or current_method != self._last_detection_method:
-                    self.logging.debug(
-                        f"Frame detected: {detected_frame.get('frame_name', 'Unknown')} "
-                        f"(ID: {current_frame_id}, "
-                        f"Confidence: {detected_frame.get('confidence', 0):.2f}, "
-                        f"Method: {current_method})"
-                    )
-
-                    # Update state tracking
-                    self._last_detected_frame_id = current_frame_id
-                    self._last_detection_method = current_method
-            else:
-                # Log frame loss only once
-                if self._last_detected_frame_id is not None:
-                    self.logging.debug("Frame detection lost")
-                    self._last_detected_frame_id = None
-                    self._last_detection_method = None
+            self._log_detection_change(detected_frame)
 
-            # Cache the result
+            # Cache the result against the borders it was computed from
             self._current_frame_info = detected_frame
-            self._last_detection_time = current_time
+            self._border_fingerprint = fingerprint
 
             if detected_frame:
                 return True, detected_frame
@@ -324,81 +334,108 @@ class FrameDetector(QWidget, LoggerMixin):
 
         except Exception as e:
             self.logging.error(f"Frame detection failed: {e}")
+            self._border_fingerprint = None
             return False, None
 
-    def analyze_frame_borders(self, frame_area):
+    @staticmethod
+    def _area_key(frame_area):
+        return (frame_area["x"], frame_area["y"], frame_area["width"], frame_area["height"])
+
+    def capture_border_strips(self, frame_area, probe_frame_id=None):
+        """
+        Capture only the left and right border strips used for detection, and the probe region
+        of probe_frame_id if that frame needs secondary detection.
+        Returns (left, right, probes) or None; probes is (region, RGB array) or None.
+        """
+        x, y, width, height = self._area_key(frame_area)
+        try:
+            backend = get_capture_backend()
+            left_box, right_box = border_strip_boxes(width, height)
+            left, right = (backend.grab((x + x1, y + y1, x + x2, y + y2)) for x1, y1, x2, y2 in (left_box, right_box))
+        except Exception as e:
+            self._log_throttled("warning", f"Border strip capture failed: {e}", throttle_seconds=10)
+            return None
+        probes = self.capture_probe_region(frame_area, probe_frame_id) if probe_frame_id else None
+        return left, right, probes
+
+    def capture_probe_region(self, frame_area, frame_id):
+        """
+        Capture the frame-relative bbox covering the disambiguation probes for frame_id.
+        Returns (region, RGB array), or None if the frame has no twins or the capture failed.
+        """
+        if self._disambiguation is None:
+            return None
+        x, y, width, height = self._area_key(frame_area)
+        region = self._disambiguation.probe_region(frame_id, width, height)
+        if region is None:
+            return None
+        x1, y1, x2, y2 = region
+        try:
+            return region, get_capture_backend().grab((x + x1, y + y1, x + x2, y + y2))
+        except Exception as e:
+            self._log_throttled("warning", f"Probe region capture failed: {e}", throttle_seconds=10)
+            return None
+
+    def _run_secondary_detection(self, detected_frame, frame_area, probes=None):
+        """
+        Secondary detection from the probe region captured with the border strips. The region is
+        grabbed on its own only when the strips were captured for a frame in another group.
+        Keeps the primary result without a capture.
+        """
+        frame_id = detected_frame.get("frame_id")
+        _, _, width, height = self._area_key(frame_area)
+        if probes is None or probes[0] != self._disambiguation.probe_region(frame_id, width, height):
+            probes = self.capture_probe_region(frame_area, frame_id)
+        if probes is None:
+            self.logging.warning("Could not capture probe region for secondary detection")
+            return detected_frame
+        return self.secondary_frame_detection(detected_frame, probes, (width, height))
+
+    def _log_detection_change(self, detected_frame):
+        """Log only on state changes (frame ID or detection method change)."""
+        if detected_frame:
+            current_frame_id = detected_frame.get("frame_id")
+            current_method = detected_frame.get("detection_method")
+
+            # Check if this is a state change worth logging
+            if current_frame_id != self._last_detected_frame_id or current_method != self._last_detection_method:
+                self.logging.debug(
+                    f"Frame detected: {detected_frame.get('frame_name', 'Unknown')} "
+                    f"(ID: {current_frame_id}, "
+                    f"Confidence: {detected_frame.get('confidence', 0):.2f}, "
+                    f"Method: {current_method})"
+                )
+
+                # Update state tracking
+                self._last_detected_frame_id = current_frame_id
+                self._last_detection_method = current_method
+        else:
+            # Log frame loss only once
+            if self._last_detected_frame_id is not None:
+                self.logging.debug("Frame detection lost")
+                self._last_detected_frame_id = None
+                self._last_detection_method = None
+
+    def analyze_frame_borders(self, left_strip, right_strip):
         """
-        Analyze frame borders against cached border analysis data.
+        Analyze captured border strips against cached border analysis data.
         Uses the same percentage-based methodology as the analyze package.
         Returns the detected frame info or None.
         """
         if not self._frame_detection_data:
             return None
+        if self._border_classifier is None:
+            self._border_classifier = BorderClassifier.from_store(self._frame_detection_data)
+            try:
+                self._disambiguation = DisambiguationProbes(self._border_classifier, load_frames_database())
+            except Exception as e:
+                self.logging.error(f"Could not build disambiguation probes: {e}")
 
         try:
-            # Capture current frame screenshot
-            screenshot = get_frame_screenshot()
-            if screenshot is None:
-                self.logging.warning("Could not capture frame screenshot for border analysis")
-                return None
-
-            # Convert to numpy array for processing (same as analyze package)
-            img_array = np.array(screenshot)
-            height, width = img_array.shape[:2]
-
-            # Use same parameters as analyze package
-            border_inset = 0.05  # 5% inset from edge
-            center_strip = 0.2  # 20% center strip
-
-            # Extract left border using analyze package methodology
-            inset_width = int(width * border_inset)
-            strip_height = int(height * center_strip)
-
-            center_y = height // 2
-            start_y = center_y - strip_height // 2
-            end_y = start_y + strip_height
-
-            # Extract border regions (exact same method as analyze package)
-            left_border = img_array[start_y:end_y, 0:inset_width]
-            right_border_start_x = width - inset_width
-            right_border = img_array[start_y:end_y, right_border_start_x:width]
-
-            # Calculate average colors for left and right borders
-            left_avg_color = np.mean(left_border, axis=(0, 1))[:3]  # RGB only
-            right_avg_color = np.mean(right_border, axis=(0, 1))[:3]  # RGB only
-
-            # Find best matching frame using color similarity
-            best_match = None
-            best_score = float("inf")  # Lower score = better match
-
-            for frame_key, frame_data in self._frame_detection_data.items():
-                if "left_border" not in frame_data or "right_border" not in frame_data:
-                    continue
-
-                # Get stored border colors
-                stored_left_color = frame_data["left_border"]["average_color"]
-                stored_right_color = frame_data["right_border"]["average_color"]
-
-                # Calculate color distance (Euclidean distance in RGB space)
-                left_distance = np.sqrt(np.sum((left_avg_color - stored_left_color) ** 2))
-                right_distance = np.sqrt(np.sum((right_avg_color - stored_right_color) ** 2))
-
-                # Combined score (both borders must match reasonably well)
-                combined_score = left_distance + right_distance
-
-                # Threshold for acceptable match (adjust based on testing)
-                if combined_score < 100 and combined_score < best_score:  # Reasonable threshold
-                    best_score = combined_score
-                    best_match = frame_data
-
-            if best_match:
-                confidence = max(0.0, min(1.0, 1.0 - (best_score / 200)))  # Convert score to confidence
-                return {
-                    "frame_id": best_match["frame_id"],
-                    "frame_name": best_match["frame_name"],
-                    "confidence": confidence,
-                    "detection_method": "border_analysis",
-                }
+            # One broadcast distance over every stored frame's border colors
+            result = self._border_classifier.classify(strip_signature(left_strip, right_strip))
+            if result:
+                return {**result, "detection_method": "border_analysis"}
             else:
                 self._log_throttled("debug", "No suitable border match found", throttle_seconds=10)
                 return None
@@ -409,127 +446,39 @@ class FrameDetector(QWidget, LoggerMixin):
 
     def needs_secondary_detection(self, detected_frame):
         """
-        Check if frame needs secondary detection due to similarity conflicts.
+        Check if frame needs secondary detection because its borders collide with another frame's.
         Returns True if secondary detection is needed.
         """
-        if not detected_frame:
+        if not detected_frame or self._disambiguation is None:
             return False
 
-        frame_name = detected_frame.get("frame_name", "")
+        return self._disambiguation.needs_disambiguation(detected_frame.get("frame_id"))
 
-        # Frames that need secondary detection (from similarity analysis)
-        conflicting_frames = ["Gyroscope Fabricator", "Widget Spinner"]
-
-        return frame_name in conflicting_frames
-
-    def secondary_frame_detection(self, primary_detection, frame_area):
+    def secondary_frame_detection(self, primary_detection, probes, frame_size):
         """
         Secondary detection for frames with identical borders.
-        Uses red button analysis to disambiguate between Gyroscope Fabricator and Widget Spinner.
-        """
-        frame_name = primary_detection.get("frame_name", "")
-
-        # Handle Gyroscope Fabricator vs Widget Spinner conflict
-        if frame_name in ["Gyroscope Fabricator", "Widget Spinner"]:
-            disambiguated_frame = self.disambiguate_gyroscope_vs_spinner(frame_area)
-            if disambiguated_frame:
-                # Update both frame_name AND frame_id to match the correct frame
-                correct_frame_id = "2.3" if disambiguated_frame == "Gyroscope Fabricator" else "2.4"
-
-                return {
-                    **primary_detection,
-                    "frame_id": correct_frame_id,  # Fix: Update frame_id to match frame_name
-                    "frame_name": disambiguated_frame,
-                    "detection_method": "secondary_red_button",
-                    "confidence": 0.98,  # Higher confidence from secondary detection
-                }
-
-        return primary_detection
-
-    def disambiguate_gyroscope_vs_spinner(self, frame_area):
-        """
-        Disambiguate between Gyroscope Fabricator and Widget Spinner using red button analysis.
-        Returns the correct frame name or None.
+        Checks every probe of the colliding frames (their buttons) in one gather from the
+        (region, image) probe capture of a frame_size (width, height) frame area.
         """
-        try:
-            # Capture current frame screenshot
-            screenshot = get_frame_screenshot()
-            if screenshot is None:
-                self.logging.warning("Could not capture frame screenshot for button analysis")
-                return "Gyroscope Fabricator"  # Default fallback
-
-            # Define button positions (frame percentages converted to pixel coordinates)
-            # Gyroscope Fabricator: "create" button at [0.5312, 0.5661]
-            # Widget Spinner: "spin" button at [0.68305, 0.601352]
-
-            frame_width = screenshot.width
-            frame_height = screenshot.height
-
-            # Convert frame percentage coordinates to pixel coordinates
-            gyro_button_x = int(0.5312 * frame_width)
-            gyro_button_y = int(0.5661 * frame_height)
-
-            spinner_button_x = int(0.68305 * frame_width)
-            spinner_button_y = int(0.601352 * frame_height)
-
-            # Sample colors at button positions
-            gyro_button_color = screenshot.getpixel((gyro_button_x, gyro_button_y))
-            spinner_button_color = screenshot.getpixel((spinner_button_x, spinner_button_y))
-
-            # Define red button color ranges (from automation system)
-            red_colors = {"default": (199, 35, 21), "focus": (251, 36, 18), "inactive": (57, 23, 20)}
-
-            def is_red_button(color_tuple):
-                """Check if a color matches any red button state."""
-                r, g, b = color_tuple[:3]  # Handle both RGB and RGBA
-                tolerance = 15  # Slightly higher tolerance for detection
-
-                for state_color in red_colors.values():
-                    if all(
-                        abs(r - state_color[0]) <= tolerance
-                        and abs(g - state_color[1]) <= tolerance
-                        and abs(b - state_color[2]) <= tolerance
-                        for _ in [1]
-                    ):
-                        return True
-                return False
-
-            # Check which button position has a red button
-            gyro_has_red = is_red_button(gyro_button_color)
-            spinner_has_red = is_red_button(spinner_button_color)
-
-            # Throttled logging for button analysis
-            if gyro_has_red or spinner_has_red:
-                button_analysis_msg = (
-                    f"Button analysis - Gyro position {gyro_button_color}: {gyro_has_red}, "
-                    f"Spinner position {spinner_button_color}: {spinner_has_red}"
-                )
-                self._log_throttled("debug", button_analysis_msg, throttle_seconds=10)
-
-            # Determine frame based on button presence
-            result = None
-            if gyro_has_red and not spinner_has_red:
-                result = "Gyroscope Fabricator"
-            elif spinner_has_red and not gyro_has_red:
-                result = "Widget Spinner"
-            elif gyro_has_red and spinner_has_red:
-                # Both positions have red - this shouldn't happen, but prioritize Gyroscope
-                self.logging.warning("Both button positions show red - defaulting to Gyroscope Fabricator")
-                result = "Gyroscope Fabricator"
-            else:
-                # No red buttons found - might be wrong frame or inactive state
-                self._log_throttled(
-                    "warning",
-                    "No red buttons found at expected positions - defaulting to Gyroscope Fabricator",
-                    throttle_seconds=30,
-                )
-                result = "Gyroscope Fabricator"
+        region, image = probes
+        resolved = self._disambiguation.resolve(
+            primary_detection.get("frame_id"), image, frame_size=frame_size, offset=region[:2]
+        )
+        if resolved is None:
+            self._log_throttled(
+                "debug",
+                f"Secondary detection could not separate {primary_detection.get('frame_name')} from its twins",
+                throttle_seconds=30,
+            )
+            return primary_detection
 
-            return result
-
-        except Exception as e:
-            self.logging.error(f"Button detection failed: {e}")
-            return "Gyroscope Fabricator"  # Default fallback
+        return {
+            **primary_detection,
+            "frame_id": resolved["frame_id"],
+            "frame_name": resolved["frame_name"],
+            "detection_method": "secondary_probes",
+            "confidence": 0.98,  # Higher confidence from secondary detection
+        }
 
     def get_frame_item_from_cache(self, frame_id):
         """
@@ -556,7 +505,7 @@ class FrameDetector(QWidget, LoggerMixin):
         Legacy placeholder method - replaced by detect_current_frame().
         Kept for backward compatibility during transition.
         """
-        detected, frame_info = self.detect_current_frame()
+        detected, frame_info = self._detection
         return detected
 
     def update_visibility(self):
@@ -580,8 +529,8 @@ class FrameDetector(QWidget, LoggerMixin):
         """Handle start button click - demonstrate frame detection."""
         self.logging.info("FrameDetector start button clicked")
 
-        # Perform frame detection and report results
-        detected, frame_info = self.detect_current_frame()
+        # Report the latest detection result
+        detected, frame_info = self._detection
 
         if detected and frame_info:
             self.logging.info(
@@ -600,7 +549,7 @@ class FrameDetector(QWidget, LoggerMixin):
     def on_button_hover_enter(self, event):
         """Handle mouse entering the start button - show frame info."""
         # Get current frame detection info
-        detected, frame_info = self.detect_current_frame()
+        detected, frame_info = self._detection
 
         if detected and frame_info:
             frame_id = frame_info.get("frame_id", "N/A")
@@ -640,10 +589,17 @@ class FrameDetector(QWidget, LoggerMixin):
         if hasattr(self, "visibility_timer"):
             self.visibility_timer.stop()
 
+        # Stop background detection before releasing what it reads
+        self._detection_worker.stop()
+        self.logging.debug(f"Detection stats: {self._detection_worker.stats()}")
+
         # Clear cached data
         self._frame_detection_data = None
+        self._border_classifier = None
+        self._disambiguation = None
         self._current_frame_info = None
-        self._last_detection_time = 0
+        self._border_fingerprint = None
+        self._detection = (False, None)
 
         # Clear state tracking
         self._last_detected_frame_id = None
@@ -660,9 +616,9 @@ class FrameDetector(QWidget, LoggerMixin):
         """
         Stage frame detection files by copying latest border analysis to frame_detection files.
 
-        If frame_detection.json or frame_detection.pkl don't exist in config/data/,
-        copy the latest border_analysis file from config/analysis/ to config/data/frame_detection.json
-        and create a pickle version at config/data/frame_detection.pkl
+        If frame_detection.json doesn't exist in config/data/, copy the latest border_analysis
+        file from config/analysis/ to config/data/frame_detection.json. The compiled detection
+        store (frame_detection.npz) is built from it on first load.
         """
         # Define paths
         config_dir = Path(__file__).parent.parent.parent / "config"
@@ -670,10 +626,9 @@ class FrameDetector(QWidget, LoggerMixin):
         analysis_dir = config_dir / "analysis"
 
         frame_detection_json = data_dir / "frame_detection.json"
-        frame_detection_pkl = data_dir / "frame_detection.pkl"
 
-        # Check if either file already exists
-        if frame_detection_json.exists() or frame_detection_pkl.exists():
+        # Check if the source file already exists
+        if frame_detection_json.exists():
             self.logging.debug("Frame detection files already exist, skipping staging")
             return
 
@@ -699,47 +654,25 @@ class FrameDetector(QWidget, LoggerMixin):
             with open(frame_detection_json, "w", encoding="utf-8") as f:
                 json.dump(border_data, f, indent=2)
 
-            # Create pickle version for faster loading
-            with open(frame_detection_pkl, "wb") as f:
-                pickle.dump(border_data, f)
-
             self.logging.info(f"Staged frame detection files from {latest_border_file.name}")
             self.logging.debug(f"Created: {frame_detection_json}")
-            self.logging.debug(f"Created: {frame_detection_pkl}")
 
         except Exception as e:
             self.logging.error(f"Failed to stage frame detection files: {e}")
 
     def load_frame_detection_data(self):
         """
-        Load frame detection data from staged files.
-        Prefers pickle file for speed, falls back to JSON.
+        Load the compiled frame detection store (frame IDs, names and border color features).
+        Rebuilt from frame_detection.json whenever that file changes.
         This method should only be called once and the result cached.
         """
-        config_dir = Path(__file__).parent.parent.parent / "config"
-        data_dir = config_dir / "data"
-
-        frame_detection_pkl = data_dir / "frame_detection.pkl"
-        frame_detection_json = data_dir / "frame_detection.json"
-
         try:
-            # Try pickle first (faster)
-            if frame_detection_pkl.exists():
-                with open(frame_detection_pkl, "rb") as f:
-                    data = pickle.load(f)
-                    self.logging.debug("Loaded frame detection data from pickle file (cached for reuse)")
-                    return data
-
-            # Fall back to JSON
-            elif frame_detection_json.exists():
-                with open(frame_detection_json, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.logging.debug("Loaded frame detection data from JSON file (cached for reuse)")
-                    return data
-
-            else:
+            store = load_detection_store()
+            if store is None:
                 self.logging.warning("No frame detection data files found")
                 return None
+            self.logging.debug(f"Loaded frame detection store with {len(store)} frames (cached for reuse)")
+            return store
 
         except Exception as e:
             self.logging.error(f"Failed to load frame detection data: {e}")
@@ -1,10 +1,10 @@
-import json
+import argparse
 import logging
 import os
-import re
 import sys
-from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
+from typing import Mapping
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
@@ -22,8 +22,10 @@ from PyQt6.QtWidgets import (
 
 from automation.automation_controller import AutomationController
 from automation.global_hotkey_manager import GlobalHotkeyManager
+from capture.capture_scheduler import get_capture_scheduler
 from detection.frame_detector import FrameDetector
 from utility.cache_manager import get_cache_manager
+from utility.frame_store import get_frame_store
 from utility.logging_utils import setup_logging, LoggerMixin
 
 
@@ -64,29 +66,17 @@ class MainWindow(QMainWindow, LoggerMixin):
         # Disable context menu to prevent interference with right-click hotkey
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
 
-        self.window_manager.generate_db_cache()
+        # The frame buttons below need frames.cache, so wait for the first build
+        if not self.window_manager.generate_db_cache(wait=10.0):
+            self.log_error("Timed out waiting for frames.cache")
 
-        # Load frames from converted cache (screen coordinates)
-        frames_file = Path(__file__).parent.parent / "config" / "cache" / "frames.cache"
-        self.logging.debug(f"Loading frames from: {frames_file}")
-        try:
-            with open(frames_file, "r", encoding="utf-8") as f:
-                frames_data = json.load(f)
-            frames = frames_data.get("frames", [])
-            self.logging.info(f"Loaded {len(frames)} frames from database")
-        except FileNotFoundError:
-            self.log_error(f"Could not find frames database at {frames_file}")
-            frames = []
-
-        # Group frames by tier
-        tiers = defaultdict(list)
-        for frame in frames:
-            match = re.match(r"(\d+)\.\d+", frame.get("id", ""))
-            if match:
-                tier = int(match.group(1))
-            else:
-                tier = 0
-            tiers[tier].append(frame)
+        # Frames from the converted cache (screen coordinates), grouped by tier
+        frame_store = get_frame_store()
+        frame_store.refresh(force=True)
+        if not len(frame_store):
+            self.log_error(f"Could not load frames from {frame_store.path}")
+        self.logging.info(f"Loaded {len(frame_store)} frames from database")
+        tiers = {tier: [record.data for record in records] for tier, records in frame_store.tiers().items()}
 
         self.logging.debug(f"Grouped frames into {len(tiers)} tiers: {sorted(tiers.keys())}")
 
@@ -332,6 +322,14 @@ class MainWindow(QMainWindow, LoggerMixin):
         if hasattr(self, "frame_detector"):
             self.frame_detector.cleanup()
 
+        # Stop the shared capture thread
+        scheduler = get_capture_scheduler()
+        self.logging.info(f"Capture stats: {scheduler.stats()}")
+        scheduler.stop()
+
+        # Stop cache threads and persist the last cache state
+        self.window_manager.cleanup()
+
         event.accept()
 
     def setup_window_snapping(self):
@@ -400,8 +398,8 @@ class MainWindow(QMainWindow, LoggerMixin):
         item = frame.get("item", "")
 
         # Extract automation flags
-        can_automate = automation.get("can_automate", 0) if isinstance(automation, dict) else automation
-        programmed = automation.get("programmed", 0) if isinstance(automation, dict) else automation
+        can_automate = automation.get("can_automate", 0) if isinstance(automation, Mapping) else automation
+        programmed = automation.get("programmed", 0) if isinstance(automation, Mapping) else automation
 
         # Safe logging that handles emojis by encoding them as text
         safe_name = name.encode("ascii", "replace").decode("ascii")
@@ -613,9 +611,18 @@ def main():
 
     # Use module name for logger (standard practice)
     logger = logging.getLogger(__name__)
-    app = QApplication(sys.argv)
+
+    parser = argparse.ArgumentParser(description="Widget Automation Tool")
+    parser.add_argument(
+        "--record", metavar="DIR", help="Record every captured frame to a timestamped session under DIR"
+    )
+    args, qt_args = parser.parse_known_args()
+    app = QApplication([sys.argv[0]] + qt_args)
 
     get_cache_manager()
+    if args.record:
+        session = Path(args.record) / datetime.now().strftime("%Y%m%d_%H%M%S")
+        get_capture_scheduler().start_recording(session)
     window = MainWindow()
     window.show()
     logger.info("Application started successfully")
@@ -10,21 +10,20 @@ worrying about cache management or window enumeration performance.
 
 import json
 import logging
-import pyautogui
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
-import re
-import sys
+from typing import Any, Dict, Mapping, Optional
 
-import psutil
-import win32gui
-import win32process
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
+from capture.backends import get_capture_backend
+from utility.cache_writer import CacheWriter
+from utility.frame_store import get_frame_store
+from utility.frames_cache import FramesCacheBuilder
+from utility.window_backend import TARGET_PROCESS_NAME, WindowFinder, get_window_backend
+from utility.window_events import WindowEvent, create_window_event_source
+
 
-# Constants
-TARGET_PROCESS_NAME = "WidgetInc.exe"
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +39,8 @@ class CacheManager(QObject):
     # Signals for when window state changes
     window_found = pyqtSignal(dict)  # Emitted when window is found/changes
     window_lost = pyqtSignal()  # Emitted when window is lost
+    _window_event_received = pyqtSignal(object)  # Window event from the event source thread
+    frames_cache_ready = pyqtSignal(bool)  # frames.cache build finished (True if the file changed)
 
     def __init__(self):
         super().__init__()
@@ -49,12 +50,20 @@ class CacheManager(QObject):
         self._cache_log_dir = Path(__file__).parent.parent.parent / "logs" / "cache"
         self._cache_log_dir.mkdir(parents=True, exist_ok=True)
 
+        # Debug cache file, written by a debounced background writer
+        self._cache_writer = CacheWriter(Path(__file__).parent.parent.parent / "config" / "cache" / "cache.cache")
+        self._cache_writer.start()
+
         # Database file tracking
         self._frames_db_file = Path(__file__).parent.parent.parent / "config" / "data" / "frames_database.json"
         self._last_db_mtime = 0
         self._last_error_shown = None  # Track last error to avoid spam
         self._last_console_error_time = 0  # Track console error logging (every 10 seconds)
 
+        # frames.cache builds (keyed on database content and frame area) off the GUI thread
+        self._frames_cache = FramesCacheBuilder(self._frames_db_file, on_ready=self._on_frames_cache_built)
+        self._frames_cache.start()
+
         # Cache storage
         self._cache = {
             "window_info": None,
@@ -71,6 +80,15 @@ class CacheManager(QObject):
             "docking_side": "right",  # Default docking side: "left" or "right"
         }
 
+        # Target window lookup (re-checks the known handle before enumerating all windows)
+        self._window_finder = WindowFinder(get_window_backend(), process_name=TARGET_PROCESS_NAME)
+
+        # Move/resize/minimize/close events for the found window (hooks or adaptive polling)
+        self._window_event_pending = False
+        self._window_event_received.connect(self._on_window_event)
+        self._window_events = create_window_event_source(self._window_finder.backend)
+        self._window_events.start(self._queue_window_event)
+
         # Validation timer - checks every 1000ms (1 second)
         self._timer = QTimer()
         self._timer.timeout.connect(self._on_timer_tick)
@@ -88,16 +106,41 @@ class CacheManager(QObject):
         self.logger.debug("WindowManager initialized with 1000ms validation timer and database file watching")
 
     def _on_timer_tick(self):
-        """Handle timer tick - validate cache every tick, check database less frequently."""
+        """Handle timer tick - validate cache when window events can't, check database less frequently."""
         self._timer_tick_count += 1
 
-        # Always update coordinate cache
-        self._validate_cache()
+        # While window events track the window, the tick is only a periodic safety check
+        if not self._window_events_active() or self._timer_tick_count % 5 == 0:
+            self._validate_cache()
 
         # Check database every 6th tick (every 30 seconds instead of every 5 seconds)
         if self._timer_tick_count % 6 == 0:
             self._check_database_changes()
 
+    def cleanup(self):
+        """Stop the background threads, writing the final cache state before the writer exits."""
+        self._timer.stop()
+        self._window_events.stop()
+        self._frames_cache.stop()
+        self._save_cache_to_file()
+        self._cache_writer.stop()
+        self.logger.debug(f"Cache writer stats: {self._cache_writer.stats()}")
+
+    def _window_events_active(self) -> bool:
+        return self._window_events.is_running and self._window_events.handle is not None
+
+    def _queue_window_event(self, event: WindowEvent):
+        """Event source callback (source thread) - hand one pending update to the GUI thread."""
+        if not self._window_event_pending:
+            self._window_event_pending = True
+            self._window_event_received.emit(event)
+
+    def _on_window_event(self, event: WindowEvent):
+        """Apply a window change immediately; bursts of events coalesce into one validation."""
+        self._window_event_pending = False
+        self.logger.debug(f"Window event: {event}")
+        self._validate_cache()
+
     def _validate_cache(self):
         """Proactively validate and update cache if needed."""
         try:
@@ -116,6 +159,7 @@ class CacheManager(QObject):
                 self._cache["frame_area_refined"] = None
                 self._cache["refinement_failed"] = False
                 self._cache["overlay_position"] = None
+                self._window_events.watch(None)
                 self.window_lost.emit()
                 self._save_cache_to_file()
                 self.logger.debug("Window lost - cache cleared")
@@ -137,6 +181,8 @@ class CacheManager(QObject):
                     self._cache["monitor_info"] = self._get_monitor_info()
                     self._cache["leftmost_x_offset"] = self._get_leftmost_x_offset()
 
+                    if self._window_events.handle != current_window["hwnd"]:
+                        self._window_events.watch(current_window["hwnd"], current_window["pid"])
                     self.window_found.emit(current_window)
                     self._save_cache_to_file()
                     self.logger.debug("Window cache updated")
@@ -278,10 +324,8 @@ class CacheManager(QObject):
             self._last_console_error_time = current_time
 
     def _save_cache_to_file(self):
-        """Save current cache state to logs/cache/cache.cache for debugging."""
+        """Queue the current cache state for config/cache/cache.cache (written in the background for debugging)."""
         try:
-            cache_file = Path(__file__).parent.parent.parent / "config" / "cache" / "cache.cache"
-
             # Use cached values directly instead of recalculating
             cache_data = {
                 "timestamp": self._cache["timestamp"],
@@ -294,23 +338,7 @@ class CacheManager(QObject):
                 "leftmost_x_offset": self._cache.get("leftmost_x_offset"),
                 "last_state": self._cache["last_state"],
             }
-
-            with open(cache_file, "w", encoding="utf-8") as f:
-                # First pass: normal JSON with indentation
-                json_str = json.dumps(cache_data, indent=2, default=str)
-
-                # Second pass: compact coordinate arrays
-                import re
-
-                # Match arrays that span multiple lines with up to 4 numbers
-                pattern = r"\[\s*(-?\d+(?:\.\d+)?),?\s*\n\s*(-?\d+(?:\.\d+)?),?\s*\n\s*(-?\d+(?:\.\d+)?),?\s*\n\s*(-?\d+(?:\.\d+)?)\s*\]"
-                json_str = re.sub(pattern, r"[\1, \2, \3, \4]", json_str)
-
-                # Handle 2-element arrays too
-                pattern2 = r"\[\s*(-?\d+(?:\.\d+)?),?\s*\n\s*(-?\d+(?:\.\d+)?)\s*\]"
-                json_str = re.sub(pattern2, r"[\1, \2]", json_str)
-
-                f.write(json_str)
+            self._cache_writer.submit(cache_data)
 
         except Exception as e:
             self.logger.debug(f"Could not save cache to file: {e}")
@@ -379,26 +407,7 @@ class CacheManager(QObject):
     def _find_target_window(self) -> Optional[Dict[str, Any]]:
         """Find WidgetInc window - internal method."""
         try:
-
-            def enum_windows_callback(hwnd, _):
-                try:
-                    title = win32gui.GetWindowText(hwnd)
-                    if "WidgetInc" in title and win32gui.IsWindowVisible(hwnd):
-                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                        proc = psutil.Process(pid)
-                        if proc.name() == TARGET_PROCESS_NAME:
-                            window_info = self._build_window_info(pid, hwnd)
-                            if window_info:
-                                target_windows.append(window_info)
-                except Exception:
-                    pass
-                return True
-
-            target_windows = []
-            win32gui.EnumWindows(enum_windows_callback, None)
-
-            return target_windows[0] if target_windows else None
-
+            return self._window_finder.find()
         except Exception as e:
             self.logger.error(f"Error in window detection: {e}")
             return None
@@ -406,22 +415,11 @@ class CacheManager(QObject):
     def _find_overlay_window(self) -> Optional[int]:
         """Find the overlay window by title and return its width."""
         try:
-
-            def enum_windows_callback(hwnd, _):
-                try:
-                    title = win32gui.GetWindowText(hwnd)
-                    if "Widget Automation Tool" in title and win32gui.IsWindowVisible(hwnd):
-                        overlay_windows.append(hwnd)
-                except Exception:
-                    pass
-                return True
-
-            overlay_windows = []
-            win32gui.EnumWindows(enum_windows_callback, None)
+            backend = self._window_finder.backend
+            overlay_windows = backend.find_windows("Widget Automation Tool")
 
             if overlay_windows:
-                hwnd = overlay_windows[0]
-                window_rect = win32gui.GetWindowRect(hwnd)
+                window_rect = backend.window_rect(overlay_windows[0])
                 width = window_rect[2] - window_rect[0]  # right - left
                 self.logger.debug(f"Found overlay window with width: {width}")
                 return width
@@ -432,33 +430,6 @@ class CacheManager(QObject):
             self.logger.debug(f"Error finding overlay window: {e}")
             return None
 
-    def _build_window_info(self, pid: int, hwnd: int) -> Optional[Dict[str, Any]]:
-        """Build window information dictionary."""
-        try:
-            title = win32gui.GetWindowText(hwnd)
-            window_rect = win32gui.GetWindowRect(hwnd)
-            client_rect = win32gui.GetClientRect(hwnd)
-
-            # Calculate client area in screen coordinates (like tracker)
-            client_left_top = win32gui.ClientToScreen(hwnd, (client_rect[0], client_rect[1]))
-            client_right_bottom = win32gui.ClientToScreen(hwnd, (client_rect[2], client_rect[3]))
-            client_x = client_left_top[0]
-            client_y = client_left_top[1]
-            client_w = client_right_bottom[0] - client_left_top[0]
-            client_h = client_right_bottom[1] - client_left_top[1]
-
-            return {
-                "pid": pid,
-                "hwnd": hwnd,
-                "title": title,
-                "window_rect": window_rect,
-                "client_rect": client_rect,
-                "client_screen": {"x": client_x, "y": client_y, "width": client_w, "height": client_h},
-            }
-        except Exception as e:
-            self.logger.error(f"Error building window info: {e}")
-            return None
-
     def _calculate_frame_area(self) -> Optional[Dict[str, int]]:
         """
         Calculate 3:2 aspect ratio frame area using cached window info.
@@ -500,7 +471,7 @@ class CacheManager(QObject):
                 test_x = left_x + offset
                 if test_x > 0:
                     try:
-                        pixel = pyautogui.pixel(test_x - 1, validation_y)
+                        pixel = get_capture_backend().pixel(test_x - 1, validation_y)
                         if pixel == border_color:
                             left_x = test_x
                             self.logger.debug(f"Found correct left boundary at x={left_x}")
@@ -513,7 +484,7 @@ class CacheManager(QObject):
                     test_x = left_x - offset
                     if test_x > 0:
                         try:
-                            pixel = pyautogui.pixel(test_x - 1, validation_y)
+                            pixel = get_capture_backend().pixel(test_x - 1, validation_y)
                             if pixel == border_color:
                                 left_x = test_x
                                 self.logger.debug(f"Found correct left boundary at x={left_x} (moved left by {offset})")
@@ -619,183 +590,29 @@ class CacheManager(QObject):
             self.logger.error(f"Error calculating overlay position: {e}")
             return None
 
-    def _convert_colors_to_tuples(self, frame_data):
-        """Convert color arrays to tuples for pixel comparison."""
-        if "colors" in frame_data:
-            for color_key, color_value in frame_data["colors"].items():
-                if isinstance(color_value, list):
-                    if len(color_value) == 3 and all(isinstance(x, (int, float)) for x in color_value):
-                        # Single color [r, g, b] -> (r, g, b)
-                        frame_data["colors"][color_key] = tuple(color_value)
-                    elif all(isinstance(item, list) and len(item) == 3 for item in color_value):
-                        # List of colors [[r,g,b], [r,g,b]] -> [(r,g,b), (r,g,b)]
-                        frame_data["colors"][color_key] = [tuple(color) for color in color_value]
-        return frame_data
-
-    def _convert_coordinates_recursive(self, data, frame_area=None):
+    def generate_db_cache(self, wait: Optional[float] = None) -> bool:
         """
-        Recursively convert percentage coordinates and colors to screen coordinates.
-        Detects patterns automatically regardless of key names.
-        """
-        if isinstance(data, dict):
-            converted = {}
-            for key, value in data.items():
-                if key == "buttons":
-                    # Special handling for buttons (maintains existing behavior)
-                    converted[key] = self._convert_buttons(value)
-                else:
-                    # Recursive conversion for any nested dictionaries
-                    converted[key] = self._convert_coordinates_recursive(value, frame_area)
-            return converted
+        Bring frames.cache up to date with frames_database.json and the current frame area.
 
-        elif isinstance(data, list):
-            # Check if this is a coordinate/color pattern
-            return self._convert_list_pattern(data)
+        The build runs on the frames cache thread and is skipped when neither input changed;
+        frames_cache_ready is emitted when it finishes.
 
-        else:
-            return data
+        Args:
+            wait: Seconds to block until the build is done (None = return immediately)
 
-    def _convert_list_pattern(self, data):
-        """
-        Convert list patterns based on content detection:
-        [x, y] -> screen coordinates
-        [x1, y1, x2, y2] -> screen bbox
-        [r, g, b] -> unchanged (colors)
-        [[nested]] -> recursive conversion
+        Returns:
+            False if waiting timed out, True otherwise
         """
-        from .coordinate_utils import conv_frame_percent_to_screen_coords, conv_frame_percent_to_screen_bbox
-
-        if not isinstance(data, list) or len(data) == 0:
-            return data
-
-        # Check for nested lists (like color arrays or coordinate arrays)
-        if isinstance(data[0], list):
-            return [self._convert_list_pattern(item) for item in data]
-
-        # Check for coordinate patterns
-        if len(data) == 2 and all(isinstance(x, (int, float)) for x in data):
-            x, y = data
-            if 0 <= x <= 1 and 0 <= y <= 1:
-                # Percentage coordinates -> screen coordinates
-                screen_x, screen_y = conv_frame_percent_to_screen_coords(x, y)
-                return [screen_x, screen_y]
-
-        elif len(data) == 4 and all(isinstance(x, (int, float)) for x in data):
-            x1, y1, x2, y2 = data
-            if all(0 <= coord <= 1 for coord in data):
-                # Percentage bbox -> screen bbox
-                return list(conv_frame_percent_to_screen_bbox((x1, y1, x2, y2)))
-
-        elif len(data) == 3 and all(isinstance(x, int) for x in data):
-            # Check if it's RGB color values
-            if all(0 <= x <= 255 for x in data):
-                return data  # Colors stay unchanged
-
-        # If no pattern matches, return as-is
-        return data
-
-    def _convert_buttons(self, buttons_data):
-        """Convert buttons with special 3-element format [x, y, color]."""
-        from .coordinate_utils import conv_frame_percent_to_screen_coords
-
-        converted_buttons = {}
-        for button_name, button_data in buttons_data.items():
-            if len(button_data) != 3:
-                self.logger.error(f"Invalid button data for {button_name}: {button_data}")
-                sys.exit("Exiting due to invalid database")
-            percent_x, percent_y, color = button_data
-            screen_x, screen_y = conv_frame_percent_to_screen_coords(percent_x, percent_y)
-            converted_buttons[button_name] = [screen_x, screen_y, color]
-        return converted_buttons
-
-    def _create_frame_coordinates(self, screen_data):
-        """
-        Create frame-relative coordinates from screen coordinates.
-        Handles the nested dictionary structure recursively.
-        """
-        if isinstance(screen_data, dict):
-            frame_data = {}
-            for key, value in screen_data.items():
-                if key == "buttons":
-                    # Skip buttons for frame coordinates (they're always screen-based)
-                    continue
-                frame_data[key] = self._create_frame_coordinates(value)
-            return frame_data
-
-        elif isinstance(screen_data, list):
-            return self._convert_screen_to_frame_pattern(screen_data)
-
-        else:
-            return screen_data
-
-    def _convert_screen_to_frame_pattern(self, screen_data):
-        """Convert screen coordinate patterns to frame-relative coordinates."""
-        from .coordinate_utils import conv_screen_coords_to_frame_coords
-
-        if not isinstance(screen_data, list) or len(screen_data) == 0:
-            return screen_data
-
-        # Handle nested lists
-        if isinstance(screen_data[0], list):
-            return [self._convert_screen_to_frame_pattern(item) for item in screen_data]
-
-        # Convert coordinate patterns
-        if len(screen_data) == 2 and all(isinstance(x, (int, float)) for x in screen_data):
-            # Screen coordinates -> frame coordinates
-            frame_x, frame_y = conv_screen_coords_to_frame_coords(screen_data[0], screen_data[1])
-            return [frame_x, frame_y]
-
-        elif len(screen_data) == 4 and all(isinstance(x, (int, float)) for x in screen_data):
-            # Screen bbox -> frame bbox
-            x1, y1, x2, y2 = screen_data
-            fx1, fy1 = conv_screen_coords_to_frame_coords(x1, y1)
-            fx2, fy2 = conv_screen_coords_to_frame_coords(x2, y2)
-            return [fx1, fy1, fx2, fy2]
-
-        elif len(screen_data) == 3 and all(isinstance(x, int) for x in screen_data):
-            # Colors stay unchanged
-            return screen_data
-
-        return screen_data
-
-    def generate_db_cache(self):
-        """Generate frames.cache with screen coordinates as main and frame coordinates as additional key."""
-        frames_file = Path(__file__).parent.parent.parent / "config" / "data" / "frames_database.json"
-        frames_cache = Path(__file__).parent.parent.parent / "config" / "cache" / "frames.cache"
-
-        with open(frames_file, "r") as f:
-            frames_data = json.load(f)
-
-        frames_with_coords = []
-
-        for frame in frames_data["frames"]:
-            # Process frame data with automatic coordinate conversion
-            frame_copy = self._convert_coordinates_recursive(frame.copy())
-
-            # Create frame-relative coordinates
-            frame_xy_data = self._create_frame_coordinates(frame_copy)
-            if isinstance(frame_copy, dict):
-                frame_copy["frame_xy"] = frame_xy_data
-
-            # Convert colors to tuples for pixel comparison
-            frame_copy = self._convert_colors_to_tuples(frame_copy)
-
-            frames_with_coords.append(frame_copy)
-
-        frames_cache.parent.mkdir(exist_ok=True)
-        json_str = json.dumps({"frames": frames_with_coords}, indent=2, separators=(",", ": "))
-
-        # Compact 2-4 element arrays to a single line
-        json_str = re.sub(
-            r"\[\s*(-?\d+(?:\.\d+)?),?\s*\n\s*(-?\d+(?:\.\d+)?),?\s*\n\s*(-?\d+(?:\.\d+)?)(?:,?\s*\n\s*(-?\d+(?:\.\d+)?))?\s*\]",
-            lambda m: "[" + ", ".join(filter(None, m.groups())) + "]",
-            json_str,
-        )
-
-        with open(frames_cache, "w") as f:
-            f.write(json_str)
+        self._frames_cache.request(self.get_frame_area())
+        if wait is None:
+            return True
+        return self._frames_cache.wait(wait)
 
-        self.logger.info(f"Generated coordinate cache with automatic pattern detection at {frames_cache}")
+    def _on_frames_cache_built(self, changed: bool):
+        """Frames cache thread: make the frame store pick up a rewritten frames.cache and notify listeners."""
+        if changed:
+            get_frame_store().invalidate()
+        self.frames_cache_ready.emit(changed)
 
     # Public API methods
     def get_window_info(self) -> Optional[Dict[str, Any]]:
@@ -832,25 +649,12 @@ class CacheManager(QObject):
         """Check if WidgetInc window is currently available."""
         return self._cache["is_valid"] and self._cache["window_info"] is not None
 
-    def get_frame_data(self, frame_id: str) -> Optional[Dict[str, Any]]:
-        """Get frame data by ID with colors converted to tuples."""
-        # Load from frames.cache (or however you currently load frame data)
-        frames_cache = Path(__file__).parent.parent.parent / "config" / "cache" / "frames.cache"
-
-        try:
-            with open(frames_cache, "r", encoding="utf-8") as f:
-                frames_data = json.load(f)
-
-            for frame in frames_data.get("frames", []):
-                if frame.get("id") == frame_id:
-                    return self._convert_colors_to_tuples(frame.copy())
-
+    def get_frame_data(self, frame_id: str) -> Optional[Mapping[str, Any]]:
+        """Get read-only frame data by ID (colors as tuples) from the in-memory frame store."""
+        frame_data = get_frame_store().get(frame_id)
+        if frame_data is None:
             self.logger.warning(f"Frame {frame_id} not found in cache")
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error loading frame data for {frame_id}: {e}")
-            return None
+        return frame_data
 
     def get_monitor_info(self):
         """Public API: Get monitor info for the monitor containing the WidgetInc window."""
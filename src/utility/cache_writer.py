@@ -0,0 +1,165 @@
+"""
+Cache Writer
+Debounced background writer for debug cache files: coalesces bursts, skips unchanged content.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+# Multi-line arrays of up to 4 numbers and of 2 numbers, collapsed onto one line
+_NUMBER = r"(-?\d+(?:\.\d+)?)"
+_ARRAY4 = re.compile(
+    r"\[\s*" + _NUMBER + r",?\s*\n\s*" + _NUMBER + r",?\s*\n\s*" + _NUMBER + r",?\s*\n\s*" + _NUMBER + r"\s*\]"
+)
+_ARRAY2 = re.compile(r"\[\s*" + _NUMBER + r",?\s*\n\s*" + _NUMBER + r"\s*\]")
+
+
+def format_cache_json(data: Any) -> str:
+    """Indented JSON with coordinate arrays compacted onto one line."""
+    json_str = json.dumps(data, indent=2, default=str)
+    json_str = _ARRAY4.sub(r"[\1, \2, \3, \4]", json_str)
+    return _ARRAY2.sub(r"[\1, \2]", json_str)
+
+
+class CacheWriter:
+    """
+    Writes the latest submitted snapshot to a file from a background thread.
+
+    submit() only stores a copy of the data and wakes the writer, so callers never wait on
+    serialization or disk. The writer waits until no new snapshot has arrived for delay
+    seconds (at most max_delay after the first one), serializes the newest one, and writes it
+    via a temp file and rename only if its hash differs from the last file written.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        formatter: Callable[[Any], str] = format_cache_json,
+        delay: float = 0.25,
+        max_delay: float = 1.0,
+    ):
+        """
+        Args:
+            path: File to write
+            formatter: Turns a snapshot into the file's text
+            delay: Quiet period that ends a burst of submissions
+            max_delay: Longest a submitted snapshot waits during a continuous burst
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        self.formatter = formatter
+        self.delay = delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._pending: Optional[Any] = None
+        self._has_pending = False
+        self._first_submit = 0.0
+        self._last_submit = 0.0
+        self._last_hash: Optional[bytes] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Statistics
+        self.submitted = 0
+        self.written = 0
+        self.skipped = 0
+
+    # ==============================
+    # Lifecycle
+    # ==============================
+
+    def start(self):
+        """Start the writer thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="CacheWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Write any pending snapshot and stop the writer thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==============================
+    # Writing
+    # ==============================
+
+    def submit(self, data: Any):
+        """Queue a snapshot (copied) to be written; replaces any snapshot not yet written."""
+        snapshot = copy.deepcopy(data)
+        now = time.monotonic()
+        with self._cond:
+            if not self._has_pending:
+                self._first_submit = now
+            self._pending = snapshot
+            self._has_pending = True
+            self._last_submit = now
+            self.submitted += 1
+            self._cond.notify_all()
+
+    def flush(self) -> bool:
+        """Write the pending snapshot now on the calling thread. Returns True if the file changed."""
+        with self._cond:
+            if not self._has_pending:
+                return False
+            data, self._pending, self._has_pending = self._pending, None, False
+        return self._write(data)
+
+    def stats(self) -> Dict[str, int]:
+        return {"submitted": self.submitted, "written": self.written, "skipped": self.skipped}
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._has_pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+
+                # Debounce: wait for a quiet period, bounded by max_delay from the first submit
+                while self._running:
+                    now = time.monotonic()
+                    deadline = min(self._last_submit + self.delay, self._first_submit + self.max_delay)
+                    if now >= deadline:
+                        break
+                    self._cond.wait(deadline - now)
+                if not self._running:
+                    return
+            self.flush()
+
+    def _write(self, data: Any) -> bool:
+        try:
+            text = self.formatter(data)
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            if digest == self._last_hash:
+                self.skipped += 1
+                return False
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            temp_path.write_text(text, encoding="utf-8")
+            temp_path.replace(self.path)
+            self._last_hash = digest
+            self.written += 1
+            return True
+        except Exception as e:
+            self.logger.debug(f"Could not write {self.path}: {e}")
+            return False
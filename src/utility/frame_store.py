@@ -0,0 +1,197 @@
+"""
+Frame Store
+In-memory frames.cache indexed by frame ID and tier, reloaded only when the file changes.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .frames_cache import FRAMES_CACHE_FILE
+
+_TIER_PATTERN = re.compile(r"(\d+)\.\d+")
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: dicts become mapping proxies, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def frame_tier(frame_id: str) -> int:
+    """Tier number from a frame ID ("4.2" -> 4), 0 if the ID has no tier."""
+    match = _TIER_PATTERN.match(frame_id or "")
+    return int(match.group(1)) if match else 0
+
+
+class FrameRecord:
+    """One frame of frames.cache; data is the full frame as a read-only view."""
+
+    __slots__ = ("id", "name", "item", "tier", "data")
+
+    def __init__(self, data: Mapping[str, Any]):
+        self.id = data.get("id", "")
+        self.name = data.get("name", "Unknown")
+        self.item = data.get("item", "Unknown")
+        self.tier = frame_tier(self.id)
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"FrameRecord({self.id!r}, {self.name!r})"
+
+
+class FrameStore:
+    """
+    Parses frames.cache once and serves frames from memory.
+
+    Frames are frozen on load (see freeze()), so every caller can share the same view without
+    copying. Lookups by ID and by tier are dict hits. The file's mtime and size are checked at
+    most once per check_interval; if they changed the file is re-read, and only parsed again
+    when its content hash differs from the loaded one. invalidate() forces the check on the
+    next lookup (e.g. right after frames.cache was regenerated).
+    """
+
+    def __init__(self, path: Union[str, Path] = FRAMES_CACHE_FILE, check_interval: float = 1.0):
+        """
+        Args:
+            path: frames.cache file
+            check_interval: Seconds between file change checks
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._records: Dict[str, FrameRecord] = {}
+        self._ordered: Tuple[FrameRecord, ...] = ()
+        self._tiers: Dict[int, Tuple[FrameRecord, ...]] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._hash: Optional[bytes] = None
+        self._next_check = 0.0
+
+        # Statistics
+        self.loads = 0
+        self.checks = 0
+
+    # ==============================
+    # Loading
+    # ==============================
+
+    def invalidate(self):
+        """Check the file for changes on the next lookup."""
+        self._next_check = 0.0
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reload the frames if the file changed.
+
+        Args:
+            force: Check now, ignoring check_interval
+
+        Returns:
+            True if the frames were (re)loaded
+        """
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+
+        with self._lock:
+            if not force and now < self._next_check:
+                return False
+            self._next_check = now + self.check_interval
+            self.checks += 1
+
+            try:
+                stat = self.path.stat()
+            except OSError:
+                if self._stamp is not None:
+                    self.logger.warning(f"Frames cache {self.path} is gone, keeping {len(self._records)} frames")
+                return False
+
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp == self._stamp:
+                return False
+
+            try:
+                raw = self.path.read_bytes()
+                digest = hashlib.blake2b(raw, digest_size=16).digest()
+                self._stamp = stamp
+                if digest == self._hash:
+                    return False
+                frames = json.loads(raw.decode("utf-8")).get("frames", [])
+            except Exception as e:
+                self.logger.error(f"Error loading frames cache {self.path}: {e}")
+                return False
+
+            self._index(frames)
+            self._hash = digest
+            self.loads += 1
+            self.logger.debug(f"Loaded {len(self._records)} frames from {self.path.name}")
+            return True
+
+    def _index(self, frames: Iterable[Dict[str, Any]]):
+        ordered = tuple(FrameRecord(freeze(frame)) for frame in frames)
+        tiers: Dict[int, List[FrameRecord]] = {}
+        for record in ordered:
+            tiers.setdefault(record.tier, []).append(record)
+
+        # Swap in whole indexes so readers never see a half-built store
+        self._records = {record.id: record for record in ordered}
+        self._ordered = ordered
+        self._tiers = {tier: tuple(records) for tier, records in sorted(tiers.items())}
+
+    # ==============================
+    # Lookups
+    # ==============================
+
+    def get(self, frame_id: str) -> Optional[Mapping[str, Any]]:
+        """Read-only frame data for frame_id, or None if unknown."""
+        record = self.record(frame_id)
+        return record.data if record else None
+
+    def record(self, frame_id: str) -> Optional[FrameRecord]:
+        self.refresh()
+        return self._records.get(frame_id)
+
+    def frames(self) -> Tuple[FrameRecord, ...]:
+        """All frames in frames.cache order."""
+        self.refresh()
+        return self._ordered
+
+    def tier(self, tier: int) -> Tuple[FrameRecord, ...]:
+        """Frames of one tier in frames.cache order."""
+        self.refresh()
+        return self._tiers.get(tier, ())
+
+    def tiers(self) -> Mapping[int, Tuple[FrameRecord, ...]]:
+        """{tier: frames} sorted by tier."""
+        self.refresh()
+        return MappingProxyType(self._tiers)
+
+    def __contains__(self, frame_id: str) -> bool:
+        return self.record(frame_id) is not None
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._ordered)
+
+
+# Global FrameStore instance
+_frame_store = None
+
+
+def get_frame_store() -> FrameStore:
+    """Get the global FrameStore instance."""
+    global _frame_store
+    if _frame_store is None:
+        _frame_store = FrameStore()
+    return _frame_store
@@ -0,0 +1,368 @@
+"""
+Frames Cache
+Builds frames.cache from frames_database.json off the GUI thread, only when its inputs change.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+FRAMES_DATABASE_FILE = Path(__file__).parent.parent.parent / "config" / "data" / "frames_database.json"
+FRAMES_CACHE_FILE = Path(__file__).parent.parent.parent / "config" / "cache" / "frames.cache"
+
+# (x, y, width, height) of the frame area the coordinates were projected onto
+Area = Tuple[int, int, int, int]
+NO_AREA: Area = (0, 0, 0, 0)
+
+
+def area_key(frame_area: Optional[Dict[str, int]]) -> Area:
+    """Projection-relevant part of a frame area dict (NO_AREA if unknown)."""
+    if not frame_area:
+        return NO_AREA
+    return (frame_area["x"], frame_area["y"], frame_area["width"], frame_area["height"])
+
+
+# ==============================
+# Templates
+# ==============================
+
+
+class _Point:
+    """Frame percent point [x, y], projected to screen pixels."""
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float, y: float):
+        self.x, self.y = x, y
+
+    def project(self, area: Area) -> list:
+        return [int(area[0] + area[2] * self.x), int(area[1] + area[3] * self.y)]
+
+
+class _Box:
+    """Frame percent bbox [x1, y1, x2, y2], projected to screen pixels."""
+
+    __slots__ = ("x1", "y1", "x2", "y2")
+
+    def __init__(self, x1: float, y1: float, x2: float, y2: float):
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+
+    def project(self, area: Area) -> list:
+        x, y, width, height = area
+        return [
+            int(x + width * self.x1),
+            int(y + height * self.y1),
+            int(x + width * self.x2),
+            int(y + height * self.y2),
+        ]
+
+
+class _Button(_Point):
+    """Button [x_percent, y_percent, color family], projected to [screen_x, screen_y, color family]."""
+
+    __slots__ = ("color",)
+
+    def __init__(self, x: float, y: float, color: str):
+        super().__init__(x, y)
+        self.color = color
+
+    def project(self, area: Area) -> list:
+        return super().project(area) + [self.color]
+
+
+def _is_numbers(data: list) -> bool:
+    return all(isinstance(x, (int, float)) for x in data)
+
+
+def _compile_list(data: list) -> Any:
+    """
+    Detect the coordinate pattern of a list:
+    [x, y] -> point, [x1, y1, x2, y2] -> bbox (both only if within 0..1),
+    [[nested]] -> per item, anything else (colors included) -> unchanged
+    """
+    if not data:
+        return data
+    if isinstance(data[0], list):
+        return [_compile_list(item) if isinstance(item, list) else item for item in data]
+    if len(data) == 2 and _is_numbers(data) and all(0 <= v <= 1 for v in data):
+        return _Point(*data)
+    if len(data) == 4 and _is_numbers(data) and all(0 <= v <= 1 for v in data):
+        return _Box(*data)
+    return data
+
+
+def compile_frame(data: Any) -> Any:
+    """
+    Turn a frame from frames_database.json into a template with its coordinates marked.
+
+    Pattern detection happens once here; project() only evaluates the marked coordinates.
+
+    Raises:
+        ValueError: If a button is not [x_percent, y_percent, color]
+    """
+    if isinstance(data, dict):
+        compiled = {}
+        for key, value in data.items():
+            if key == "buttons":
+                buttons = {}
+                for name, button in value.items():
+                    if len(button) != 3:
+                        raise ValueError(f"Invalid button data for {name}: {button}")
+                    buttons[name] = _Button(*button)
+                compiled[key] = buttons
+            else:
+                compiled[key] = compile_frame(value)
+        return compiled
+    if isinstance(data, list):
+        return _compile_list(data)
+    return data
+
+
+def project(template: Any, area: Area) -> Any:
+    """Screen-coordinate data of a compiled template for one frame area."""
+    if isinstance(template, (_Point, _Box)):
+        return template.project(area)
+    if isinstance(template, dict):
+        return {key: project(value, area) for key, value in template.items()}
+    if isinstance(template, list):
+        return [project(item, area) for item in template]
+    return template
+
+
+def to_frame_coordinates(screen_data: Any, area: Area) -> Any:
+    """Frame-relative copy of screen data (buttons are left out, they are always screen based)."""
+    if isinstance(screen_data, dict):
+        return {key: to_frame_coordinates(value, area) for key, value in screen_data.items() if key != "buttons"}
+    if not isinstance(screen_data, list) or not screen_data:
+        return screen_data
+    if isinstance(screen_data[0], list):
+        return [to_frame_coordinates(item, area) if isinstance(item, list) else item for item in screen_data]
+    if len(screen_data) == 2 and _is_numbers(screen_data):
+        return [screen_data[0] - area[0], screen_data[1] - area[1]]
+    if len(screen_data) == 4 and _is_numbers(screen_data):
+        x1, y1, x2, y2 = screen_data
+        return [x1 - area[0], y1 - area[1], x2 - area[0], y2 - area[1]]
+    return screen_data
+
+
+def project_frames(templates: List[Any], area: Area) -> List[Dict[str, Any]]:
+    """frames.cache frames: screen coordinates plus a frame-relative "frame_xy" copy."""
+    frames = []
+    for template in templates:
+        frame = project(template, area)
+        if isinstance(frame, dict):
+            frame["frame_xy"] = to_frame_coordinates(frame, area)
+        frames.append(frame)
+    return frames
+
+
+# ==============================
+# Serialization
+# ==============================
+
+
+def dumps_cache(data: Any, indent: int = 2, _level: int = 0) -> str:
+    """Indented JSON with lists of plain values (coordinates, colors) kept on one line."""
+    if isinstance(data, dict):
+        if not data:
+            return "{}"
+        pad = " " * (indent * (_level + 1))
+        items = [f"{pad}{json.dumps(str(key))}: {dumps_cache(value, indent, _level + 1)}" for key, value in data.items()]
+        return "{\n" + ",\n".join(items) + "\n" + " " * (indent * _level) + "}"
+    if isinstance(data, (list, tuple)):
+        if not any(isinstance(item, (dict, list, tuple)) for item in data):
+            return "[" + ", ".join(json.dumps(item) for item in data) + "]"
+        pad = " " * (indent * (_level + 1))
+        items = [pad + dumps_cache(item, indent, _level + 1) for item in data]
+        return "[\n" + ",\n".join(items) + "\n" + " " * (indent * _level) + "]"
+    return json.dumps(data)
+
+
+# ==============================
+# Builder
+# ==============================
+
+
+class FramesCacheBuilder:
+    """
+    Keeps frames.cache in sync with (database content, frame area) on a background thread.
+
+    A build is keyed on the blake2b hash of frames_database.json and the frame area. When the
+    key matches the one in frames.cache nothing is done; when only the area changed the cached
+    templates are re-projected without re-parsing the database. Requests
+    arriving during a build collapse into one follow-up build for the latest area. on_ready is
+    called on the builder thread with True when frames.cache was rewritten, False when it was
+    already current or the build failed.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path] = FRAMES_DATABASE_FILE,
+        path: Union[str, Path] = FRAMES_CACHE_FILE,
+        on_ready: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Args:
+            database: frames_database.json
+            path: frames.cache to write
+            on_ready: Called after each build with whether frames.cache changed
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.database = Path(database)
+        self.path = Path(path)
+        self.on_ready = on_ready
+
+        self._cond = threading.Condition()
+        self._pending: Optional[Area] = None
+        self._busy = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Current templates and the key of the file on disk
+        self._db_stamp: Optional[Tuple[Tuple[int, int], str]] = None  # (mtime_ns, size), hash
+        self._db_hash: Optional[str] = None
+        self._templates: List[Any] = []
+        self._key: Optional[Tuple[str, Area]] = None
+
+        # Statistics
+        self.requests = 0
+        self.builds = 0
+        self.compiles = 0
+        self.projections = 0
+
+    # ==============================
+    # Lifecycle
+    # ==============================
+
+    def start(self):
+        """Start the builder thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="FramesCacheBuilder", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the builder thread; a build in progress finishes."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ==============================
+    # Requests
+    # ==============================
+
+    def request(self, frame_area: Optional[Dict[str, int]]):
+        """Ask for frames.cache to match the database and frame_area; replaces any request not yet started."""
+        with self._cond:
+            self._pending = area_key(frame_area)
+            self.requests += 1
+            self._cond.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until no build is pending or running. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending is None and not self._busy, timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "builds": self.builds,
+            "compiles": self.compiles,
+            "projections": self.projections,
+        }
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending is not None or not self._running)
+                if not self._running:
+                    return
+                area, self._pending = self._pending, None
+                self._busy = True
+
+            changed = False
+            try:
+                changed = self.build(area)
+            except Exception as e:
+                self.logger.error(f"Could not build {self.path.name}: {e}")
+
+            # Report before wait() returns, so waiters see the callback's effects
+            try:
+                if self.on_ready is not None:
+                    self.on_ready(changed)
+            except Exception as e:
+                self.logger.error(f"Frames cache ready callback failed: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    # ==============================
+    # Building
+    # ==============================
+
+    def build(self, area: Area = NO_AREA) -> bool:
+        """
+        Bring frames.cache up to date for area on the calling thread.
+
+        Returns:
+            True if frames.cache was rewritten
+        """
+        self.builds += 1
+
+        # The database is only read and hashed again when its mtime or size changed
+        stat = self.database.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        raw = None
+        if self._db_stamp is not None and self._db_stamp[0] == stamp:
+            db_hash = self._db_stamp[1]
+        else:
+            raw = self.database.read_bytes()
+            db_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            self._db_stamp = (stamp, db_hash)
+
+        if self._key is None:
+            self._key = self._read_key()
+        if self._key == (db_hash, area) and self.path.exists():
+            return False
+
+        if db_hash != self._db_hash:
+            if raw is None:
+                raw = self.database.read_bytes()
+            frames = json.loads(raw.decode("utf-8"))["frames"]
+            self._templates = [compile_frame(frame) for frame in frames]
+            self._db_hash = db_hash
+            self.compiles += 1
+
+        frames = project_frames(self._templates, area)
+        self.projections += 1
+
+        cache = {"source_hash": db_hash, "frame_area": list(area), "frames": frames}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temp_path.write_text(dumps_cache(cache), encoding="utf-8")
+        temp_path.replace(self.path)
+        self._key = (db_hash, area)
+
+        self.logger.info(f"Generated {self.path.name} for frame area {area} ({len(frames)} frames)")
+        return True
+
+    def _read_key(self) -> Optional[Tuple[str, Area]]:
+        """Key recorded in an existing frames.cache (None if missing or written by an older version)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return (data["source_hash"], tuple(data["frame_area"]))
+        except Exception:
+            return None
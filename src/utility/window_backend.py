@@ -0,0 +1,561 @@
+"""
+Window Backend
+Window discovery behind one interface, and a target-window finder with a cached-handle fast path.
+
+Benchmark (from src/):
+    python -m utility.window_backend --windows 50 200 1000 --iterations 500
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+Rect = Tuple[int, int, int, int]
+
+# Constants
+TARGET_WINDOW_TITLE = "WidgetInc"
+TARGET_PROCESS_NAME = "WidgetInc.exe"
+
+
+class WindowBackend(ABC):
+    """
+    Interface every window-system backend implements.
+
+    Handles are opaque integers (HWND on Windows, XID on X11). window_rect() is the outer
+    window in screen coordinates; client_rect() is the client area relative to itself
+    (left/top are 0) as win32gui reports it; client_to_screen() maps a client point to screen.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @abstractmethod
+    def enum_windows(self) -> List[int]:
+        """Handles of all top-level windows."""
+
+    @abstractmethod
+    def is_window(self, handle: int) -> bool:
+        """True if the handle still refers to a window."""
+
+    @abstractmethod
+    def is_visible(self, handle: int) -> bool:
+        """True if the window is visible."""
+
+    @abstractmethod
+    def window_text(self, handle: int) -> str:
+        """Window title."""
+
+    @abstractmethod
+    def window_pid(self, handle: int) -> int:
+        """ID of the process owning the window."""
+
+    @abstractmethod
+    def process_name(self, pid: int) -> str:
+        """Executable name of a process."""
+
+    @abstractmethod
+    def window_rect(self, handle: int) -> Rect:
+        """(left, top, right, bottom) of the window in screen coordinates."""
+
+    @abstractmethod
+    def client_rect(self, handle: int) -> Rect:
+        """(0, 0, width, height) of the client area."""
+
+    @abstractmethod
+    def client_to_screen(self, handle: int, point: Tuple[int, int]) -> Tuple[int, int]:
+        """Map a client-area point to screen coordinates."""
+
+    def is_minimized(self, handle: int) -> bool:
+        """True if the window is minimized (backends without the notion report False)."""
+        return False
+
+    def find_windows(self, title: str) -> List[int]:
+        """Visible top-level windows whose title contains the given text."""
+        found = []
+        for handle in self.enum_windows():
+            try:
+                if title in self.window_text(handle) and self.is_visible(handle):
+                    found.append(handle)
+            except Exception:
+                continue
+        return found
+
+    def close(self):
+        """Release any native handles held by the backend."""
+
+
+# ==============================
+# Live Backends
+# ==============================
+
+
+class Win32WindowBackend(WindowBackend):
+    """win32gui/win32process with psutil process names - the original discovery path."""
+
+    name = "win32"
+
+    def __init__(self):
+        super().__init__()
+        import psutil
+        import win32gui
+        import win32process
+
+        self._psutil = psutil
+        self._win32gui = win32gui
+        self._win32process = win32process
+
+    def enum_windows(self) -> List[int]:
+        handles = []
+
+        def callback(hwnd, _):
+            handles.append(hwnd)
+            return True
+
+        self._win32gui.EnumWindows(callback, None)
+        return handles
+
+    def is_window(self, handle: int) -> bool:
+        return bool(self._win32gui.IsWindow(handle))
+
+    def is_visible(self, handle: int) -> bool:
+        return bool(self._win32gui.IsWindowVisible(handle))
+
+    def is_minimized(self, handle: int) -> bool:
+        return bool(self._win32gui.IsIconic(handle))
+
+    def window_text(self, handle: int) -> str:
+        return self._win32gui.GetWindowText(handle)
+
+    def window_pid(self, handle: int) -> int:
+        return self._win32process.GetWindowThreadProcessId(handle)[1]
+
+    def process_name(self, pid: int) -> str:
+        return self._psutil.Process(pid).name()
+
+    def window_rect(self, handle: int) -> Rect:
+        return tuple(self._win32gui.GetWindowRect(handle))
+
+    def client_rect(self, handle: int) -> Rect:
+        return tuple(self._win32gui.GetClientRect(handle))
+
+    def client_to_screen(self, handle: int, point: Tuple[int, int]) -> Tuple[int, int]:
+        return tuple(self._win32gui.ClientToScreen(handle, point))
+
+
+class X11WindowBackend(WindowBackend):
+    """EWMH client list over python-xlib for Linux desktops and Xvfb (reads $DISPLAY)."""
+
+    name = "x11"
+
+    def __init__(self, display: Optional[str] = None):
+        super().__init__()
+        from Xlib import X, display as xdisplay
+        from Xlib.error import XError
+
+        self._X = X
+        self._XError = XError
+        self._display = xdisplay.Display(display)
+        self._root = self._display.screen().root
+        self._lock = threading.Lock()
+        self._atoms = {
+            name: self._display.intern_atom(name)
+            for name in (
+                "_NET_CLIENT_LIST",
+                "_NET_WM_NAME",
+                "_NET_WM_PID",
+                "_NET_WM_STATE",
+                "_NET_WM_STATE_HIDDEN",
+                "UTF8_STRING",
+            )
+        }
+
+    def _window(self, handle: int):
+        return self._display.create_resource_object("window", handle)
+
+    def _property(self, handle: int, atom: str, prop_type):
+        with self._lock:
+            prop = self._window(handle).get_full_property(self._atoms[atom], prop_type)
+        return prop.value if prop else None
+
+    def enum_windows(self) -> List[int]:
+        return list(self._property(self._root.id, "_NET_CLIENT_LIST", self._X.AnyPropertyType) or [])
+
+    def is_window(self, handle: int) -> bool:
+        try:
+            with self._lock:
+                self._window(handle).get_attributes()
+            return True
+        except self._XError:
+            return False
+
+    def is_visible(self, handle: int) -> bool:
+        try:
+            with self._lock:
+                return self._window(handle).get_attributes().map_state == self._X.IsViewable
+        except self._XError:
+            return False
+
+    def is_minimized(self, handle: int) -> bool:
+        states = self._property(handle, "_NET_WM_STATE", self._X.AnyPropertyType)
+        return states is not None and self._atoms["_NET_WM_STATE_HIDDEN"] in states
+
+    def window_text(self, handle: int) -> str:
+        value = self._property(handle, "_NET_WM_NAME", self._atoms["UTF8_STRING"])
+        if value is None:
+            with self._lock:
+                value = self._window(handle).get_wm_name()
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", "replace")
+        return value or ""
+
+    def window_pid(self, handle: int) -> int:
+        value = self._property(handle, "_NET_WM_PID", self._X.AnyPropertyType)
+        return int(value[0]) if value is not None and len(value) else 0
+
+    def process_name(self, pid: int) -> str:
+        with open(f"/proc/{pid}/comm", "r", encoding="utf-8") as f:
+            return f.read().strip()
+
+    def window_rect(self, handle: int) -> Rect:
+        with self._lock:
+            window = self._window(handle)
+            geometry = window.get_geometry()
+            origin = window.translate_coords(self._root, 0, 0)
+        x, y = -origin.x, -origin.y
+        return (x, y, x + geometry.width, y + geometry.height)
+
+    def client_rect(self, handle: int) -> Rect:
+        with self._lock:
+            geometry = self._window(handle).get_geometry()
+        return (0, 0, geometry.width, geometry.height)
+
+    def client_to_screen(self, handle: int, point: Tuple[int, int]) -> Tuple[int, int]:
+        left, top, _, _ = self.window_rect(handle)
+        return (left + point[0], top + point[1])
+
+    def close(self):
+        self._display.close()
+
+
+# ==============================
+# Offline Backends
+# ==============================
+
+
+class FakeWindowBackend(WindowBackend):
+    """
+    In-memory desktop for tests and benchmarks.
+
+    Windows are added with add_window() and can be moved, hidden or closed; every backend call
+    is counted in self.calls so tests can assert which path a lookup took.
+    """
+
+    name = "fake"
+
+    def __init__(self):
+        super().__init__()
+        self.windows: Dict[int, Dict[str, Any]] = {}
+        self.processes: Dict[int, str] = {}
+        self.calls: Dict[str, int] = {}
+        self._next_handle = 0x10000
+
+    def add_window(
+        self,
+        title: str,
+        rect: Rect = (0, 0, 800, 600),
+        pid: int = 1000,
+        process_name: str = "explorer.exe",
+        visible: bool = True,
+        frame: Tuple[int, int, int, int] = (8, 31, 8, 8),
+    ) -> int:
+        """
+        Add a top-level window and return its handle.
+
+        Args:
+            title: Window title
+            rect: Outer window (left, top, right, bottom) in screen coordinates
+            pid: Owning process ID
+            process_name: Executable name of the owning process
+            visible: Whether the window is visible
+            frame: (left, top, right, bottom) border thickness around the client area
+        """
+        handle = self._next_handle
+        self._next_handle += 4
+        self.windows[handle] = {
+            "title": title,
+            "rect": tuple(rect),
+            "pid": pid,
+            "visible": visible,
+            "minimized": False,
+            "frame": frame,
+        }
+        self.processes[pid] = process_name
+        return handle
+
+    def move_window(self, handle: int, rect: Rect):
+        self.windows[handle]["rect"] = tuple(rect)
+
+    def close_window(self, handle: int):
+        self.windows.pop(handle, None)
+
+    def _count(self, name: str):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _get(self, handle: int) -> Dict[str, Any]:
+        if handle not in self.windows:
+            raise OSError(f"Invalid window handle {handle:#x}")
+        return self.windows[handle]
+
+    def enum_windows(self) -> List[int]:
+        self._count("enum_windows")
+        return list(self.windows)
+
+    def is_window(self, handle: int) -> bool:
+        self._count("is_window")
+        return handle in self.windows
+
+    def is_visible(self, handle: int) -> bool:
+        self._count("is_visible")
+        return self._get(handle)["visible"]
+
+    def is_minimized(self, handle: int) -> bool:
+        self._count("is_minimized")
+        return self._get(handle)["minimized"]
+
+    def window_text(self, handle: int) -> str:
+        self._count("window_text")
+        return self._get(handle)["title"]
+
+    def window_pid(self, handle: int) -> int:
+        self._count("window_pid")
+        return self._get(handle)["pid"]
+
+    def process_name(self, pid: int) -> str:
+        self._count("process_name")
+        if pid not in self.processes:
+            raise OSError(f"No process {pid}")
+        return self.processes[pid]
+
+    def window_rect(self, handle: int) -> Rect:
+        self._count("window_rect")
+        return self._get(handle)["rect"]
+
+    def client_rect(self, handle: int) -> Rect:
+        self._count("client_rect")
+        left, top, right, bottom = self._get(handle)["rect"]
+        fl, ft, fr, fb = self._get(handle)["frame"]
+        return (0, 0, right - left - fl - fr, bottom - top - ft - fb)
+
+    def client_to_screen(self, handle: int, point: Tuple[int, int]) -> Tuple[int, int]:
+        self._count("client_to_screen")
+        left, top, _, _ = self._get(handle)["rect"]
+        fl, ft, _, _ = self._get(handle)["frame"]
+        return (left + fl + point[0], top + ft + point[1])
+
+
+# ==============================
+# Target Window Finder
+# ==============================
+
+
+class WindowFinder:
+    """
+    Finds the target game window, re-checking a known handle before enumerating.
+
+    After the first full enumeration the handle and PID are remembered. Later lookups
+    revalidate them with a few direct queries (handle still a window, still visible, same PID,
+    title still matches) and read the current rects, so the cost no longer depends on how
+    many windows are open. Enumeration runs again only when revalidation fails.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[WindowBackend] = None,
+        title: str = TARGET_WINDOW_TITLE,
+        process_name: str = TARGET_PROCESS_NAME,
+    ):
+        """
+        Args:
+            backend: Window backend (default: the process-wide backend)
+            title: Text the window title must contain
+            process_name: Executable name the owning process must have
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.backend = backend or get_window_backend()
+        self.title = title
+        self.process_name = process_name
+
+        self._handle: Optional[int] = None
+        self._pid: Optional[int] = None
+
+        # Statistics
+        self.fast_hits = 0
+        self.enumerations = 0
+
+    def find(self) -> Optional[Dict[str, Any]]:
+        """Window info for the target window, or None if it is not open."""
+        if self._handle is not None:
+            window_info = self._revalidate()
+            if window_info is not None:
+                self.fast_hits += 1
+                return window_info
+            self._handle = self._pid = None
+
+        self.enumerations += 1
+        for handle in self.backend.find_windows(self.title):
+            try:
+                pid = self.backend.window_pid(handle)
+                if self.backend.process_name(pid) != self.process_name:
+                    continue
+            except Exception:
+                continue
+            window_info = self.build_window_info(pid, handle)
+            if window_info:
+                self._handle, self._pid = handle, pid
+                return window_info
+        return None
+
+    def forget(self):
+        """Drop the cached handle so the next lookup enumerates."""
+        self._handle = self._pid = None
+
+    def _revalidate(self) -> Optional[Dict[str, Any]]:
+        try:
+            handle = self._handle
+            if not self.backend.is_window(handle) or not self.backend.is_visible(handle):
+                return None
+            if self.backend.window_pid(handle) != self._pid:
+                return None
+            return self.build_window_info(self._pid, handle)
+        except Exception:
+            return None
+
+    def build_window_info(self, pid: int, handle: int) -> Optional[Dict[str, Any]]:
+        """Build the window information dictionary the cache manager stores."""
+        try:
+            title = self.backend.window_text(handle)
+            if self.title not in title:
+                return None
+            window_rect = self.backend.window_rect(handle)
+            client_rect = self.backend.client_rect(handle)
+
+            # Calculate client area in screen coordinates (like tracker)
+            client_left_top = self.backend.client_to_screen(handle, (client_rect[0], client_rect[1]))
+            client_right_bottom = self.backend.client_to_screen(handle, (client_rect[2], client_rect[3]))
+            client_x = client_left_top[0]
+            client_y = client_left_top[1]
+            client_w = client_right_bottom[0] - client_left_top[0]
+            client_h = client_right_bottom[1] - client_left_top[1]
+
+            return {
+                "pid": pid,
+                "hwnd": handle,
+                "title": title,
+                "window_rect": window_rect,
+                "client_rect": client_rect,
+                "client_screen": {"x": client_x, "y": client_y, "width": client_w, "height": client_h},
+            }
+        except Exception as e:
+            self.logger.error(f"Error building window info: {e}")
+            return None
+
+
+# ==============================
+# Registry
+# ==============================
+
+WINDOW_BACKENDS: Dict[str, Callable[..., WindowBackend]] = {
+    Win32WindowBackend.name: Win32WindowBackend,
+    X11WindowBackend.name: X11WindowBackend,
+    FakeWindowBackend.name: FakeWindowBackend,
+}
+
+_active_backend: Optional[WindowBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_window_backend(name: str, **kwargs) -> WindowBackend:
+    """Instantiate a registered window backend by name (optional dependencies import lazily)."""
+    if name not in WINDOW_BACKENDS:
+        raise ValueError(f"Unknown window backend '{name}'. Available: {', '.join(WINDOW_BACKENDS)}")
+    return WINDOW_BACKENDS[name](**kwargs)
+
+
+def get_window_backend() -> WindowBackend:
+    """Get the process-wide window backend (win32 on Windows, X11 elsewhere, until set)."""
+    global _active_backend
+    if _active_backend is None:
+        with _backend_lock:
+            if _active_backend is None:
+                _active_backend = create_window_backend("win32" if sys.platform == "win32" else "x11")
+    return _active_backend
+
+
+def set_window_backend(backend: Union[str, WindowBackend], **kwargs) -> WindowBackend:
+    """Replace the process-wide window backend by instance or registered name."""
+    global _active_backend
+    if isinstance(backend, str):
+        backend = create_window_backend(backend, **kwargs)
+    with _backend_lock:
+        previous, _active_backend = _active_backend, backend
+    if previous is not None and previous is not backend:
+        previous.close()
+    logging.getLogger(__name__).info(f"Window backend set to '{backend.name}'")
+    return backend
+
+
+# ==============================
+# Benchmark
+# ==============================
+
+
+def bench_finder(window_counts: Sequence[int] = (10, 100, 1000), iterations: int = 200) -> List[Dict[str, float]]:
+    """
+    Time target-window lookups on fake desktops of increasing size.
+
+    Returns:
+        Per window count: mean microseconds per lookup for full enumeration and the fast path
+    """
+    results = []
+    for count in window_counts:
+        backend = FakeWindowBackend()
+        for i in range(count - 1):
+            backend.add_window(f"Window {i}", pid=2000 + i)
+        backend.add_window("WidgetInc", pid=42, process_name=TARGET_PROCESS_NAME)
+
+        finder = WindowFinder(backend)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            finder.forget()
+            finder.find()
+        full = (time.perf_counter() - start) / iterations
+
+        finder.find()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            finder.find()
+        fast = (time.perf_counter() - start) / iterations
+
+        results.append({"windows": count, "enumerate_us": full * 1e6, "fast_path_us": fast * 1e6})
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark target-window lookup with and without the fast path")
+    parser.add_argument("--windows", type=int, nargs="+", default=[10, 100, 1000], help="Desktop window counts")
+    parser.add_argument("--iterations", type=int, default=200, help="Lookups per measurement")
+    args = parser.parse_args(argv)
+
+    print(f"{'windows':>8} {'enumerate us':>13} {'fast path us':>13}")
+    for row in bench_finder(args.windows, args.iterations):
+        print(f"{row['windows']:>8} {row['enumerate_us']:>13.1f} {row['fast_path_us']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+"""
+Window Events
+Pushes move, resize, minimize and close events for the tracked window as they happen.
+"""
+
+import logging
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Tuple
+
+from utility.window_backend import Rect, WindowBackend
+
+# Event kinds
+MOVED = "moved"
+RESIZED = "resized"
+MINIMIZED = "minimized"
+RESTORED = "restored"
+CLOSED = "closed"
+
+
+class WindowEvent:
+    """One change of the tracked window."""
+
+    __slots__ = ("kind", "handle", "window_rect", "client_rect")
+
+    def __init__(self, kind: str, handle: int, window_rect: Optional[Rect] = None, client_rect: Optional[Rect] = None):
+        self.kind = kind
+        self.handle = handle
+        self.window_rect = window_rect
+        self.client_rect = client_rect
+
+    def __repr__(self) -> str:
+        return f"WindowEvent({self.kind!r}, {self.handle:#x}, {self.window_rect})"
+
+
+class WindowEventSource(ABC):
+    """
+    Watches one window and reports its changes through a callback.
+
+    check() reads the window's current state and turns the difference from the last state into
+    events, so every source classifies changes the same way; sources only differ in what
+    triggers a check. The callback runs on the source's thread.
+    """
+
+    name = "base"
+
+    def __init__(self, backend: WindowBackend):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.backend = backend
+        self.callback: Optional[Callable[[WindowEvent], None]] = None
+        self.handle: Optional[int] = None
+        self.pid: Optional[int] = None
+        self._state: Optional[Tuple[Rect, Rect, bool]] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.checks = 0
+        self.events = 0
+
+    def start(self, callback: Callable[[WindowEvent], None]):
+        """Begin reporting events for watched windows to callback."""
+        self.callback = callback
+
+    @abstractmethod
+    def stop(self):
+        """Stop reporting events and release any thread or hook."""
+
+    @property
+    @abstractmethod
+    def is_running(self) -> bool:
+        """True while the source delivers events."""
+
+    def watch(self, handle: Optional[int], pid: Optional[int] = None):
+        """Track a window (None stops tracking until a window is found again)."""
+        with self._lock:
+            self.handle, self.pid = handle, pid
+            self._state = self._read_state(handle) if handle is not None else None
+
+    def _read_state(self, handle: int) -> Optional[Tuple[Rect, Rect, bool]]:
+        try:
+            if not self.backend.is_window(handle):
+                return None
+            return (
+                tuple(self.backend.window_rect(handle)),
+                tuple(self.backend.client_rect(handle)),
+                self.backend.is_minimized(handle),
+            )
+        except Exception:
+            return None
+
+    def check(self) -> List[WindowEvent]:
+        """Compare the watched window with its last state and report any changes."""
+        with self._lock:
+            handle = self.handle
+            if handle is None:
+                return []
+            self.checks += 1
+            state = self._read_state(handle)
+            previous, self._state = self._state, state
+
+            if state is None:
+                events = [WindowEvent(CLOSED, handle)]
+                self.handle = self.pid = None
+            elif previous is None or state == previous:
+                events = []
+            else:
+                window_rect, client_rect, minimized = state
+                old_rect, old_client, was_minimized = previous
+                events = []
+                if minimized != was_minimized:
+                    events.append(WindowEvent(MINIMIZED if minimized else RESTORED, handle, window_rect, client_rect))
+                if (window_rect[2] - window_rect[0], window_rect[3] - window_rect[1], client_rect) != (
+                    old_rect[2] - old_rect[0],
+                    old_rect[3] - old_rect[1],
+                    old_client,
+                ):
+                    events.append(WindowEvent(RESIZED, handle, window_rect, client_rect))
+                elif window_rect[:2] != old_rect[:2]:
+                    events.append(WindowEvent(MOVED, handle, window_rect, client_rect))
+
+        self.events += len(events)
+        if self.callback is not None:
+            for event in events:
+                try:
+                    self.callback(event)
+                except Exception as e:
+                    self.logger.error(f"Window event callback failed: {e}")
+        return events
+
+
+# ==============================
+# Polling Source
+# ==============================
+
+
+class PollingWindowEventSource(WindowEventSource):
+    """
+    Adaptive polling of the watched window's rects and minimized state.
+
+    The interval drops to min_interval as soon as a change is seen (dragging a window is
+    followed every frame) and grows by backoff after each unchanged check up to max_interval,
+    so an idle window costs a few cheap queries per second. With no window watched the
+    thread sleeps until watch() is called.
+    """
+
+    name = "polling"
+
+    def __init__(
+        self, backend: WindowBackend, min_interval: float = 0.016, max_interval: float = 0.25, backoff: float = 1.5
+    ):
+        """
+        Args:
+            backend: Window backend to query
+            min_interval: Poll interval right after a change
+            max_interval: Largest interval while nothing changes
+            backoff: Interval growth factor per unchanged check
+        """
+        super().__init__(backend)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = max_interval
+
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self, callback: Callable[[WindowEvent], None]):
+        super().start(callback)
+        if self._thread and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="WindowEventPoller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        self._running = False
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def watch(self, handle: Optional[int], pid: Optional[int] = None):
+        super().watch(handle, pid)
+        self.interval = self.min_interval
+        self._wake.set()
+
+    def _run(self):
+        while self._running:
+            if self.handle is None:
+                self._wake.wait()
+            else:
+                self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._running:
+                break
+            if self.check():
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.max_interval, self.interval * self.backoff)
+
+
+# ==============================
+# Win32 Hook Source
+# ==============================
+
+
+class Win32WindowEventSource(WindowEventSource):
+    """
+    SetWinEventHook notifications for the watched window's process.
+
+    A dedicated thread installs an out-of-context hook for location changes, minimize
+    start/end and destroy, filtered to the window's process, and pumps its message loop.
+    Each notification for the watched window triggers a check(); nothing runs while the
+    window is idle. If the hooks for a window cannot be installed, that window is followed by
+    a PollingWindowEventSource on the same backend instead; the hooks are tried again when
+    another window is watched.
+    """
+
+    name = "win32"
+
+    EVENT_SYSTEM_MINIMIZESTART = 0x0016
+    EVENT_SYSTEM_MINIMIZEEND = 0x0017
+    EVENT_OBJECT_DESTROY = 0x8001
+    EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    OBJID_WINDOW = 0
+    WM_QUIT = 0x0012
+
+    def __init__(self, backend: WindowBackend, **poll_kwargs):
+        """
+        Args:
+            backend: Window backend to query
+            poll_kwargs: PollingWindowEventSource arguments for windows the hooks fail on
+        """
+        super().__init__(backend)
+        self.poll_kwargs = poll_kwargs
+
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id: Optional[int] = None
+        self._started = False
+        self._hook_failed = False
+        self._fallback: Optional[PollingWindowEventSource] = None
+
+        self._bind_win32()
+
+    def _bind_win32(self):
+        import ctypes
+        from ctypes import wintypes
+
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._proc_type = ctypes.WINFUNCTYPE(
+            None,
+            wintypes.HANDLE,
+            wintypes.DWORD,
+            wintypes.HWND,
+            wintypes.LONG,
+            wintypes.LONG,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        )
+
+        # Private DLL handles so the prototypes below don't leak into other ctypes users.
+        # HWINEVENTHOOK is pointer sized; without restype it would be truncated to a c_int.
+        self._user32 = ctypes.WinDLL("user32", use_last_error=True)
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._user32.SetWinEventHook.restype = wintypes.HANDLE
+        self._user32.SetWinEventHook.argtypes = [
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.HMODULE,
+            self._proc_type,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        ]
+        self._user32.UnhookWinEvent.restype = wintypes.BOOL
+        self._user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+        self._user32.GetMessageW.restype = wintypes.BOOL
+        self._user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+        self._user32.PostThreadMessageW.restype = wintypes.BOOL
+        self._user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        self._kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+
+    def start(self, callback: Callable[[WindowEvent], None]):
+        super().start(callback)
+        self._started = True
+        if self.handle is not None:
+            self._start_hook_thread()
+
+    def stop(self, timeout: float = 1.0):
+        self._started = False
+        self._stop_hook_thread(timeout)
+        self._stop_fallback(timeout)
+
+    @property
+    def is_running(self) -> bool:
+        """True while hooks, or the polling fallback for a window without hooks, deliver events."""
+        if not self._started:
+            return False
+        if self._hook_failed:
+            return self._fallback is not None and self._fallback.is_running
+        return True
+
+    @property
+    def polling(self) -> bool:
+        """True while the watched window is followed by the polling fallback."""
+        return self._fallback is not None
+
+    def watch(self, handle: Optional[int], pid: Optional[int] = None):
+        changed = (handle, pid) != (self.handle, self.pid)
+        super().watch(handle, pid)
+        if changed and self._started:
+            self._stop_hook_thread()
+            self._stop_fallback()
+            if handle is not None:
+                self._start_hook_thread()
+
+    def _start_hook_thread(self):
+        self._hook_failed = False
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._hook_loop, args=(self.pid or 0, ready), daemon=True)
+        self._thread.name = "WindowEventHook"
+        self._thread.start()
+        ready.wait(1.0)
+        if self._hook_failed:
+            self._start_fallback()
+
+    def _start_fallback(self):
+        self._fallback = PollingWindowEventSource(self.backend, **self.poll_kwargs)
+        self._fallback.watch(self.handle, self.pid)
+        self._fallback.start(self.callback)
+
+    def _stop_fallback(self, timeout: float = 1.0):
+        fallback, self._fallback = self._fallback, None
+        if fallback is not None:
+            fallback.stop(timeout)
+
+    def _stop_hook_thread(self, timeout: float = 1.0):
+        if self._thread is None:
+            return
+        if self._thread_id is not None:
+            self._user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+        self._thread.join(timeout)
+        self._thread = None
+        self._thread_id = None
+
+    def _hook_loop(self, pid: int, ready: threading.Event):
+        def on_event(_hook, event, hwnd, id_object, _id_child, _thread, _time):
+            if id_object == self.OBJID_WINDOW and hwnd == self.handle:
+                self.check()
+
+        # Keep the callback referenced for the lifetime of the hooks
+        proc = self._proc_type(on_event)
+        self._thread_id = self._kernel32.GetCurrentThreadId()
+        hooks = [
+            self._user32.SetWinEventHook(first, last, None, proc, pid, 0, self.WINEVENT_OUTOFCONTEXT)
+            for first, last in (
+                (self.EVENT_SYSTEM_MINIMIZESTART, self.EVENT_SYSTEM_MINIMIZEEND),
+                (self.EVENT_OBJECT_DESTROY, self.EVENT_OBJECT_DESTROY),
+                (self.EVENT_OBJECT_LOCATIONCHANGE, self.EVENT_OBJECT_LOCATIONCHANGE),
+            )
+        ]
+        if not all(hooks):
+            error = self._ctypes.get_last_error()
+            for hook in hooks:
+                if hook:
+                    self._user32.UnhookWinEvent(hook)
+            self._hook_failed = True
+            self._thread_id = None
+            ready.set()
+            self.logger.warning(f"SetWinEventHook failed (error {error}); polling the window instead")
+            return
+        ready.set()
+
+        msg = self._wintypes.MSG()
+        while self._user32.GetMessageW(self._ctypes.byref(msg), None, 0, 0) > 0:
+            self._user32.TranslateMessage(self._ctypes.byref(msg))
+            self._user32.DispatchMessageW(self._ctypes.byref(msg))
+
+        for hook in hooks:
+            if hook:
+                self._user32.UnhookWinEvent(hook)
+
+
+def create_window_event_source(backend: WindowBackend, **kwargs) -> WindowEventSource:
+    """Platform hooks for the win32 backend where available, adaptive polling otherwise."""
+    if backend.name == "win32" and sys.platform == "win32":
+        try:
+            return Win32WindowEventSource(backend, **kwargs)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Window event hooks unavailable, polling instead: {e}")
+    return PollingWindowEventSource(backend, **kwargs)
@@ -9,13 +9,18 @@ import logging
 import os
 import numpy as np
 import pyautogui
-from PIL import Image, ImageGrab
 from typing import Any, Dict, List, Optional, Tuple
 
+from capture.backends import get_capture_backend
+from capture.color_palette import pack_rgb_array
+from capture.frame_ring import CapturedFrame, FrameRingBuffer
 from .cache_manager import get_cache_manager
 
 logger = logging.getLogger(__name__)
 
+# Shared ring for get_frame_array() callers that do not own one
+_frame_ring = FrameRingBuffer()
+
 
 def calculate_overlay_position(window_info: Dict[str, Any]) -> Tuple[int, int, int]:
     """
@@ -47,28 +52,47 @@ def get_leftmost_x_offset():
     return window_manager.get_leftmost_x_offset()
 
 
-def get_frame_screenshot():
+def get_frame_bbox() -> Optional[Tuple[int, int, int, int]]:
     """
-    Screenshot just the frame area using ImageGrab.grab.
-    Returns a PIL Image or None if frame area not found.
+    Get the frame area as a screen bbox (x1, y1, x2, y2).
+    Returns None if frame area not found.
     """
     window_manager = get_cache_manager()
     frame_area = window_manager.get_frame_area()
     if not frame_area:
-        logger.warning("No frame area available for screenshot.")
         return None
     x = frame_area["x"]
     y = frame_area["y"]
-    width = frame_area["width"]
-    height = frame_area["height"]
-    bbox = (x, y, x + width, y + height)
-    # all_screens=True ensures correct multi-monitor capture
-    return ImageGrab.grab(bbox=bbox, all_screens=True)
+    return (x, y, x + frame_area["width"], y + frame_area["height"])
+
+
+def get_frame_screenshot():
+    """
+    Screenshot just the frame area using the active capture backend.
+    Returns a PIL Image or None if frame area not found.
+    """
+    bbox = get_frame_bbox()
+    if not bbox:
+        logger.warning("No frame area available for screenshot.")
+        return None
+    return get_capture_backend().grab_image(bbox)
+
+
+def get_frame_array(ring: Optional[FrameRingBuffer] = None) -> Optional[CapturedFrame]:
+    """
+    Capture the frame area into a preallocated ring slot.
+    Returns a CapturedFrame (read-only HxWx3 RGB view, seq, timestamp, bbox) or None if frame area not found.
+    """
+    bbox = get_frame_bbox()
+    if not bbox:
+        logger.warning("No frame area available for capture.")
+        return None
+    return (ring or _frame_ring).capture(bbox)
 
 
 def get_cropped_bbox_screenshot(bbox):
     """
-    Screenshot a specific bounding box area using ImageGrab.grab.
+    Screenshot a specific bounding box area using the active capture backend.
     Returns a PIL Image or None if bbox is invalid.
     """
     if not bbox or len(bbox) != 4:
@@ -78,7 +102,75 @@ def get_cropped_bbox_screenshot(bbox):
     if x1 >= x2 or y1 >= y2:
         logger.warning("Invalid bounding box dimensions.")
         return None
-    return ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
+    return get_capture_backend().grab_image((x1, y1, x2, y2))
+
+
+def _as_image_array(screenshot) -> np.ndarray:
+    """View a PIL Image, CapturedFrame or HxWxC array as an HxWxC uint8 array."""
+    if isinstance(screenshot, CapturedFrame):
+        return screenshot.array
+    return np.asarray(screenshot)
+
+
+def _edge_descending(mask: np.ndarray, start: int) -> int:
+    """
+    Walk from start towards index 0 to the first border pixel, then past the border run.
+    Stops at 0 like the pixel-by-pixel walk; returns the index the walk ended on.
+    """
+    segment = mask[start:0:-1]  # start, start - 1, ..., 1
+    x = start - (int(np.argmax(segment)) if segment.any() else len(segment))
+    segment = ~mask[x:0:-1]
+    return x - (int(np.argmax(segment)) if segment.any() else len(segment))
+
+
+def _edge_ascending(mask: np.ndarray, start: int) -> int:
+    """Mirror of _edge_descending walking towards the last index (stops at len - 1)."""
+    limit = len(mask) - 1
+    segment = mask[start:limit]  # start, ..., limit - 1
+    x = start + (int(np.argmax(segment)) if segment.any() else len(segment))
+    segment = ~mask[x:limit]
+    return x + (int(np.argmax(segment)) if segment.any() else len(segment))
+
+
+def get_boxes_with_border(start_points, border_color, screenshot=None) -> List[Tuple[int, int, int, int]]:
+    """
+    Find the bordered box around each start point from one screenshot.
+
+    Each edge is found on the start point's row/column with vectorized comparisons: the first
+    border pixel outward, then the end of the border run (argmax over a boolean mask).
+
+    Args:
+        start_points: *FRAME coordinates* (x, y) to start scanning from
+        border_color: RGB tuple for border color
+        screenshot: Frame image (PIL Image, CapturedFrame or array; default: capture the frame)
+
+    Returns:
+        List of (left, top, right, bottom) boxes, one per start point
+    """
+    if screenshot is None:
+        screenshot = get_frame_array()
+    if screenshot is None:
+        return [(0, 0, 0, 0) for _ in start_points]
+
+    image = _as_image_array(screenshot)
+    border = np.asarray(border_color, dtype=image.dtype)
+    if image.ndim != 3 or image.shape[2] != len(border):
+        # A differently sized color never equals a pixel (e.g. RGB border on an RGBA image)
+        return [(1, 1, image.shape[1] - 2, image.shape[0] - 2) for _ in start_points]
+
+    boxes = []
+    for x0, y0 in start_points:
+        row = (image[y0] == border).all(axis=1)
+        column = (image[:, x0] == border).all(axis=1)
+        bbox = (
+            _edge_descending(row, x0) + 1,
+            _edge_descending(column, y0) + 1,
+            _edge_ascending(row, x0) - 1,
+            _edge_ascending(column, y0) - 1,
+        )
+        logger.debug(f"Detected bounding box: {bbox} starting from {(x0, y0)}")
+        boxes.append(bbox)
+    return boxes
 
 
 def get_box_with_border(start_point, border_color, screenshot=None):
@@ -88,196 +180,167 @@ def get_box_with_border(start_point, border_color, screenshot=None):
     Args:
         start_point: *FRAME coordinates* (x, y) to start scanning from
         border_color: RGB tuple for border color
+        screenshot: Frame image (PIL Image, CapturedFrame or array; default: capture the frame)
 
     Returns:
         bbox: Tuple (left, top, right, bottom) representing the detected box bounds
     """
-    if screenshot is None:
-        screenshot = get_frame_screenshot()
-    if not screenshot:
-        return (0, 0, 0, 0)
-
-    width, height = screenshot.size
-    x0, y0 = start_point
-
-    # Find left edge
-    x = x0
-    # Scan left until we find the border
-    while x > 0 and screenshot.getpixel((x, y0)) != border_color:
-        x -= 1
-    # Continue scanning left until border is no longer found
-    while x > 0 and screenshot.getpixel((x, y0)) == border_color:
-        x -= 1
-    left = x + 1
-
-    # Find right edge
-    x = x0
-    while x < width - 1 and screenshot.getpixel((x, y0)) != border_color:
-        x += 1
-    while x < width - 1 and screenshot.getpixel((x, y0)) == border_color:
-        x += 1
-    right = x - 1
-
-    # Find top edge
-    y = y0
-    while y > 0 and screenshot.getpixel((x0, y)) != border_color:
-        y -= 1
-    while y > 0 and screenshot.getpixel((x0, y)) == border_color:
-        y -= 1
-    top = y + 1
-
-    # Find bottom edge
-    y = y0
-    while y < height - 1 and screenshot.getpixel((x0, y)) != border_color:
-        y += 1
-    while y < height - 1 and screenshot.getpixel((x0, y)) == border_color:
-        y += 1
-    bottom = y - 1
-
-    bbox = (left, top, right, bottom)
-    logger.debug(f"Detected bounding box: {bbox} starting from {start_point}")
-    return bbox
+    return get_boxes_with_border([start_point], border_color, screenshot)[0]
+
+
+def _color_keys(colors) -> np.ndarray:
+    """Sorted packed 24-bit keys of one RGB color or a list of colors."""
+    colors = np.asarray(list(colors) if isinstance(colors, (set, frozenset)) else colors, dtype=np.uint8)
+    return np.unique(pack_rgb_array(colors.reshape(-1, colors.shape[-1])))
+
+
+def _in_colors(pixels: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """Boolean mask of pixels whose packed RGB value is one of keys."""
+    return np.isin(pack_rgb_array(pixels), keys)
+
+
+def _first(mask: np.ndarray) -> Optional[int]:
+    """Index of the first True in mask, or None."""
+    return int(np.argmax(mask)) if mask.any() else None
+
+
+def _jump_descending(line: np.ndarray, start: int) -> int:
+    """Step from start towards 0 in 8px jumps while the line is allowed; where the jumps stopped."""
+    positions = np.arange(start, 0, -8)
+    hit = _first(~line[positions])
+    return int(positions[hit]) if hit is not None else 0
+
+
+def _jump_ascending(line: np.ndarray, start: int) -> int:
+    """Step from start towards the end in 8px jumps while the line is allowed; where the jumps stopped."""
+    limit = len(line) - 1
+    positions = np.arange(start, limit, 8)
+    hit = _first(~line[positions])
+    return int(positions[hit]) if hit is not None else max(start, limit)
 
 
 def get_box_no_border(
     approx_box: tuple[int, int, int, int],
     allowed_colors: list[tuple[int, int, int]],
-    screenshot: Optional[Image.Image] = None,
+    screenshot=None,
 ):
-    if screenshot is None:
-        screenshot = get_frame_screenshot()
+    """
+    Grow an approximate box outward over a region made only of allowed colors.
 
-    # O(1) color lookup instead of O(n)
-    allowed_colors_set = set(allowed_colors)
+    Each edge jumps outward 8px at a time along the box's first row/column while the color is
+    allowed, steps back to the last allowed pixel, then moves inward to the first full line of
+    allowed colors. All membership tests run on packed 24-bit pixels with np.isin.
 
-    # Numpy array access is much faster than PIL getpixel()
-    img_array = np.array(screenshot)
-    height, width = img_array.shape[:2]
+    Args:
+        approx_box: (x1, y1, x2, y2) frame coordinates fully inside the region
+        allowed_colors: RGB tuples the region is made of
+        screenshot: Frame image (PIL Image, CapturedFrame or array; default: capture the frame)
+
+    Returns:
+        (left, top, right, bottom) of the region
+    """
+    if screenshot is None:
+        screenshot = get_frame_array()
+
+    image = _as_image_array(screenshot)
+    height, width = image.shape[:2]
+    keys = _color_keys(allowed_colors)
 
     x1, y1, x2, y2 = approx_box
 
-    def is_allowed_color(x, y):
-        if 0 <= x < width and 0 <= y < height:
-            # Note: numpy uses [y, x] indexing, PIL uses (x, y)
-            pixel = tuple(img_array[y, x])
-            return pixel in allowed_colors_set
-        return False
-
-    def test_vertical_line(x):
-        if not (0 <= x < width):
-            return False
-        vertical_pixels = img_array[y1 : y2 + 1, x]
-        for pixel in vertical_pixels:
-            if tuple(pixel) not in allowed_colors_set:
-                return False
-        return True
-
-    def test_horizontal_line(y):
-        if not (0 <= y < height):
-            return False
-        horizontal_pixels = img_array[y, x1 : x2 + 1]
-        for pixel in horizontal_pixels:
-            if tuple(pixel) not in allowed_colors_set:
-                return False
-        return True
+    def vertical_lines(xa, xb):
+        """Allowed-ness of whole columns xa..xb (inclusive) over rows y1..y2."""
+        return _in_colors(image[y1 : y2 + 1, xa : xb + 1], keys).all(axis=0)
+
+    def horizontal_lines(ya, yb):
+        """Allowed-ness of whole rows ya..yb (inclusive) over columns x1..x2."""
+        return _in_colors(image[ya : yb + 1, x1 : x2 + 1], keys).all(axis=1)
 
     # Initial validation
     if not (
-        test_vertical_line(x1) and test_horizontal_line(y1) and test_vertical_line(x2) and test_horizontal_line(y2)
+        0 <= x1 < width
+        and 0 <= x2 < width
+        and 0 <= y1 < height
+        and 0 <= y2 < height
+        and vertical_lines(x1, x1).all()
+        and vertical_lines(x2, x2).all()
+        and horizontal_lines(y1, y1).all()
+        and horizontal_lines(y2, y2).all()
     ):
         raise ValueError("Initial box test failed...")
 
-    def get_left_edge(x1):
-        x = x1
-        while x > 0 and is_allowed_color(x, y1):
-            x -= min(8, x)  # Adaptive step size
-        while x < x1 and not is_allowed_color(x, y1):
-            x += 1
-        while x <= x1 and not test_vertical_line(x):
-            x += 1
-        return x
-
-    def get_right_edge(x2):
-        x = x2
-        while x < width - 1 and is_allowed_color(x, y1):
-            x += min(8, width - 1 - x)
-        while x > x2 and not is_allowed_color(x, y1):
-            x -= 1
-        while x >= x2 and not test_vertical_line(x):
-            x -= 1
-        return x
-
-    def get_top_edge(y1):
-        y = y1
-        while y > 0 and is_allowed_color(x1, y):
-            y -= min(8, y)
-        while y < y1 and not is_allowed_color(x1, y):
-            y += 1
-        while y <= y1 and not test_horizontal_line(y):
-            y += 1
-        return y
-
-    def get_bottom_edge(y2):
-        y = y2
-        while y < height - 1 and is_allowed_color(x1, y):
-            y += min(8, height - 1 - y)
-        while y > y2 and not is_allowed_color(x1, y):
-            y -= 1
-        while y >= y2 and not test_horizontal_line(y):
-            y -= 1
-        return y
-
-    return (get_left_edge(x1), get_top_edge(y1), get_right_edge(x2), get_bottom_edge(y2))
+    row = _in_colors(image[y1], keys)
+    column = _in_colors(image[:, x1], keys)
+
+    # Left: jump out, step back in to an allowed pixel, then to the first full allowed column
+    x = _jump_descending(row, x1)
+    hit = _first(row[x:x1])
+    x = x + hit if hit is not None else x1
+    hit = _first(vertical_lines(x, x1))
+    left = x + hit if hit is not None else x1 + 1
+
+    # Right
+    x = _jump_ascending(row, x2)
+    hit = _first(row[x2 + 1 : x + 1][::-1])
+    x = x - hit if hit is not None else x2
+    hit = _first(vertical_lines(x2, x)[::-1])
+    right = x - hit if hit is not None else x2 - 1
+
+    # Top
+    y = _jump_descending(column, y1)
+    hit = _first(column[y:y1])
+    y = y + hit if hit is not None else y1
+    hit = _first(horizontal_lines(y, y1))
+    top = y + hit if hit is not None else y1 + 1
+
+    # Bottom
+    y = _jump_ascending(column, y2)
+    hit = _first(column[y2 + 1 : y + 1][::-1])
+    y = y - hit if hit is not None else y2
+    hit = _first(horizontal_lines(y2, y)[::-1])
+    bottom = y - hit if hit is not None else y2 - 1
+
+    return (left, top, right, bottom)
 
 
 def get_vertical_fill(x, top_y, bottom_y, empty_colors, filled_colors, screenshot=None):
     """
     Scan a vertical bar from bottom to top to determine fill level.
 
+    Filled pixels are counted from the bottom up to the first empty pixel; pixels of other
+    colors are skipped. Only the bar's column is packed and tested.
+
     Args:
         bottom_y: Bottom y-coordinate of the bar (inclusive)
         top_y: Top y-coordinate of the bar (inclusive)
         x: x-coordinate of the vertical line to scan
         empty_colors: RGB tuple or list of RGB tuples representing empty colors
         filled_colors: RGB tuple or list of RGB tuples representing filled colors
-        screenshot: Optional PIL Image to use instead of taking a new screenshot
+        screenshot: Frame image (PIL Image, CapturedFrame or array; default: capture the frame)
 
     Returns:
         percent_filled: Percentage (0-100) of the bar that is filled
     """
     if screenshot is None:
-        screenshot = get_frame_screenshot()
-    if not screenshot:
+        screenshot = get_frame_array()
+    if screenshot is None:
         return 0
 
-    width, height = screenshot.size
+    image = _as_image_array(screenshot)
+    height, width = image.shape[:2]
 
     # Ensure coordinates are within bounds
     if not (0 <= x < width and 0 <= top_y < height and 0 <= bottom_y < height and top_y < bottom_y):
         raise ValueError("Coordinates out of bounds")
 
-    # Normalize inputs to lists if they're single tuples
-    if isinstance(empty_colors, tuple) and len(empty_colors) == 3 and all(isinstance(x, int) for x in empty_colors):
-        empty_colors = [empty_colors]
-    if isinstance(filled_colors, tuple) and len(filled_colors) == 3 and all(isinstance(x, int) for x in filled_colors):
-        filled_colors = [filled_colors]
-
-    # Convert color lists to sets for O(1) lookup
-    empty_color_set = set(empty_colors)
-    filled_color_set = set(filled_colors)
+    # Bottom-to-top column; a color listed as both filled and empty counts as filled
+    bar = image[top_y : bottom_y + 1, x][::-1]
+    filled = _in_colors(bar, _color_keys(filled_colors))
+    empty = _in_colors(bar, _color_keys(empty_colors)) & ~filled
 
-    # Numpy array access is much faster than PIL getpixel()
-    img_array = np.array(screenshot)
-
-    fill_height = 0
+    first_empty = _first(empty)
+    fill_height = int(filled[:first_empty].sum())
     total_height = bottom_y - top_y + 1
 
-    for y in range(bottom_y, top_y - 1, -1):
-        pixel = tuple(img_array[y, x])
-        if pixel in filled_color_set:
-            fill_height += 1
-        elif pixel in empty_color_set:
-            break  # Stop scanning when we hit an empty color
-
     percent_filled = (fill_height / total_height) * 100 if total_height > 0 else 0
     return percent_filled
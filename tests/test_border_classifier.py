@@ -0,0 +1,146 @@
+"""
+Test the vectorized border-color frame classifier.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.synthetic_frame import FRAME_DETECTION_FILE, SyntheticFrame, load_border_colors, load_frames_database
+from detection.border_classifier import (
+    BorderClassifier,
+    border_signature,
+    border_strip_boxes,
+    strip_fingerprint,
+    strip_signature,
+)
+
+# Frames whose stored borders are identical (resolved by secondary detection)
+TWINS = {"2.3", "2.4"}
+
+
+def legacy_best(detection_data, signature):
+    """Previous per-frame loop, kept as the reference."""
+    left_avg, right_avg = signature[:3], signature[3:]
+    best_match, best_score = None, float("inf")
+    for frame_data in detection_data.values():
+        if "left_border" not in frame_data or "right_border" not in frame_data:
+            continue
+        left_distance = np.sqrt(np.sum((left_avg - frame_data["left_border"]["average_color"]) ** 2))
+        right_distance = np.sqrt(np.sum((right_avg - frame_data["right_border"]["average_color"]) ** 2))
+        combined_score = left_distance + right_distance
+        if combined_score < 100 and combined_score < best_score:
+            best_score, best_match = combined_score, frame_data
+    return best_match, best_score
+
+
+class TestBorderClassifier:
+    """Test BorderClassifier against the stored frame detection data."""
+
+    @classmethod
+    def setup_class(cls):
+        with open(FRAME_DETECTION_FILE, "r", encoding="utf-8") as f:
+            cls.detection = json.load(f)
+        cls.classifier = BorderClassifier(cls.detection)
+        cls.database = load_frames_database()
+        cls.borders = load_border_colors()
+
+    def test_compiled_matrix(self):
+        """Test every frame with both borders becomes one float32 row."""
+        assert self.classifier.matrix.shape == (len(self.detection), 6)
+        assert self.classifier.matrix.dtype == np.float32
+
+    def test_synthetic_frames(self):
+        """Test each rendered frame is classified as itself, twins as either twin."""
+        for frame_id in self.borders:
+            frame = SyntheticFrame(frame_id, 640, 480, frames_database=self.database, border_colors=self.borders)
+            result = self.classifier.classify(border_signature(frame.render()))
+            assert result is not None
+            if frame_id in TWINS:
+                assert result["frame_id"] in TWINS
+                assert result["margin"] == pytest.approx(0, abs=1e-3)
+                assert result["confidence"] < 0.01
+            else:
+                assert result["frame_id"] == frame_id
+                assert result["confidence"] > 0.95
+            assert result["candidates"][0]["frame_id"] == result["frame_id"]
+
+    def test_matches_legacy_loop(self):
+        """Test random signatures pick the same frame as the per-frame loop."""
+        rng = np.random.default_rng(3)
+        base = self.classifier.matrix[rng.integers(0, len(self.classifier), 200)]
+        for signature in base + rng.normal(0, 25, base.shape).astype(np.float32):
+            expected, expected_score = legacy_best(self.detection, signature.astype(np.float64))
+            result = self.classifier.classify(signature)
+            if expected is None:
+                assert result is None
+            else:
+                assert result["frame_id"] == expected["frame_id"]
+                assert result["score"] == pytest.approx(expected_score, rel=1e-4)
+
+    def test_confidence_margin(self):
+        """Test noisy matches keep their confidence unless the runner-up is as close."""
+        target = self.classifier.matrix[0]
+        assert self.classifier.rank(target, top=2)[1]["score"] > 4
+        noisy = target + np.array([2, 0, 0, 0, 0, 0], dtype=np.float32)
+        assert self.classifier.classify(noisy)["confidence"] == pytest.approx(1 - 2 / 200, abs=1e-4)
+
+        # Halfway to the runner-up: margin is small relative to the distance
+        neighbour = self.classifier.matrix[self.classifier.keys.index(self._nearest_key(0))]
+        ambiguous = target + 0.45 * (neighbour - target)
+        result = self.classifier.classify(ambiguous)
+        assert result["margin"] < result["score"]
+        assert result["confidence"] < 0.5
+
+    def _nearest_key(self, index):
+        scores = self.classifier.scores(self.classifier.matrix[index])
+        scores[index] = np.inf
+        return self.classifier.keys[int(np.argmin(scores))]
+
+    def test_rank_and_no_match(self):
+        """Test ranking order and rejection of signatures far from every frame."""
+        ranked = self.classifier.rank(self.classifier.matrix[0], top=5)
+        assert len(ranked) == 5
+        assert [c["score"] for c in ranked] == sorted(c["score"] for c in ranked)
+        assert ranked[0]["score"] == pytest.approx(0)
+
+        assert self.classifier.classify(np.array([255, 0, 255, 0, 255, 0], dtype=np.float32)) is None
+        assert BorderClassifier({}).classify(np.zeros(6)) is None
+
+
+
+class TestBorderStrips:
+    """Test border strip geometry and fingerprints."""
+
+    def strips(self, image):
+        (lx1, ly1, lx2, ly2), (rx1, ry1, rx2, ry2) = border_strip_boxes(image.shape[1], image.shape[0])
+        return image[ly1:ly2, lx1:lx2], image[ry1:ry2, rx1:rx2]
+
+    def test_strip_signature_matches_full_frame(self):
+        """Test classifying from the strips alone equals classifying the whole frame."""
+        image = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        left, right = self.strips(image)
+        assert left.shape == (96, 32, 3)
+        assert np.array_equal(strip_signature(left, right), border_signature(image))
+
+    def test_fingerprint_tracks_borders_only(self):
+        """Test the fingerprint ignores the frame interior and changes with the borders."""
+        image = np.random.default_rng(1).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        fingerprint = strip_fingerprint(*self.strips(image))
+        assert strip_fingerprint(*self.strips(image.copy())) == fingerprint
+
+        image[200:300, 200:400] = 0
+        assert strip_fingerprint(*self.strips(image)) == fingerprint
+
+        left, right = self.strips(image)
+        left[4, 8] = left[4, 8] ^ 0xFF
+        assert strip_fingerprint(left, right) != fingerprint
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
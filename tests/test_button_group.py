@@ -0,0 +1,119 @@
+"""
+Test ButtonGroup state reads and batched clicks against a synthetic frame.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from automation.button_group import ButtonGroup
+from capture.capture_scheduler import CaptureScheduler
+from capture.frame_snapshot import FrameSnapshot
+from capture.synthetic_frame import SyntheticCaptureBackend, SyntheticFrame
+
+
+class FakeAutomator:
+    """Minimal automator: captures through a scheduler and records clicks."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.scheduler = CaptureScheduler(lambda: backend.frame_bbox, backend=backend)
+        self.snapshot = FrameSnapshot(lambda: backend.frame_bbox, backend=backend)
+        self.should_continue = True
+        self.clicks = []
+        self.captures = 0
+
+    def capture_frame(self, max_age=0.0):
+        self.captures += 1
+        return self.scheduler.get_frame(max_age)
+
+    def click(self, x, y, duration=0.1):
+        self.snapshot.invalidate()
+        self.clicks.append((x, y))
+        return True
+
+    def sleep(self, duration):
+        self.snapshot.invalidate()
+        return True
+
+
+class TestButtonGroup:
+    """Test reading many buttons from one capture."""
+
+    def setup_method(self):
+        self.frame = SyntheticFrame("1.1", width=400, height=300)
+        self.backend = SyntheticCaptureBackend(self.frame, origin=(50, 20), screen_size=(500, 400))
+        self.automator = FakeAutomator(self.backend)
+        buttons = {}
+        for name in ("miner1", "miner2", "miner3", "miner4"):
+            x, y = self.backend.button_screen_position(name)
+            buttons[name] = [x, y, "red"]
+        self.group = ButtonGroup(buttons, automator=self.automator)
+
+    def test_states_from_one_capture(self):
+        """Test state vector and masks come from a single capture."""
+        self.frame.set_button_state("miner2", "inactive")
+        self.frame.set_button_state("miner3", "focus")
+        self.frame.paint_point((0.831883, 0.766496), (0, 0, 0), radius=1)
+
+        states = self.group.read_states()
+        assert states == {"miner1": "default", "miner2": "inactive", "miner3": None, "miner4": "default"}
+        assert self.automator.captures == 1
+        assert self.group.active_mask().tolist() == [True, False, False, True]
+        assert self.group.inactive() == ["miner2"]
+
+    def test_click_all_active(self):
+        """Test active buttons are clicked without re-reading each one."""
+        self.frame.set_button_state("miner4", "inactive")
+        clicked = self.group.click_all_active()
+        assert clicked == ["miner1", "miner2", "miner3"]
+        assert self.automator.clicks == [tuple(self.group.buttons[name][:2]) for name in clicked]
+        assert self.automator.captures == 1
+
+    def test_click_sequence_retries_remaining(self):
+        """Test a sequence stops at an inactive button and fails after the retry rounds."""
+        self.frame.set_button_state("miner2", "inactive")
+        assert not self.group.click_sequence(["miner1", "miner1", "miner2", "miner3"])
+        assert len(self.automator.clicks) == 2
+        assert self.automator.captures == 3
+
+        self.frame.set_button_state("miner2", "default")
+        assert self.group.click_sequence(["miner2", "miner3"])
+
+    def test_invalid_buttons(self):
+        """Test placeholder buttons are rejected and coordinates outside the capture read as not active."""
+        with pytest.raises(ValueError):
+            ButtonGroup({"1": [1, 1, 1]})
+        group = ButtonGroup({"edge": [5, 5, "red"], **self.group.buttons}, automator=self.automator)
+        assert group.state_codes().tolist()[0] == -1
+        assert group.active() == ["miner1", "miner2", "miner3", "miner4"]
+        assert np.array_equal(self.group.sample()[0], (199, 35, 21))
+
+    def test_no_frame_reads_inactive(self):
+        """Test a failed capture reads every button as not active instead of raising."""
+        self.automator.capture_frame = lambda max_age=0.0: None
+        assert self.group.sample().shape == (0, 3)
+        assert self.group.state_codes().tolist() == [-1, -1, -1, -1]
+        assert self.group.read_states() == dict.fromkeys(self.group.names)
+        assert self.group.click_all_active() == []
+        assert not self.group.click_sequence(["miner1"])
+        assert self.automator.clicks == []
+
+    def test_overwritten_snapshot_is_recaptured(self):
+        """Test a held frame whose scheduler slot was reused is not read."""
+        self.automator.snapshot.load(self.automator.capture_frame())
+        self.frame.set_button_state("miner1", "inactive")
+        for _ in range(self.automator.scheduler._ring.slots):
+            self.automator.scheduler.get_frame()
+
+        assert self.group.read_states()["miner1"] == "inactive"
+        assert self.automator.snapshot.frame is None
+        assert self.automator.captures == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
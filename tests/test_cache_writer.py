@@ -0,0 +1,111 @@
+"""
+Test the debounced background cache writer.
+"""
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utility.cache_writer import CacheWriter, format_cache_json
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestFormatCacheJson:
+    """Test the cache file formatting."""
+
+    def test_compacts_coordinate_arrays(self):
+        text = format_cache_json({"frame_area": [1, 2, 3, 4], "offset": [-5, 6.5], "name": "x"})
+        assert "[1, 2, 3, 4]" in text
+        assert "[-5, 6.5]" in text
+        assert json.loads(text) == {"frame_area": [1, 2, 3, 4], "offset": [-5, 6.5], "name": "x"}
+
+
+class TestCacheWriter:
+    """Test coalescing, skipping and atomic writes."""
+
+    def test_burst_is_written_once(self, tmp_path):
+        path = tmp_path / "cache.cache"
+        writer = CacheWriter(path, delay=0.05, max_delay=1.0)
+        writer.start()
+        try:
+            for i in range(20):
+                writer.submit({"tick": i})
+            assert wait_for(lambda: writer.written == 1)
+            time.sleep(0.1)
+            assert writer.written == 1
+            assert json.loads(path.read_text()) == {"tick": 19}
+        finally:
+            writer.stop()
+
+    def test_max_delay_bounds_continuous_burst(self, tmp_path):
+        path = tmp_path / "cache.cache"
+        writer = CacheWriter(path, delay=0.2, max_delay=0.3)
+        writer.start()
+        try:
+            start = time.monotonic()
+            while writer.written == 0 and time.monotonic() - start < 2.0:
+                writer.submit({"t": time.monotonic()})
+                time.sleep(0.02)
+            assert writer.written >= 1
+            assert time.monotonic() - start < 1.0
+        finally:
+            writer.stop()
+
+    def test_submit_copies_data(self, tmp_path):
+        path = tmp_path / "cache.cache"
+        writer = CacheWriter(path)
+        data = {"window_info": {"x": 1}}
+        writer.submit(data)
+        data["window_info"]["x"] = 2
+        assert writer.flush()
+        assert json.loads(path.read_text()) == {"window_info": {"x": 1}}
+
+    def test_unchanged_content_is_skipped(self, tmp_path):
+        path = tmp_path / "cache.cache"
+        writer = CacheWriter(path)
+        writer.submit({"a": 1})
+        assert writer.flush()
+        mtime = path.stat().st_mtime_ns
+        writer.submit({"a": 1})
+        assert not writer.flush()
+        assert path.stat().st_mtime_ns == mtime
+        assert writer.stats() == {"submitted": 2, "written": 1, "skipped": 1}
+
+    def test_write_leaves_no_temp_file(self, tmp_path):
+        path = tmp_path / "nested" / "cache.cache"
+        writer = CacheWriter(path)
+        writer.submit({"a": 1})
+        writer.flush()
+        assert path.exists()
+        assert [p.name for p in path.parent.iterdir()] == ["cache.cache"]
+
+    def test_flush_without_pending_is_noop(self, tmp_path):
+        writer = CacheWriter(tmp_path / "cache.cache")
+        assert not writer.flush()
+        assert not (tmp_path / "cache.cache").exists()
+
+    def test_stop_writes_pending_snapshot(self, tmp_path):
+        path = tmp_path / "cache.cache"
+        writer = CacheWriter(path, delay=10.0, max_delay=10.0)
+        writer.start()
+        writer.submit({"last": True})
+        writer.stop()
+        assert not writer.is_running
+        assert json.loads(path.read_text()) == {"last": True}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Test capture backends, the backend registry and the capture benchmark.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture import backends
+from capture.backends import ReplayBackend, create_backend, get_capture_backend, set_capture_backend
+from capture.bench_capture import bench_backend, format_results, run_benchmark
+from capture.frame_snapshot import FrameSnapshot
+
+
+class TestCaptureBackends:
+    """Test the CaptureBackend implementations and registry."""
+
+    def setup_method(self):
+        """Set up two fake screens and remember the active backend."""
+        self.first = np.zeros((100, 160, 3), dtype=np.uint8)
+        self.first[20, 30] = (199, 35, 21)
+        self.second = np.full((100, 160, 3), 7, dtype=np.uint8)
+        self.previous = backends._active_backend
+
+    def teardown_method(self):
+        backends._active_backend = self.previous
+
+    def test_replay_grab_and_pixel(self):
+        """Test that replay grabs crop the frame in screen coordinates."""
+        backend = ReplayBackend([self.first], origin=(100, 50))
+        region = backend.grab((120, 60, 140, 80))
+        assert region.shape == (20, 20, 3)
+        assert backend.pixel(130, 70) == (199, 35, 21)
+        assert backend.grab_image((100, 50, 110, 60)).size == (10, 10)
+
+        with pytest.raises(ValueError):
+            backend.grab((90, 50, 110, 60))
+
+    def test_replay_advance(self):
+        """Test frame advancing, looping and auto-advance."""
+        backend = ReplayBackend([self.first, Image.fromarray(self.second)], loop=False, auto_advance=True)
+        assert backend.pixel(30, 20) == (199, 35, 21)
+        assert backend.pixel(30, 20) == (7, 7, 7)
+        assert backend.advance() is False
+
+        looping = ReplayBackend([self.first, self.second])
+        assert looping.advance() is True
+        assert looping.advance() is True
+        assert looping.index == 0
+
+    def test_replay_from_file(self, tmp_path):
+        """Test loading replay frames from image files."""
+        path = tmp_path / "frame.png"
+        Image.fromarray(self.first).save(path)
+        backend = ReplayBackend([str(path)])
+        assert backend.pixel(30, 20) == (199, 35, 21)
+
+    def test_registry(self):
+        """Test creating and installing backends by name."""
+        assert isinstance(create_backend("replay", frames=[self.first]), ReplayBackend)
+        with pytest.raises(ValueError):
+            create_backend("nonexistent")
+
+        backend = set_capture_backend("replay", frames=[self.first])
+        assert get_capture_backend() is backend
+
+    def test_snapshot_uses_active_backend(self):
+        """Test that capture consumers grab through the process-wide backend."""
+        set_capture_backend(ReplayBackend([self.first]))
+        snapshot = FrameSnapshot(lambda: (0, 0, 160, 100))
+        assert snapshot.refresh() is True
+        assert snapshot.pixel(30, 20) == (199, 35, 21)
+
+    def test_bench(self):
+        """Test benchmark stats and reporting of unavailable backends."""
+        stats = bench_backend(ReplayBackend([self.first]), (0, 0, 16, 16), iterations=20)
+        assert stats["grabs_per_sec"] > 0
+        assert stats["p50_ms"] <= stats["p99_ms"]
+
+        results = run_benchmark(["nonexistent"], sizes=[16], iterations=5)
+        assert "error" in results[0]
+        assert "unavailable" in format_results(results)
+
+    def test_bench_offline_backends(self):
+        """Test offline backends are benchmarked and labelled as offline."""
+        results = run_benchmark(["replay", "synthetic", "recording"], sizes=[1, 16], iterations=5)
+        rows = {(row["backend"], row["size"]): row for row in results}
+        assert rows[("replay", 16)]["offline"] and rows[("synthetic", 16)]["grabs_per_sec"] > 0
+        assert "needs --recording" in rows[("recording", None)]["error"]
+
+        table = format_results(results).splitlines()
+        assert all("offline" in line for line in table[1:])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,72 @@
+"""
+Test CapturePlanner region planning and capture.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture import backends
+from capture.capture_planner import CapturePlanner
+
+
+class TestCapturePlanner:
+    """Test the CapturePlanner implementation."""
+
+    def setup_method(self):
+        """Set up a fake screen with a distinct value per pixel and record grabs."""
+        ys, xs = np.mgrid[0:600, 0:800]
+        self.screen = np.stack([xs % 256, ys % 256, (xs // 256) * 16 + ys // 256], axis=-1).astype(np.uint8)
+        self.grabs = []
+
+    def fake_grab(self, bbox=None, all_screens=False):
+        """Stand-in for ImageGrab.grab reading from the fake screen."""
+        self.grabs.append(bbox)
+        x1, y1, x2, y2 = bbox
+        return Image.fromarray(self.screen[y1:y2, x1:x2].copy())
+
+    @pytest.fixture(autouse=True)
+    def patch_grab(self, monkeypatch):
+        monkeypatch.setattr(backends.ImageGrab, "grab", self.fake_grab)
+
+    def test_nearby_regions_share_one_grab(self):
+        """Test that adjacent regions are merged into a single union grab."""
+        planner = CapturePlanner({"a": (10, 10, 60, 40), "b": (62, 10, 110, 40)})
+        assert len(planner.groups) == 1
+
+        views = planner.capture()
+        assert self.grabs == [(10, 10, 110, 40)]
+        assert np.array_equal(views["a"], self.screen[10:40, 10:60])
+        assert np.array_equal(views["b"], self.screen[10:40, 62:110])
+
+    def test_distant_regions_grab_separately(self):
+        """Test that far-apart regions are not merged into one large grab."""
+        planner = CapturePlanner({"a": (0, 0, 20, 20), "b": (700, 500, 720, 520)})
+        assert len(planner.groups) == 2
+        assert planner.captured_pixels == 800
+
+        views = planner.capture()
+        assert len(self.grabs) == 2
+        assert np.array_equal(views["a"], self.screen[0:20, 0:20])
+        assert np.array_equal(views["b"], self.screen[500:520, 700:720])
+
+    def test_from_frame_data_selects_names(self):
+        """Test building a planner from a frame's screen-space bbox entries."""
+        frame_data = {"bbox": {"watch_bbox": [100, 100, 200, 150], "canvas": [0, 0, 800, 600]}}
+        planner = CapturePlanner.from_frame_data(frame_data, ["watch_bbox"])
+        assert list(planner.regions) == ["watch_bbox"]
+        assert planner.capture()["watch_bbox"].shape == (50, 100, 3)
+
+    def test_invalid_region(self):
+        """Test that empty regions are rejected up front."""
+        with pytest.raises(ValueError):
+            CapturePlanner({"empty": (10, 10, 10, 20)})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
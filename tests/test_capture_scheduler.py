@@ -0,0 +1,117 @@
+"""
+Test CaptureScheduler shared capture, coalescing and statistics.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.backends import ReplayBackend
+from capture.capture_scheduler import CaptureScheduler
+
+
+class CountingBackend(ReplayBackend):
+    """Replay backend that counts grabs and can be slowed down."""
+
+    def __init__(self, frames, delay=0.0):
+        super().__init__(frames)
+        self.grabs = 0
+        self.delay = delay
+
+    def grab(self, bbox):
+        self.grabs += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return super().grab(bbox)
+
+
+class TestCaptureScheduler:
+    """Test the CaptureScheduler implementation."""
+
+    def setup_method(self):
+        """Set up a fake screen and a scheduler that is stopped after each test."""
+        self.screen = np.zeros((100, 160, 3), dtype=np.uint8)
+        self.screen[20, 30] = (199, 35, 21)
+        self.scheduler = None
+
+    def teardown_method(self):
+        if self.scheduler:
+            self.scheduler.stop()
+
+    def make(self, rate=None, delay=0.0, bbox=(0, 0, 160, 100)):
+        self.backend = CountingBackend([self.screen], delay=delay)
+        self.scheduler = CaptureScheduler(lambda: bbox, rate=rate, backend=self.backend)
+        return self.scheduler
+
+    def test_inline_capture_when_not_started(self):
+        """Test that get_frame captures inline without a running thread."""
+        scheduler = self.make()
+        frame = scheduler.get_frame()
+        assert frame is not None
+        assert tuple(frame.array[20, 30]) == (199, 35, 21)
+        assert scheduler.produced == 1
+
+    def test_on_demand_reuses_fresh_frame(self):
+        """Test that max_age lets consumers share a recent frame instead of grabbing again."""
+        scheduler = self.make()
+        scheduler.start()
+        first = scheduler.get_frame(max_age=0.0)
+        again = scheduler.get_frame(max_age=5.0)
+        assert again is first
+        assert self.backend.grabs == 1
+
+        newer = scheduler.get_frame(max_age=0.0)
+        assert newer.seq == first.seq + 1
+
+    def test_concurrent_requests_coalesce(self):
+        """Test that consumers asking at the same time share one capture."""
+        scheduler = self.make(delay=0.05)
+        scheduler.start()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(scheduler.get_frame())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(frame is not None for frame in results)
+        assert self.backend.grabs < 5
+
+    def test_fixed_rate_and_drop_stats(self):
+        """Test fixed-rate ticks and dropped frame counting for a slow subscriber."""
+        scheduler = self.make(rate=200)
+        subscription = scheduler.subscribe("slow")
+        scheduler.start()
+
+        assert subscription.wait(timeout=1.0) is not None
+        time.sleep(0.05)
+        assert subscription.wait(timeout=1.0) is not None
+
+        stats = scheduler.stats()
+        assert stats["produced"] >= 3
+        assert stats["consumed"] == 2
+        assert subscription.dropped >= 1
+        assert stats["subscriptions"][0]["name"] == "slow"
+        assert subscription.max_age >= 0
+
+        subscription.close()
+        assert scheduler.stats()["subscriptions"] == []
+
+    def test_unavailable_frame_area(self):
+        """Test that requests return None promptly when there is nothing to capture."""
+        scheduler = self.make(bbox=None)
+        scheduler.start()
+        start = time.monotonic()
+        assert scheduler.get_frame(timeout=2.0) is None
+        assert time.monotonic() - start < 1.0
+        assert scheduler.failed >= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+"""
+Test ChangeDetector tile-level frame diffing.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.backends import ReplayBackend
+from capture.change_detector import ChangeDetector
+from capture.frame_ring import FrameRingBuffer
+
+
+class TestChangeDetector:
+    """Test the ChangeDetector implementation."""
+
+    def setup_method(self):
+        """Set up a blank 100x160 frame."""
+        self.frame = np.zeros((100, 160, 3), dtype=np.uint8)
+
+    def test_first_frame_is_a_change(self):
+        """Test that the first update establishes the baseline as changed."""
+        detector = ChangeDetector(tile=16)
+        assert detector.changed() is True
+        assert detector.update(self.frame) is True
+        assert detector.update(self.frame.copy()) is False
+        assert detector.changed_regions == []
+
+    def test_changed_regions_and_region_queries(self):
+        """Test that only the tiles containing modified pixels are reported."""
+        detector = ChangeDetector(tile=16)
+        detector.update(self.frame)
+
+        moved = self.frame.copy()
+        moved[20, 40] = (255, 0, 0)
+        moved[21, 50] = (0, 255, 0)
+        moved[90, 155] = (0, 0, 255)
+        assert detector.update(moved) is True
+
+        assert detector.changed_regions == [(32, 16, 64, 32), (144, 80, 160, 96)]
+        assert detector.changed((30, 10, 60, 30)) is True
+        assert detector.changed((0, 40, 100, 70)) is False
+
+    def test_threshold_and_stride(self):
+        """Test that small differences below threshold and unsampled pixels are ignored."""
+        detector = ChangeDetector(tile=16, threshold=10)
+        detector.update(self.frame)
+        noisy = self.frame + 5
+        assert detector.update(noisy) is False
+
+        strided = ChangeDetector(tile=16, stride=2)
+        strided.update(self.frame)
+        odd = self.frame.copy()
+        odd[1, 1] = (255, 255, 255)
+        assert strided.update(odd) is False
+
+        with pytest.raises(ValueError):
+            ChangeDetector(tile=16, stride=3)
+
+    def test_same_captured_frame_is_not_a_change(self):
+        """Test that handing over the same CapturedFrame twice reports no change."""
+        ring = FrameRingBuffer(backend=ReplayBackend([self.frame]))
+        detector = ChangeDetector()
+        frame = ring.capture((0, 0, 160, 100))
+        assert detector.update(frame) is True
+        assert detector.update(frame) is False
+
+    def test_wait_for_change(self):
+        """Test waiting for a region to change, timing out and stopping early."""
+        moved = self.frame.copy()
+        moved[50, 50] = (255, 255, 255)
+        backend = ReplayBackend([self.frame, self.frame, moved], loop=False, auto_advance=True)
+        detector = ChangeDetector(tile=16, frame_source=lambda: backend.grab((0, 0, 160, 100)))
+        assert detector.wait_for_change((40, 40, 60, 60), timeout=1.0, interval=0) is True
+
+        still = ChangeDetector(frame_source=lambda: self.frame)
+        assert still.wait_for_change(timeout=0.05, interval=0.01) is False
+        assert still.wait_for_change(timeout=5.0, should_continue=lambda: False) is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
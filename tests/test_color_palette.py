@@ -0,0 +1,79 @@
+"""
+Test the compiled ColorPalette against the per-channel tolerance checks it replaces.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.color_palette import BUTTON_COLORS, ColorPalette, get_button_palette, pack_rgb, pack_rgb_array
+
+
+def reference_match(actual, expected, tolerance=5):
+    """The original pure-Python tolerance check."""
+    return all(abs(actual[i] - expected[i]) <= tolerance for i in range(3))
+
+
+class TestColorPalette:
+    """Test single-pixel and vectorized classification."""
+
+    def test_classify_states(self):
+        """Test exact and in-tolerance colors map to their (family, state)."""
+        palette = get_button_palette()
+        assert palette is get_button_palette()
+        assert palette.classify((199, 35, 21)) == ("red", "default")
+        assert palette.classify((204, 30, 26)) == ("red", "default")
+        assert palette.classify((205, 35, 21)) is None
+        assert palette.classify((0, 0, 0)) is None
+
+        assert palette.is_active((18, 104, 251), "blue")
+        assert not palette.is_inactive((18, 104, 251), "blue")
+        assert palette.is_inactive((60, 39, 8), "yellow")
+        assert not palette.is_active((60, 39, 8), "red")
+        assert palette.matches((15, 204, 45), "green")
+
+    def test_matches_reference_on_random_colors(self):
+        """Test the lookup agrees with the per-channel tolerance loop."""
+        palette = get_button_palette()
+        rng = np.random.default_rng(0)
+        anchors = np.array([rgb for states in BUTTON_COLORS.values() for rgb in states.values()])
+        near = anchors[rng.integers(0, len(anchors), 3000)] + rng.integers(-7, 8, (3000, 3))
+        samples = np.vstack([near.clip(0, 255), rng.integers(0, 256, (1000, 3))]).astype(np.uint8)
+
+        for rgb in samples.tolist():
+            for family, states in BUTTON_COLORS.items():
+                expected_active = any(reference_match(rgb, states[s]) for s in ("default", "focus"))
+                assert palette.is_active(rgb, family) == expected_active
+                assert palette.is_inactive(rgb, family) == reference_match(rgb, states["inactive"])
+
+    def test_vectorized(self):
+        """Test classify_array and match_array agree with single-pixel classification."""
+        palette = get_button_palette()
+        pixels = np.array(
+            [[(199, 35, 21), (20, 34, 57), (0, 0, 0)], [(253, 40, 16), (16, 46, 22), (255, 255, 255)]],
+            dtype=np.uint8,
+        )
+
+        labels = palette.classify_array(pixels)
+        assert labels.shape == (2, 3)
+        for index, rgb in zip(labels.ravel(), pixels.reshape(-1, 3).tolist()):
+            expected = palette.classify(rgb)
+            assert (palette.labels[index] if index >= 0 else None) == expected
+
+        red_active = palette.match_array(pixels, "red", ("default", "focus"))
+        assert red_active.tolist() == [[True, False, False], [True, False, False]]
+        assert int(pack_rgb_array(pixels)[0, 0]) == pack_rgb((199, 35, 21))
+
+    def test_custom_colors(self):
+        """Test a palette built from custom colors and tolerance."""
+        palette = ColorPalette({"purple": {"default": (120, 40, 160)}}, tolerance=2)
+        assert palette.classify((122, 38, 160)) == ("purple", "default")
+        assert palette.classify((123, 40, 160)) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
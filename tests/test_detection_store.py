@@ -0,0 +1,99 @@
+"""
+Test the compiled frame detection store.
+"""
+
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.synthetic_frame import FRAME_DETECTION_FILE
+from detection.border_classifier import BorderClassifier
+from detection.detection_store import SCHEMA_VERSION, DetectionStore, load_detection_store
+
+
+class TestDetectionStore:
+    """Test building, saving and revalidating the detection store."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        path = tmp_path / "frame_detection.json"
+        shutil.copy(FRAME_DETECTION_FILE, path)
+        return path
+
+    def test_round_trip(self, source, tmp_path):
+        """Test the saved store holds exactly the detection features and loads without pickle."""
+        store = DetectionStore.from_json(source)
+        store.save(tmp_path / "store.npz")
+        loaded = DetectionStore.load(tmp_path / "store.npz")
+
+        assert len(loaded) == len(json.loads(source.read_text(encoding="utf-8")))
+        assert loaded.frame_ids[0] == "1.1" and loaded.frame_names[0] == "Iron Mine"
+        assert loaded.features.dtype == np.float32
+        assert np.array_equal(loaded.features, store.features)
+        assert loaded.source_hash == store.source_hash
+
+        with np.load(tmp_path / "store.npz", allow_pickle=False) as archive:
+            assert set(archive.files) == {
+                "schema_version",
+                "source_hash",
+                "keys",
+                "frame_ids",
+                "frame_names",
+                "features",
+            }
+
+    def test_classifier_from_store(self, source):
+        """Test a classifier built from the store matches one built from the JSON."""
+        from_json = BorderClassifier(json.loads(source.read_text(encoding="utf-8")))
+        from_store = BorderClassifier.from_store(DetectionStore.from_json(source))
+        assert from_store.keys == from_json.keys
+        assert np.array_equal(from_store.matrix, from_json.matrix)
+        signature = from_json.matrix[7] + 3
+        assert from_store.classify(signature) == from_json.classify(signature)
+
+    def test_rebuilds_when_source_changes(self, source, tmp_path):
+        """Test the store is reused while the source is unchanged and rebuilt after an edit."""
+        store_path = tmp_path / "frame_detection.npz"
+        first = load_detection_store(source, store_path)
+        assert store_path.exists()
+        mtime = store_path.stat().st_mtime_ns
+        assert load_detection_store(source, store_path).source_hash == first.source_hash
+        assert store_path.stat().st_mtime_ns == mtime
+
+        data = json.loads(source.read_text(encoding="utf-8"))
+        data["1.1_Iron_Mine"]["left_border"]["average_color"] = [1, 2, 3]
+        source.write_text(json.dumps(data), encoding="utf-8")
+
+        rebuilt = load_detection_store(source, store_path)
+        assert rebuilt.source_hash != first.source_hash
+        assert rebuilt.features[0, :3].tolist() == [1, 2, 3]
+        assert DetectionStore.load(store_path).source_hash == rebuilt.source_hash
+
+    def test_schema_mismatch_and_analysis_format(self, source, tmp_path):
+        """Test an outdated store is rebuilt and AnalysisDatabase-style sources are accepted."""
+        store_path = tmp_path / "frame_detection.npz"
+        np.savez(store_path, schema_version=np.int32(SCHEMA_VERSION + 1))
+        with pytest.raises(ValueError):
+            DetectionStore.load(store_path)
+        assert len(load_detection_store(source, store_path)) == 50
+
+        wrapped = tmp_path / "analysis.json"
+        wrapped.write_text(
+            json.dumps({"metadata": {}, "analyses": json.loads(source.read_text(encoding="utf-8"))}),
+            encoding="utf-8",
+        )
+        assert DetectionStore.from_json(wrapped).keys == DetectionStore.from_json(source).keys
+
+    def test_missing_source(self, tmp_path):
+        """Test a missing source without a store yields None."""
+        assert load_detection_store(tmp_path / "missing.json", tmp_path / "missing.npz") is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
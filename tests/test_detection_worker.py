@@ -0,0 +1,104 @@
+"""
+Test the background frame detection worker.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from detection.detection_worker import DetectionWorker
+
+
+def wait_until(predicate, timeout=2.0):
+    """Run the Qt event loop until predicate() holds; results are queued to this (GUI) thread."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+    QCoreApplication.processEvents()
+    return predicate()
+
+
+class TestDetectionWorker:
+    """Test DetectionWorker request coalescing and result publishing."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setup_method(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.published = []
+        self.done = threading.Event()
+        self.calls = 0
+
+    def detect(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(2)
+        return True, {"frame_id": "1.1", "call": self.calls}
+
+    def on_ready(self, detected, frame_info):
+        self.published.append((detected, frame_info))
+        self.done.set()
+
+    def make(self, detect=None):
+        worker = DetectionWorker(detect or self.detect)
+        worker.detection_ready.connect(self.on_ready)
+        worker.start()
+        return worker
+
+    def test_publishes_result(self):
+        """Test a request runs detection on the worker thread and emits its result."""
+        self.release.set()
+        worker = self.make()
+        try:
+            worker.request()
+            assert wait_until(self.done.is_set)
+            assert self.published == [(True, {"frame_id": "1.1", "call": 1})]
+        finally:
+            worker.stop()
+        assert not worker.is_running
+
+    def test_coalesces_requests(self):
+        """Test requests during a running detection collapse into one follow-up run."""
+        worker = self.make()
+        try:
+            worker.request()
+            assert self.started.wait(2)
+            for _ in range(5):
+                worker.request()
+            self.release.set()
+            wait_until(lambda: len(self.published) >= 2)
+            wait_until(lambda: False, timeout=0.1)
+            assert len(self.published) == 2
+            assert self.calls == 2
+            assert worker.stats() == {"requests": 6, "runs": 2, "coalesced": 4}
+        finally:
+            worker.stop()
+
+    def test_detect_errors_publish_not_detected(self):
+        """Test an exception in detection is reported as no frame instead of killing the thread."""
+
+        def failing():
+            raise RuntimeError("capture failed")
+
+        worker = self.make(failing)
+        try:
+            worker.request()
+            assert wait_until(self.done.is_set)
+            assert self.published == [(False, None)]
+            assert worker.is_running
+        finally:
+            worker.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
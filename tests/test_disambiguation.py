@@ -0,0 +1,97 @@
+"""
+Test data-driven disambiguation of frames with colliding borders.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.synthetic_frame import FRAME_DETECTION_FILE, SyntheticFrame, load_border_colors, load_frames_database
+from detection.border_classifier import BorderClassifier
+from detection.disambiguation import DisambiguationProbes
+
+
+class TestDisambiguationProbes:
+    """Test collision grouping and probe evaluation against synthetic frames."""
+
+    @classmethod
+    def setup_class(cls):
+        with open(FRAME_DETECTION_FILE, "r", encoding="utf-8") as f:
+            cls.classifier = BorderClassifier(json.load(f))
+        cls.database = load_frames_database()
+        cls.borders = load_border_colors()
+        cls.probes = DisambiguationProbes(cls.classifier, cls.database)
+
+    def render(self, frame_id, state="default"):
+        frame = SyntheticFrame(frame_id, 800, 600, frames_database=self.database, border_colors=self.borders)
+        frame.set_all_buttons(state)
+        return frame.render()
+
+    def test_groups_from_border_collisions(self):
+        """Test only frames with identical borders are grouped, with probes from their buttons."""
+        assert [group.frame_ids for group in self.probes.groups] == [["2.3", "2.4"]]
+        assert self.probes.needs_disambiguation("2.4")
+        assert not self.probes.needs_disambiguation("1.1")
+        assert self.probes.resolve("1.1", self.render("1.1")) is None
+
+    @pytest.mark.parametrize("state", ["default", "focus", "inactive"])
+    def test_resolves_twins(self, state):
+        """Test each twin is recognised from its own buttons in any state."""
+        for frame_id in ("2.3", "2.4"):
+            image = self.render(frame_id, state)
+            for primary in ("2.3", "2.4"):
+                result = self.probes.resolve(primary, image)
+                assert result["frame_id"] == frame_id
+                assert result["scores"][frame_id] == 1.0
+
+    def test_resolves_from_probe_region(self):
+        """Test a capture of just the probe region resolves like the whole frame."""
+        assert self.probes.probe_region("1.1", 800, 600) is None
+        x1, y1, x2, y2 = self.probes.probe_region("2.3", 800, 600)
+        assert self.probes.probe_region("2.4", 800, 600) == (x1, y1, x2, y2)
+        for frame_id in ("2.3", "2.4"):
+            crop = self.render(frame_id)[y1:y2, x1:x2]
+            result = self.probes.resolve("2.3", crop, frame_size=(800, 600), offset=(x1, y1))
+            assert result["frame_id"] == frame_id
+
+        with pytest.raises(ValueError):
+            self.probes.resolve("2.3", crop[1:], frame_size=(800, 600), offset=(x1, y1))
+
+    def test_undecided(self):
+        """Test frames without any matching probe are left to the primary detection."""
+        assert self.probes.resolve("2.3", np.zeros((600, 800, 3), dtype=np.uint8)) is None
+
+    def test_new_collisions_need_no_code(self):
+        """Test a frame added with colliding borders is grouped and resolved from data alone."""
+        detection = {
+            frame_id: {
+                "frame_id": frame_id,
+                "frame_name": frame_id,
+                "left_border": {"average_color": left},
+                "right_border": {"average_color": [20, 20, 20]},
+            }
+            for frame_id, left in [("A", [10, 10, 10]), ("B", [10, 10, 11]), ("C", [10, 11, 10])]
+        }
+        database = {
+            "A": {"buttons": {"go": [0.1, 0.1, "blue"], "1": [1, 1, 1]}},
+            "B": {"buttons": {"go": [0.5, 0.5, "green"]}},
+            "C": {"buttons": {"go": [0.9, 0.9, "yellow"], "stop": [0.9, 0.1, "yellow"]}},
+        }
+        probes = DisambiguationProbes(BorderClassifier(detection), database)
+        assert [group.frame_ids for group in probes.groups] == [["A", "B", "C"]]
+
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        image[90, 90] = (242, 151, 0)
+        image[10, 90] = (60, 39, 8)
+        result = probes.resolve("A", image)
+        assert result["frame_id"] == "C"
+        assert result["scores"] == {"A": 0.0, "B": 0.0, "C": 1.0}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,144 @@
+"""
+Test FrameRecorder chunked recordings, FrameRecording reads and RecordingBackend replay.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.backends import ReplayBackend, create_backend
+from capture.capture_planner import CapturePlanner
+from capture.capture_scheduler import CaptureScheduler
+from capture.frame_recorder import CHUNKS_FILE, FrameRecorder, FrameRecording, RecordingBackend
+from capture.frame_ring import get_frame_recorder
+
+
+def make_frame(value, shape=(40, 60, 3)):
+    frame = np.full(shape, value, dtype=np.uint8)
+    frame[5, 7] = (199, 35, 21)
+    return frame
+
+
+class TestFrameRecorder:
+    """Test recording and replaying captured frames."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip_with_chunks(self, tmp_path, compress):
+        """Test frames, metadata and chunk splitting survive a round trip."""
+        with FrameRecorder(tmp_path / "rec", chunk_frames=2, compress=compress) as recorder:
+            recorder.frame_id = "9.1"
+            for i in range(3):
+                recorder.record(make_frame(i), timestamp=10.0 + i, bbox=(100, 50, 160, 90))
+            recorder.record(make_frame(9, shape=(20, 30, 3)), frame_id="2.4", timestamp=13.0)
+
+        recording = FrameRecording(tmp_path / "rec")
+        assert len(recording) == 4
+        assert len(recording.chunks) == 3  # 2 + 1 frames, then a new size
+        assert recording.meta(0)["frame_id"] == "9.1"
+        assert recording.meta(3)["frame_id"] == "2.4"
+        assert recording.meta(1)["bbox"] == [100, 50, 160, 90]
+        assert recording.duration == 3.0
+        assert np.array_equal(recording.frame(2), make_frame(2))
+        assert recording.frame(3).shape == (20, 30, 3)
+        if not compress:
+            assert isinstance(recording.frame(0).base, np.memmap)
+
+    def test_interleaved_sizes_share_chunks(self, tmp_path):
+        """Test alternating capture sizes fill one chunk per size, read back in time order."""
+        with FrameRecorder(tmp_path / "rec", chunk_frames=2) as recorder:
+            for i in range(4):
+                recorder.record(make_frame(i), timestamp=2.0 * i, bbox=(0, 0, 60, 40))
+                recorder.record(make_frame(i, shape=(10, 10, 3)), timestamp=2.0 * i + 1, bbox=(5, 5, 15, 15))
+
+        recording = FrameRecording(tmp_path / "rec")
+        assert len(recording.chunks) == 4
+        assert list(recording.timestamps) == [float(t) for t in range(8)]
+        assert [int(recording.frame(i)[0, 0, 0]) for i in range(8)] == [0, 0, 1, 1, 2, 2, 3, 3]
+
+    def test_index_is_appended_per_chunk(self, tmp_path):
+        """Test each full chunk appends its index line and a cut-off line is ignored."""
+        recorder = FrameRecorder(tmp_path / "rec", chunk_frames=2)
+        for i in range(5):
+            recorder.record(make_frame(i), timestamp=float(i))
+        assert len((tmp_path / "rec" / CHUNKS_FILE).read_text().splitlines()) == 2
+
+        # Simulate a crash mid-write: the closed chunks stay readable
+        with open(tmp_path / "rec" / CHUNKS_FILE, "a") as f:
+            f.write('{"index": 2, "fi')
+        recording = FrameRecording(tmp_path / "rec")
+        assert len(recording) == 4
+
+    def test_existing_recording_is_not_overwritten(self, tmp_path):
+        """Test that a recorder refuses to write over a finished recording."""
+        FrameRecorder(tmp_path / "rec").close()
+        with pytest.raises(FileExistsError):
+            FrameRecorder(tmp_path / "rec")
+
+    def test_recording_backend_step_and_timed(self, tmp_path):
+        """Test stepped replay and timestamp-driven replay at accelerated speed."""
+        with FrameRecorder(tmp_path / "rec") as recorder:
+            for i in range(3):
+                recorder.record(make_frame(i), timestamp=float(i), bbox=(100, 50, 160, 90))
+
+        stepped = RecordingBackend(tmp_path / "rec", speed=None)
+        assert [int(stepped.grab((100, 50, 101, 51))[0, 0, 0]) for _ in range(4)] == [0, 1, 2, 2]
+        assert stepped.pixel(107, 55) == (199, 35, 21)
+        with pytest.raises(ValueError):
+            stepped.grab((0, 0, 10, 10))
+
+        fast = create_backend("recording", path=tmp_path / "rec", speed=1e6)
+        fast.grab((100, 50, 101, 51))
+        assert fast.finished
+
+    def test_recording_backend_crops_covering_frame(self, tmp_path):
+        """Test grabs are served from the latest frame whose bbox contains them."""
+        with FrameRecorder(tmp_path / "rec") as recorder:
+            recorder.record(make_frame(1), timestamp=0.0, bbox=(100, 50, 160, 90))
+            recorder.record(make_frame(2, shape=(10, 10, 3)), timestamp=1.0, bbox=(200, 50, 210, 60))
+
+        backend = RecordingBackend(tmp_path / "rec", speed=1e6)
+        assert int(backend.grab((100, 50, 101, 51))[0, 0, 0]) == 1
+        assert backend.finished
+        assert int(backend.grab((200, 50, 201, 51))[0, 0, 0]) == 2
+        assert int(backend.grab((100, 50, 101, 51))[0, 0, 0]) == 1
+        with pytest.raises(ValueError):
+            backend.grab((0, 0, 10, 10))
+
+    def test_scheduler_records_produced_frames(self, tmp_path):
+        """Test that the capture scheduler appends every produced frame to its recorder."""
+        scheduler = CaptureScheduler(lambda: (0, 0, 60, 40), backend=ReplayBackend([make_frame(3)]))
+        recorder = scheduler.start_recording(tmp_path / "rec")
+        recorder.frame_id = "11.3"
+        scheduler.get_frame()
+        scheduler.get_frame()
+        scheduler.stop()
+
+        recording = FrameRecording(tmp_path / "rec")
+        assert len(recording) == 2
+        assert recording.meta(1)["frame_id"] == "11.3"
+        assert scheduler.recorder is None
+
+    def test_planner_captures_are_recorded(self, tmp_path):
+        """Test that ring captures outside the scheduler (capture planners) are recorded too."""
+        backend = ReplayBackend([make_frame(4, shape=(300, 400, 3))])
+        scheduler = CaptureScheduler(lambda: (0, 0, 60, 40), backend=backend)
+        planner = CapturePlanner({"a": (0, 0, 10, 10), "b": (300, 200, 310, 210)}, backend=backend)
+        scheduler.start_recording(tmp_path / "rec")
+        assert get_frame_recorder() is scheduler.recorder
+        planner.capture()
+        planner.capture()
+        scheduler.stop()
+        assert get_frame_recorder() is None
+        planner.capture()
+
+        recording = FrameRecording(tmp_path / "rec")
+        assert len(recording) == 2 * len(planner.groups)
+        assert sorted({tuple(meta["bbox"]) for meta in recording.frames}) == sorted(bbox for bbox, _ in planner.groups)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
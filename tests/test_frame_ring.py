@@ -0,0 +1,123 @@
+"""
+Test FrameRingBuffer preallocated capture slots.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.backends import ReplayBackend
+from capture.frame_ring import FrameRingBuffer
+
+
+class HalfWriteBackend(ReplayBackend):
+    """Writes the top half of the slot, then calls during_write() before finishing (or failing)."""
+
+    def __init__(self, frames, during_write, fail=False):
+        super().__init__(frames, auto_advance=True)
+        self.during_write = during_write
+        self.fail = fail
+
+    def grab_into(self, bbox, out):
+        pixels = self.grab(bbox)
+        half = out.shape[0] // 2
+        out[:half] = pixels[:half]
+        self.during_write()
+        if self.fail:
+            raise OSError("grab failed")
+        out[half:] = pixels[half:]
+        return out
+
+
+class TestFrameRingBuffer:
+    """Test the FrameRingBuffer implementation."""
+
+    def setup_method(self):
+        """Set up a replay backend with two distinct screens."""
+        first = np.zeros((100, 160, 3), dtype=np.uint8)
+        first[20, 30] = (199, 35, 21)
+        second = np.full((100, 160, 3), 9, dtype=np.uint8)
+        self.backend = ReplayBackend([first, second], auto_advance=True)
+
+    def test_capture_returns_read_only_view(self):
+        """Test that frames are read-only views with sequence, timestamp and bbox."""
+        ring = FrameRingBuffer(slots=2, backend=self.backend)
+        frame = ring.capture((10, 10, 50, 40))
+
+        assert frame.seq == 1
+        assert frame.bbox == (10, 10, 50, 40)
+        assert frame.origin == (10, 10)
+        assert (frame.width, frame.height) == (40, 30)
+        assert tuple(frame.array[10, 20]) == (199, 35, 21)
+        assert frame.age >= 0
+        with pytest.raises(ValueError):
+            frame.array[0, 0] = (1, 2, 3)
+        assert ring.latest is frame
+
+    def test_slots_are_reused_without_allocation(self):
+        """Test that captures cycle through the same preallocated buffers."""
+        ring = FrameRingBuffer(slots=2, backend=self.backend)
+        first = ring.capture((0, 0, 40, 30))
+        second = ring.capture((0, 0, 40, 30))
+        third = ring.capture((0, 0, 40, 30))
+
+        assert first.array.base is third.array.base
+        assert first.array.base is not second.array.base
+        assert ring.is_current(second) and ring.is_current(third)
+        assert not ring.is_current(first)
+        assert third.current and not first.current
+
+    def test_resize_reallocates(self):
+        """Test that a new capture size gets new slots and old frames stay intact."""
+        ring = FrameRingBuffer(slots=1, backend=self.backend)
+        small = ring.capture((0, 0, 40, 30))
+        small_copy = small.copy()
+        large = ring.capture((0, 0, 80, 60))
+
+        assert large.array.shape == (60, 80, 3)
+        assert ring.is_current(small)
+        assert np.array_equal(small.array, small_copy)
+
+    def test_frame_is_stale_while_its_slot_is_written(self):
+        """Test that a read racing the grab into a held frame's slot is reported as torn."""
+        frames = [np.zeros((100, 160, 3), dtype=np.uint8), np.full((100, 160, 3), 9, dtype=np.uint8)]
+        backend = HalfWriteBackend(frames, lambda: None)
+        ring = FrameRingBuffer(slots=1, backend=backend)
+        held = ring.capture((0, 0, 40, 30))
+
+        # Read the held frame (top row already rewritten, bottom row not yet) from inside the grab
+        seen = []
+        backend.during_write = lambda: seen.append((held.current, int(held.array[0, 0, 0]), int(held.array[-1, 0, 0])))
+
+        ring.capture((0, 0, 40, 30))
+        assert seen == [(False, 9, 0)]  # Mixed pixels, and already marked stale
+        assert not held.current
+
+    def test_failed_grab_leaves_slot_stale(self):
+        """Test that a grab failing mid-write marks the slot's frame stale and keeps seq in order."""
+        backend = HalfWriteBackend([np.zeros((100, 160, 3), dtype=np.uint8)], lambda: None)
+        ring = FrameRingBuffer(slots=1, backend=backend)
+        held = ring.capture((0, 0, 40, 30))
+
+        backend.fail = True
+        with pytest.raises(OSError):
+            ring.capture((0, 0, 40, 30))
+        assert not held.current
+        assert ring.seq == 1
+
+        backend.fail = False
+        assert ring.capture((0, 0, 40, 30)).seq == 2
+
+    def test_invalid_bbox(self):
+        """Test that empty bboxes are rejected."""
+        ring = FrameRingBuffer(backend=self.backend)
+        with pytest.raises(ValueError):
+            ring.capture((10, 10, 10, 20))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,93 @@
+"""
+Test FrameSnapshot capture-once pixel probes.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture import backends
+from capture.frame_ring import FrameRingBuffer
+from capture.frame_snapshot import FrameSnapshot
+
+
+class TestFrameSnapshot:
+    """Test the FrameSnapshot implementation."""
+
+    def setup_method(self):
+        """Set up a fake screen and count grabs."""
+        self.screen = np.zeros((200, 300, 3), dtype=np.uint8)
+        self.screen[50, 120] = (199, 35, 21)
+        self.grabs = 0
+
+    def fake_grab(self, bbox=None, all_screens=False):
+        """Stand-in for ImageGrab.grab reading from the fake screen."""
+        self.grabs += 1
+        x1, y1, x2, y2 = bbox
+        return Image.fromarray(self.screen[y1:y2, x1:x2].copy())
+
+    @pytest.fixture(autouse=True)
+    def patch_grab(self, monkeypatch):
+        monkeypatch.setattr(backends.ImageGrab, "grab", self.fake_grab)
+
+    def test_no_capture_defers_to_caller(self):
+        """Test that probes return None until the snapshot is refreshed."""
+        snapshot = FrameSnapshot(lambda: (100, 40, 200, 140))
+        assert snapshot.pixel(120, 50) is None
+        assert self.grabs == 0
+
+    def test_probes_share_one_capture(self):
+        """Test that many probes read from a single grab in screen coordinates."""
+        snapshot = FrameSnapshot(lambda: (100, 40, 200, 140))
+        assert snapshot.refresh() is True
+
+        assert snapshot.pixel(120, 50) == (199, 35, 21)
+        assert snapshot.pixel(121, 50) == (0, 0, 0)
+        assert snapshot.pixel_matches_color(120, 50, (199, 35, 21)) is True
+        assert snapshot.pixel_matches_color(120, 50, (195, 35, 21), tolerance=5) is True
+        assert self.grabs == 1
+
+    def test_outside_region_and_invalidate(self):
+        """Test that probes outside the capture or after invalidate() return None."""
+        snapshot = FrameSnapshot(lambda: (100, 40, 200, 140))
+        snapshot.refresh()
+        assert snapshot.pixel(99, 50) is None
+        assert snapshot.pixel(120, 140) is None
+
+        snapshot.invalidate()
+        assert snapshot.pixel(120, 50) is None
+
+    def test_max_age_recaptures(self):
+        """Test that a stale snapshot re-captures on the next probe."""
+        snapshot = FrameSnapshot(lambda: (100, 40, 200, 140), max_age=0.0)
+        snapshot.refresh()
+        self.screen[50, 120] = (16, 46, 22)
+
+        assert snapshot.pixel(120, 50) == (16, 46, 22)
+        assert self.grabs == 2
+
+    def test_overwritten_frame_is_dropped(self):
+        """Test that a loaded frame whose ring slot was reused is not probed."""
+        ring = FrameRingBuffer(slots=1, backend=backends.ReplayBackend([self.screen]))
+        snapshot = FrameSnapshot(lambda: (100, 40, 200, 140))
+        snapshot.load(ring.capture((100, 40, 200, 140)))
+        assert snapshot.pixel(120, 50) == (199, 35, 21)
+
+        ring.capture((100, 40, 200, 140))
+        assert snapshot.pixel(120, 50) is None
+        assert snapshot.frame is None
+
+    def test_missing_region(self):
+        """Test that refresh fails cleanly when no frame area is available."""
+        snapshot = FrameSnapshot(lambda: None)
+        assert snapshot.refresh() is False
+        assert snapshot.pixel(0, 0) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+"""
+Test the indexed in-memory frame store.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utility.frame_store import FrameStore, frame_tier, freeze
+
+FRAMES = [
+    {"id": "1.1", "name": "Iron Mine", "item": "Iron Ore", "colors": {"ore": [10, 20, 30]}, "buttons": {}},
+    {"id": "1.2", "name": "Iron Smelter", "item": "Iron Bar", "bbox": {"canvas": [1, 2, 3, 4]}},
+    {"id": "4.2", "name": "Circuit Fab", "item": "Circuit", "automation": {"can_automate": 1}},
+    {"id": "x", "name": "Oddity"},
+]
+
+
+def write_frames(path, frames):
+    path.write_text(json.dumps({"frames": frames}), encoding="utf-8")
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    path = tmp_path / "frames.cache"
+    write_frames(path, FRAMES)
+    return path
+
+
+class TestFreeze:
+    """Test read-only conversion of parsed JSON."""
+
+    def test_nested_values_are_read_only(self):
+        frozen = freeze({"colors": {"ore": [1, 2, 3]}, "list": [[1, 2], {"a": 1}]})
+        assert frozen["colors"]["ore"] == (1, 2, 3)
+        assert frozen["list"][0] == (1, 2)
+        with pytest.raises(TypeError):
+            frozen["colors"]["ore"] = (0, 0, 0)
+        with pytest.raises(TypeError):
+            frozen["list"][1]["a"] = 2
+
+    def test_frame_tier(self):
+        assert frame_tier("4.2") == 4
+        assert frame_tier("13.10") == 13
+        assert frame_tier("x") == 0
+        assert frame_tier("") == 0
+
+
+class TestFrameStore:
+    """Test lookups, tier index and change detection."""
+
+    def test_lookup_by_id(self, cache_file):
+        store = FrameStore(cache_file)
+        frame = store.get("1.1")
+        assert frame["name"] == "Iron Mine"
+        assert frame["colors"]["ore"] == (10, 20, 30)
+        assert store.get("9.9") is None
+        assert "4.2" in store
+        assert len(store) == 4
+
+    def test_views_are_shared_and_immutable(self, cache_file):
+        store = FrameStore(cache_file)
+        assert store.get("1.1") is store.get("1.1")
+        with pytest.raises(TypeError):
+            store.get("1.1")["name"] = "Changed"
+
+    def test_tier_index_keeps_file_order(self, cache_file):
+        store = FrameStore(cache_file)
+        assert [record.id for record in store.tier(1)] == ["1.1", "1.2"]
+        assert list(store.tiers()) == [0, 1, 4]
+        assert store.tier(7) == ()
+        assert [record.id for record in store.frames()] == ["1.1", "1.2", "4.2", "x"]
+
+    def test_lookups_do_not_reload_unchanged_file(self, cache_file):
+        store = FrameStore(cache_file, check_interval=60.0)
+        for _ in range(100):
+            store.get("1.2")
+        assert store.loads == 1
+        assert store.checks == 1
+
+    def test_reloads_after_change(self, cache_file):
+        store = FrameStore(cache_file, check_interval=60.0)
+        assert store.get("1.1")["name"] == "Iron Mine"
+
+        write_frames(cache_file, [dict(FRAMES[0], name="Copper Mine")])
+        os.utime(cache_file, ns=(1, 1))
+        assert store.get("1.1")["name"] == "Iron Mine"  # still within check_interval
+
+        store.invalidate()
+        assert store.get("1.1")["name"] == "Copper Mine"
+        assert len(store) == 1
+        assert store.loads == 2
+
+    def test_same_content_is_not_parsed_again(self, cache_file):
+        store = FrameStore(cache_file)
+        store.refresh(force=True)
+        os.utime(cache_file, ns=(1, 1))
+        assert not store.refresh(force=True)
+        assert store.loads == 1
+
+    def test_missing_file_keeps_loaded_frames(self, cache_file):
+        store = FrameStore(cache_file)
+        store.refresh(force=True)
+        cache_file.unlink()
+        assert not store.refresh(force=True)
+        assert store.get("1.1") is not None
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "frames.cache"
+        path.write_text("{not json", encoding="utf-8")
+        store = FrameStore(path)
+        assert store.get("1.1") is None
+        assert len(store) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
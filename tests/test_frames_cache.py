@@ -0,0 +1,176 @@
+"""
+Test incremental frames.cache generation.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utility.frames_cache import (
+    NO_AREA,
+    FramesCacheBuilder,
+    area_key,
+    compile_frame,
+    dumps_cache,
+    project_frames,
+)
+
+AREA = (100, 50, 1000, 500)
+
+FRAME = {
+    "id": "1.1",
+    "name": "Iron Mine",
+    "buttons": {"miner_1": [0.5, 0.5, "green"]},
+    "interactions": {"start": [0.1, 0.2], "path": [[0.0, 0.0], [1.0, 1.0]]},
+    "bbox": {"canvas": [0.1, 0.2, 0.3, 0.4]},
+    "colors": {"ore": [10, 20, 30], "shades": [[1, 2, 3], [4, 5, 6]]},
+    "offset": [5, 7],
+    "item": "Iron Ore",
+}
+
+
+def write_database(path, frames):
+    path.write_text(json.dumps({"frames": frames}), encoding="utf-8")
+
+
+@pytest.fixture
+def files(tmp_path):
+    database = tmp_path / "frames_database.json"
+    write_database(database, [FRAME])
+    return database, tmp_path / "cache" / "frames.cache"
+
+
+class TestProjection:
+    """Test coordinate detection and projection."""
+
+    def test_screen_coordinates(self):
+        (frame,) = project_frames([compile_frame(FRAME)], AREA)
+        assert frame["buttons"]["miner_1"] == [600, 300, "green"]
+        assert frame["interactions"]["start"] == [200, 150]
+        assert frame["interactions"]["path"] == [[100, 50], [1100, 550]]
+        assert frame["bbox"]["canvas"] == [200, 150, 400, 250]
+        assert frame["colors"] == {"ore": [10, 20, 30], "shades": [[1, 2, 3], [4, 5, 6]]}
+        assert frame["offset"] == [5, 7]
+        assert frame["item"] == "Iron Ore"
+
+    def test_frame_coordinates(self):
+        (frame,) = project_frames([compile_frame(FRAME)], AREA)
+        frame_xy = frame["frame_xy"]
+        assert "buttons" not in frame_xy
+        assert frame_xy["interactions"]["start"] == [100, 100]
+        assert frame_xy["bbox"]["canvas"] == [100, 100, 300, 200]
+        assert frame_xy["colors"]["ore"] == [10, 20, 30]
+        # Non-percent pairs are screen values and are shifted like the rest
+        assert frame_xy["offset"] == [-95, -43]
+
+    def test_template_is_reusable(self):
+        templates = [compile_frame(FRAME)]
+        first = project_frames(templates, AREA)
+        second = project_frames(templates, (0, 0, 100, 100))
+        assert first[0]["interactions"]["start"] == [200, 150]
+        assert second[0]["interactions"]["start"] == [10, 20]
+
+    def test_invalid_button(self):
+        with pytest.raises(ValueError):
+            compile_frame({"buttons": {"bad": [0.5, 0.5]}})
+
+    def test_area_key(self):
+        assert area_key(None) == NO_AREA
+        assert area_key({"x": 1, "y": 2, "width": 3, "height": 4, "extra": 5}) == (1, 2, 3, 4)
+
+
+class TestDumpsCache:
+    """Test frames.cache serialization."""
+
+    def test_round_trip_with_inline_values(self):
+        (frame,) = project_frames([compile_frame(FRAME)], AREA)
+        text = dumps_cache({"frames": [frame]})
+        assert json.loads(text) == {"frames": [frame]}
+        assert '"canvas": [200, 150, 400, 250]' in text
+        assert '"miner_1": [600, 300, "green"]' in text
+
+
+class TestFramesCacheBuilder:
+    """Test content-addressed, incremental builds."""
+
+    def test_unchanged_inputs_are_noop(self, files):
+        database, path = files
+        builder = FramesCacheBuilder(database, path)
+        assert builder.build(AREA)
+        mtime = path.stat().st_mtime_ns
+        assert not builder.build(AREA)
+        assert path.stat().st_mtime_ns == mtime
+        assert builder.stats()["projections"] == 1
+
+    def test_area_change_only_reprojects(self, files):
+        database, path = files
+        builder = FramesCacheBuilder(database, path)
+        builder.build(AREA)
+        assert builder.build((0, 0, 100, 100))
+        assert builder.compiles == 1
+        assert builder.projections == 2
+        data = json.loads(path.read_text())
+        assert data["frame_area"] == [0, 0, 100, 100]
+        assert data["frames"][0]["interactions"]["start"] == [10, 20]
+
+    def test_database_change_recompiles(self, files):
+        database, path = files
+        builder = FramesCacheBuilder(database, path)
+        builder.build(AREA)
+        write_database(database, [dict(FRAME, name="Copper Mine")])
+        os.utime(database, ns=(1, 1))
+        assert builder.build(AREA)
+        assert builder.compiles == 2
+        assert json.loads(path.read_text())["frames"][0]["name"] == "Copper Mine"
+
+    def test_existing_cache_with_same_key_is_kept(self, files):
+        database, path = files
+        FramesCacheBuilder(database, path).build(AREA)
+        builder = FramesCacheBuilder(database, path)
+        assert not builder.build(AREA)
+        assert builder.compiles == 0
+
+    def test_missing_cache_is_rebuilt(self, files):
+        database, path = files
+        builder = FramesCacheBuilder(database, path)
+        builder.build(AREA)
+        path.unlink()
+        assert builder.build(AREA)
+        assert path.exists()
+
+    def test_background_build_reports_ready(self, files):
+        database, path = files
+        ready = []
+        builder = FramesCacheBuilder(database, path, on_ready=ready.append)
+        builder.start()
+        try:
+            builder.request({"x": 100, "y": 50, "width": 1000, "height": 500})
+            assert builder.wait(2.0)
+            assert ready == [True]
+            builder.request({"x": 100, "y": 50, "width": 1000, "height": 500})
+            assert builder.wait(2.0)
+            assert ready == [True, False]
+        finally:
+            builder.stop()
+        assert not builder.is_running
+
+    def test_failed_build_reports_unchanged(self, tmp_path):
+        database = tmp_path / "frames_database.json"
+        write_database(database, [{"id": "1.1", "buttons": {"bad": [0.5]}}])
+        ready = []
+        builder = FramesCacheBuilder(database, tmp_path / "frames.cache", on_ready=ready.append)
+        builder.start()
+        try:
+            builder.request(None)
+            assert builder.wait(2.0)
+            assert ready == [False]
+        finally:
+            builder.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
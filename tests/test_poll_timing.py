@@ -0,0 +1,74 @@
+"""
+Test learned poll timings and adaptive poll intervals.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from automation.poll_timing import AdaptivePoller, PollTimings
+from automation.scan_engine import ColorMatch, ScanEngine
+from capture.backends import ReplayBackend
+from capture.capture_scheduler import CaptureScheduler
+
+
+class TestPollTiming:
+    """Test AdaptivePoller schedules and PollTimings learning/persistence."""
+
+    def test_poller_phases(self):
+        """Test coarse sleep before the window, tight polling inside, backoff after."""
+        poller = AdaptivePoller(expected=2.0, spread=0.2, min_interval=0.01, max_interval=0.25)
+        assert poller.next_interval(0.0) == 1.0
+        assert poller.next_interval(1.5) == pytest.approx(0.3)
+        assert poller.next_interval(1.9) == 0.01
+        assert poller.next_interval(2.2) == 0.01
+        assert 0.01 < poller.next_interval(2.6) < 0.25
+        assert poller.next_interval(10.0) == 0.25
+
+        unknown = AdaptivePoller(None, min_interval=0.01, max_interval=0.25)
+        assert unknown.next_interval(0.0) == 0.01
+        assert unknown.next_interval(0.4) == pytest.approx(0.11)
+
+    def test_learning_and_persistence(self, tmp_path):
+        """Test the moving average converges and timings survive a reload per frame."""
+        path = tmp_path / "poll_timings.cache"
+        timings = PollTimings("7.3", path=path)
+        assert timings.expected("pbar") is None
+        for _ in range(20):
+            timings.record("pbar", 3.0)
+        timings.record("pbar", 3.5)
+        assert 3.0 < timings.expected("pbar") < 3.5
+        timings.save()
+
+        other = PollTimings("13.2", path=path)
+        other.record("piston1", 0.4)
+        other.save()
+
+        reloaded = PollTimings("7.3", path=path)
+        assert reloaded.expected("pbar") == pytest.approx(timings.expected("pbar"))
+        assert PollTimings("13.2", path=path).expected("piston1") == pytest.approx(0.4)
+
+        poller = reloaded.poller("pbar")
+        assert poller.window_start < reloaded.expected("pbar") < poller.window_end
+
+    def test_scan_engine_learns_wait(self, tmp_path):
+        """Test a learned wait records its time-to-change."""
+        idle = np.zeros((10, 10, 3), dtype=np.uint8)
+        ready = idle.copy()
+        ready[3, 3] = (255, 0, 0)
+        backend = ReplayBackend([idle, idle, ready], loop=False, auto_advance=True)
+        scheduler = CaptureScheduler(lambda: (0, 0, 10, 10), backend=backend)
+        timings = PollTimings("13.2", path=tmp_path / "poll_timings.cache")
+        scan = ScanEngine(capture=scheduler.get_frame, timings=timings, backend=backend)
+
+        assert scan.wait_for_any([ColorMatch((3, 3), (255, 0, 0))], timeout=1.0, learn="piston1") == [0]
+        assert timings.timings["piston1"]["count"] == 1
+        assert 0.0 < timings.expected("piston1") < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,156 @@
+"""
+Test ScanEngine multiplexed waits over replayed frames.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from automation.scan_engine import (
+    ButtonActive,
+    ColorDiffers,
+    ColorMatch,
+    FramePredicate,
+    RegionFill,
+    ScanEngine,
+    differs_from,
+    match_colors,
+)
+from capture import backends
+from capture.backends import ReplayBackend, set_capture_backend
+from capture.capture_scheduler import CaptureScheduler
+
+BACKGROUND = (30, 30, 40)
+PISTON = (120, 110, 90)
+
+
+def make_frames():
+    """Three frames: idle, piston shown at (10, 5), then the lower half filled and a red button active."""
+    idle = np.full((20, 30, 3), BACKGROUND, dtype=np.uint8)
+    piston = idle.copy()
+    piston[5, 10] = PISTON
+    filled = piston.copy()
+    filled[10:, :] = PISTON
+    filled[2, 2] = (199, 35, 21)
+    return [idle, piston, filled]
+
+
+class TestScanEngine:
+    """Test condition evaluation and wait behaviour."""
+
+    def setup_method(self):
+        self.backend = ReplayBackend(make_frames(), origin=(100, 50), loop=False, auto_advance=True)
+        self.scheduler = CaptureScheduler(lambda: (100, 50, 130, 70), backend=self.backend)
+        self.captures = 0
+        self.grabs = []
+        grab = self.backend.grab
+        self.backend.grab = lambda bbox: self.grabs.append(tuple(bbox)) or grab(bbox)
+        self.scan = ScanEngine(capture=self.capture, backend=self.backend)
+
+    def capture(self):
+        self.captures += 1
+        return self.scheduler.get_frame()
+
+    def test_wait_for_any_reports_fired_conditions(self):
+        """Test every condition is evaluated against one capture per tick."""
+        conditions = {
+            "piston": ColorMatch((110, 55), [PISTON, (1, 2, 3)]),
+            "button": ButtonActive([102, 52, "red"]),
+            "half": RegionFill((100, 50, 130, 70), PISTON, threshold=50),
+        }
+        assert self.scan.wait_for_any(conditions, timeout=1.0, check_interval=0.001) == ["piston"]
+        assert len(self.grabs) == 2
+        assert self.scan.wait_for_all(conditions, timeout=1.0, check_interval=0.001)
+        assert len(self.grabs) == 3
+        assert self.captures == 0
+
+    def test_wait_grabs_only_condition_regions(self):
+        """Test a single-pixel wait grabs one pixel and a predicate wait the whole frame area."""
+        assert self.scan.wait_for_any([ColorMatch((110, 55), PISTON)], timeout=1.0, check_interval=0.001) == [0]
+        assert set(self.grabs) == {(110, 55, 111, 56)}
+        assert self.captures == 0
+
+        conditions = [FramePredicate(lambda frame: True), ColorMatch((5, 5), BACKGROUND)]
+        assert self.scan.wait_for_any(conditions, timeout=1.0, check_interval=0.001) == [0]
+        assert self.captures == 1
+
+    def test_differs_and_predicate(self):
+        """Test ColorDiffers and custom frame predicates."""
+        assert not ColorDiffers((110, 55), BACKGROUND).evaluate(self.scheduler.get_frame())
+        assert self.scan.wait_for_any([ColorDiffers((110, 55), BACKGROUND)], timeout=1.0, check_interval=0.001) == [0]
+        brightest = FramePredicate(lambda frame: frame.array.max() > 150)
+        assert self.scan.wait_for_any([brightest], timeout=1.0, check_interval=0.001) == [0]
+
+    def test_timeout_and_stop(self):
+        """Test waits end empty on timeout, stop event and should_continue."""
+        never = ColorMatch((100, 50), (255, 255, 255))
+        start = time.monotonic()
+        assert self.scan.wait_for_any([never], timeout=0.05, check_interval=0.01) == []
+        assert time.monotonic() - start < 0.5
+
+        stop = threading.Event()
+        threading.Timer(0.05, stop.set).start()
+        assert self.scan.wait_for_any([never], timeout=None, check_interval=0.01, stop_event=stop) == []
+        assert stop.is_set()
+
+        stopped = ScanEngine(capture=self.capture, should_continue=lambda: False)
+        assert stopped.wait_for_any([never], timeout=None) == []
+
+    def test_failed_capture_times_out(self):
+        """Test a region the backend cannot grab ends the wait on timeout instead of raising."""
+        assert self.scan.wait_for_any([ColorMatch((5, 5), BACKGROUND)], timeout=0.05, check_interval=0.01) == []
+
+
+
+class TestScanLine:
+    """Test single-capture line scans."""
+
+    def setup_method(self):
+        self.strip = np.full((20, 30, 3), BACKGROUND, dtype=np.uint8)
+        self.strip[4, [7, 12, 22]] = PISTON
+        self.strip[[3, 15], 6] = (200, 10, 10)
+        self.previous = backends._active_backend
+        set_capture_backend(ReplayBackend([self.strip], origin=(100, 50)))
+        self.scan = ScanEngine(frame_bbox=lambda: (100, 50, 130, 70))
+
+    def teardown_method(self):
+        backends._active_backend = self.previous
+
+    def test_horizontal_directions_and_step(self):
+        """Test forward, reverse and stepped scans report screen and frame coordinates."""
+        is_piston = match_colors([PISTON, (1, 2, 3)])
+        found = self.scan.scan_line((100, 54), (129, 54), is_piston)
+        assert (found.screen_xy, found.frame_xy, found.color) == ((107, 54), (7, 4), PISTON)
+
+        assert self.scan.scan_line((100, 54), (129, 54), is_piston, direction=-1).x == 122
+        assert self.scan.scan_line((129, 54), (100, 54), is_piston).x == 122
+        # Every 5px from x=100 samples 100, 105, ... 125 and misses 107, 112 and 122
+        assert self.scan.scan_line((100, 54), (129, 54), is_piston, step=5) is None
+        assert self.scan.scan_line((102, 54), (129, 54), is_piston, step=5).x == 107
+
+    def test_vertical_and_differs(self):
+        """Test a vertical scan with a differs_from predicate and a tolerance."""
+        found = self.scan.scan_line((106, 50), (106, 69), differs_from(BACKGROUND))
+        assert found.screen_xy == (106, 53)
+        assert self.scan.scan_line((106, 69), (106, 50), match_colors((203, 12, 8), tolerance=5)).y == 65
+        assert self.scan.scan_line((106, 50), (106, 69), match_colors((0, 0, 0))) is None
+
+    def test_existing_frame_and_invalid_lines(self):
+        """Test scanning a frame captured elsewhere and rejecting diagonal or out-of-frame lines."""
+        backend = ReplayBackend([self.strip], origin=(100, 50))
+        frame = CaptureScheduler(lambda: (100, 50, 130, 70), backend=backend).get_frame()
+        assert self.scan.scan_line((100, 54), (129, 54), match_colors(PISTON), frame=frame).x == 107
+        with pytest.raises(ValueError):
+            self.scan.scan_line((100, 50), (110, 60), match_colors(PISTON))
+        with pytest.raises(ValueError):
+            self.scan.scan_line((90, 54), (129, 54), match_colors(PISTON), frame=frame)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
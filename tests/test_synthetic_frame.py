@@ -0,0 +1,114 @@
+"""
+Test the synthetic WidgetInc frame renderer and capture backend.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.backends import create_backend
+from capture.frame_snapshot import FrameSnapshot
+from capture.synthetic_frame import (
+    BUTTON_COLORS,
+    SyntheticCaptureBackend,
+    SyntheticFrame,
+    load_border_colors,
+    load_frames_database,
+)
+
+
+def border_averages(image):
+    """Average left/right border colors sampled like FrameDetector.analyze_frame_borders."""
+    height, width = image.shape[:2]
+    inset = int(width * 0.05)
+    strip = int(height * 0.2)
+    start = height // 2 - strip // 2
+    left = image[start : start + strip, :inset].mean(axis=(0, 1))
+    right = image[start : start + strip, width - inset :].mean(axis=(0, 1))
+    return left, right
+
+
+class TestSyntheticFrame:
+    """Test the SyntheticFrame renderer and SyntheticCaptureBackend."""
+
+    @classmethod
+    def setup_class(cls):
+        cls.database = load_frames_database()
+        cls.borders = load_border_colors()
+
+    def make(self, frame_id="1.1", **kwargs):
+        return SyntheticFrame(frame_id, frames_database=self.database, border_colors=self.borders, **kwargs)
+
+    def test_buttons_and_states(self):
+        """Test buttons render at their percent coordinates in the scripted state color."""
+        frame = self.make(width=800, height=600)
+        x, y = frame.button_position("miner1")
+        assert (x, y) == (int(0.1738 * 800), int(0.2564 * 600))
+        assert tuple(frame.render()[y, x]) == BUTTON_COLORS["red"]["default"]
+
+        frame.set_button_state("miner1", "inactive")
+        assert tuple(frame.render()[y, x]) == BUTTON_COLORS["red"]["inactive"]
+        frame.set_all_buttons("focus")
+        assert tuple(frame.render()[y, x]) == BUTTON_COLORS["red"]["focus"]
+
+        with pytest.raises(KeyError):
+            frame.set_button_state("missing", "default")
+        with pytest.raises(ValueError):
+            frame.set_button_state("miner1", "pressed")
+
+    def test_borders_match_detection_data(self):
+        """Test rendered borders average to the frame_detection.json colors at any resolution."""
+        for size in [(1080, 720), (640, 480)]:
+            frame = self.make("3.4", width=size[0], height=size[1])
+            left, right = border_averages(frame.render())
+            expected_left, expected_right = self.borders["3.4"]
+            assert np.allclose(left, expected_left)
+            assert np.allclose(right, expected_right)
+
+    def test_paint(self):
+        """Test painting named interaction points and percent bboxes."""
+        frame = self.make("3.4")
+        frame.paint_point("1v", (72, 237, 56))
+        frame.paint((0.5, 0.5, 0.6, 0.6), (1, 2, 3))
+        x, y = frame.to_pixels(0.765, 0.758652)
+        image = frame.render()
+        assert tuple(image[y, x]) == (72, 237, 56)
+        assert tuple(image[frame.to_pixels(0.55, 0.55)[::-1]]) == (1, 2, 3)
+
+        frame.clear_paint()
+        assert tuple(frame.render()[y, x]) == frame.background
+
+    def test_capture_backend(self):
+        """Test grabs and pixel probes in screen coordinates around the frame area."""
+        frame = self.make(width=400, height=300)
+        backend = SyntheticCaptureBackend(frame, origin=(100, 50), screen_size=(600, 400))
+        sx, sy = backend.button_screen_position("miner2")
+        assert backend.pixel(sx, sy) == BUTTON_COLORS["red"]["default"]
+        assert backend.pixel(10, 10) == (0, 0, 0)
+
+        region = backend.grab((90, 40, 110, 60))
+        assert tuple(region[0, 0]) == (0, 0, 0)
+        assert tuple(region[15, 15]) == self.borders["1.1"][0]
+
+        snapshot = FrameSnapshot(lambda: backend.frame_bbox, backend=backend)
+        snapshot.refresh()
+        frame.set_button_state("miner2", "inactive")
+        assert snapshot.pixel(sx, sy) == BUTTON_COLORS["red"]["default"]
+        snapshot.refresh()
+        assert snapshot.pixel(sx, sy) == BUTTON_COLORS["red"]["inactive"]
+
+        with pytest.raises(ValueError):
+            backend.grab((590, 390, 610, 410))
+
+    def test_registry(self):
+        """Test creating the synthetic backend by name."""
+        backend = create_backend("synthetic", frame_id="1.1", width=320, height=240)
+        assert backend.frame_bbox == (0, 0, 320, 240)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
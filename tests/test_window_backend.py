@@ -0,0 +1,101 @@
+"""
+Test window discovery backends and the cached-handle window finder.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utility.window_backend import (
+    TARGET_PROCESS_NAME,
+    FakeWindowBackend,
+    WindowFinder,
+    bench_finder,
+    create_window_backend,
+)
+
+
+def make_desktop(windows=20):
+    backend = FakeWindowBackend()
+    for i in range(windows):
+        backend.add_window(f"Window {i}", pid=2000 + i)
+    # A browser tab mentioning the game must not match
+    backend.add_window("WidgetInc wiki - Browser", pid=3000, process_name="browser.exe")
+    game = backend.add_window("WidgetInc", rect=(100, 50, 1316, 889), pid=42, process_name=TARGET_PROCESS_NAME)
+    return backend, game
+
+
+class TestWindowFinder:
+    """Test WindowFinder against a fake desktop."""
+
+    def test_window_info(self):
+        """Test the window info layout the cache manager stores."""
+        backend, game = make_desktop()
+        info = WindowFinder(backend).find()
+        assert info["hwnd"] == game and info["pid"] == 42 and info["title"] == "WidgetInc"
+        assert info["window_rect"] == (100, 50, 1316, 889)
+        assert info["client_rect"] == (0, 0, 1200, 800)
+        assert info["client_screen"] == {"x": 108, "y": 81, "width": 1200, "height": 800}
+
+    def test_fast_path_skips_enumeration(self):
+        """Test a known handle is revalidated without enumerating or reading process names."""
+        backend, game = make_desktop()
+        finder = WindowFinder(backend)
+        finder.find()
+        calls = dict(backend.calls)
+
+        backend.move_window(game, (200, 60, 1416, 899))
+        info = finder.find()
+        assert info["client_screen"]["x"] == 208
+        assert backend.calls["enum_windows"] == calls["enum_windows"]
+        assert backend.calls["process_name"] == calls["process_name"]
+        assert (finder.fast_hits, finder.enumerations) == (1, 1)
+
+    def test_constant_cost(self):
+        """Test fast-path lookups make the same backend calls regardless of window count."""
+        per_lookup = []
+        for count in (5, 500):
+            backend, _ = make_desktop(count)
+            finder = WindowFinder(backend)
+            finder.find()
+            before = sum(backend.calls.values())
+            finder.find()
+            per_lookup.append(sum(backend.calls.values()) - before)
+        assert per_lookup[0] == per_lookup[1]
+
+    def test_falls_back_to_enumeration(self):
+        """Test closed, hidden or reused handles trigger a full enumeration."""
+        backend, game = make_desktop()
+        finder = WindowFinder(backend)
+        finder.find()
+
+        backend.close_window(game)
+        assert finder.find() is None
+        relaunched = backend.add_window("WidgetInc", pid=43, process_name=TARGET_PROCESS_NAME)
+        assert finder.find()["hwnd"] == relaunched
+
+        backend.windows[relaunched]["pid"] = 99
+        backend.processes[99] = "other.exe"
+        assert finder.find() is None
+
+        backend.windows[relaunched].update(pid=43, visible=False)
+        assert finder.find() is None
+        assert finder.enumerations == 5
+
+    def test_bench_finder(self):
+        """Test the benchmark reports both paths per window count."""
+        rows = bench_finder((10, 100), iterations=5)
+        assert [row["windows"] for row in rows] == [10, 100]
+        assert all(row["enumerate_us"] > 0 and row["fast_path_us"] > 0 for row in rows)
+
+    def test_registry(self):
+        assert isinstance(create_window_backend("fake"), FakeWindowBackend)
+        with pytest.raises(ValueError):
+            create_window_backend("missing")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,137 @@
+"""
+Test window event classification and the adaptive polling event source.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utility.window_backend import FakeWindowBackend
+from utility.window_events import (
+    CLOSED,
+    MINIMIZED,
+    MOVED,
+    RESIZED,
+    RESTORED,
+    PollingWindowEventSource,
+    Win32WindowEventSource,
+    create_window_event_source,
+)
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class FailingHookSource(Win32WindowEventSource):
+    """Win32 source whose hooks can never be installed (no user32 needed)."""
+
+    def _bind_win32(self):
+        self.hook_attempts = 0
+
+    def _hook_loop(self, pid, ready):
+        self.hook_attempts += 1
+        self._hook_failed = True
+        ready.set()
+
+
+class TestWindowEvents:
+    """Test WindowEventSource change classification and polling."""
+
+    def setup_method(self):
+        self.backend = FakeWindowBackend()
+        self.handle = self.backend.add_window("WidgetInc", rect=(0, 0, 800, 600), pid=42)
+        self.received = []
+        self.lock = threading.Lock()
+
+    def on_event(self, event):
+        with self.lock:
+            self.received.append(event)
+
+    def kinds(self):
+        with self.lock:
+            return [event.kind for event in self.received]
+
+    def test_classification(self):
+        """Test moves, resizes, minimize/restore and close are told apart on check()."""
+        source = PollingWindowEventSource(self.backend)
+        source.watch(self.handle, 42)
+        assert source.check() == []
+
+        self.backend.move_window(self.handle, (10, 20, 810, 620))
+        assert [e.kind for e in source.check()] == [MOVED]
+        self.backend.move_window(self.handle, (10, 20, 1010, 720))
+        assert [e.kind for e in source.check()] == [RESIZED]
+
+        self.backend.windows[self.handle]["minimized"] = True
+        assert [e.kind for e in source.check()] == [MINIMIZED]
+        self.backend.windows[self.handle]["minimized"] = False
+        assert [e.kind for e in source.check()] == [RESTORED]
+
+        self.backend.close_window(self.handle)
+        events = source.check()
+        assert [e.kind for e in events] == [CLOSED]
+        assert source.handle is None and source.check() == []
+
+    def test_polling_reacts_and_backs_off(self):
+        """Test the poller reports a move within a few frames and slows down while idle."""
+        source = PollingWindowEventSource(self.backend, min_interval=0.005, max_interval=0.05)
+        source.start(self.on_event)
+        try:
+            source.watch(self.handle, 42)
+            assert wait_until(lambda: source.interval == source.max_interval)
+
+            self.backend.move_window(self.handle, (50, 50, 850, 650))
+            assert wait_until(lambda: self.kinds() == [MOVED], timeout=0.5)
+            assert source.interval < source.max_interval
+
+            self.backend.close_window(self.handle)
+            assert wait_until(lambda: self.kinds() == [MOVED, CLOSED])
+            checks = source.checks
+            time.sleep(0.1)
+            assert source.checks == checks  # Nothing watched - the thread sleeps
+        finally:
+            source.stop()
+        assert not source.is_running
+
+    def test_callback_errors_are_contained(self):
+        """Test a failing callback does not stop event delivery."""
+        source = PollingWindowEventSource(self.backend)
+        source.start(lambda event: 1 / 0)
+        source.stop()
+        source.watch(self.handle, 42)
+        self.backend.move_window(self.handle, (1, 1, 801, 601))
+        assert [e.kind for e in source.check()] == [MOVED]
+
+    def test_failed_hooks_fall_back_to_polling(self):
+        """Test a window whose hooks fail is polled on the same backend instead of going unwatched."""
+        source = FailingHookSource(self.backend, max_interval=0.05)
+        source.watch(self.handle, 42)
+        source.start(self.on_event)
+        try:
+            assert source.polling and source.is_running
+            self.backend.move_window(self.handle, (30, 30, 830, 630))
+            assert wait_until(lambda: self.kinds() == [MOVED], timeout=0.5)
+
+            # Another window gets a fresh hook attempt
+            other = self.backend.add_window("WidgetInc", rect=(0, 0, 400, 300), pid=43)
+            source.watch(other, 43)
+            assert source.hook_attempts == 2 and source.polling
+        finally:
+            source.stop()
+        assert not source.is_running and not source.polling
+
+    def test_factory_falls_back_to_polling(self):
+        assert isinstance(create_window_event_source(self.backend), PollingWindowEventSource)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,239 @@
+"""
+Test the numpy box/fill helpers in window_utils against the pixel-by-pixel implementations they replace.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from capture.frame_ring import CapturedFrame
+from utility.window_utils import get_box_no_border, get_box_with_border, get_boxes_with_border, get_vertical_fill
+
+BORDER = (40, 200, 90)
+ALLOWED = [(10, 20, 30), (11, 21, 31), (200, 200, 200)]
+
+
+def legacy_get_box_with_border(start_point, border_color, screenshot):
+    """Previous getpixel() implementation, kept as the reference."""
+    width, height = screenshot.size
+    x0, y0 = start_point
+
+    x = x0
+    while x > 0 and screenshot.getpixel((x, y0)) != border_color:
+        x -= 1
+    while x > 0 and screenshot.getpixel((x, y0)) == border_color:
+        x -= 1
+    left = x + 1
+
+    x = x0
+    while x < width - 1 and screenshot.getpixel((x, y0)) != border_color:
+        x += 1
+    while x < width - 1 and screenshot.getpixel((x, y0)) == border_color:
+        x += 1
+    right = x - 1
+
+    y = y0
+    while y > 0 and screenshot.getpixel((x0, y)) != border_color:
+        y -= 1
+    while y > 0 and screenshot.getpixel((x0, y)) == border_color:
+        y -= 1
+    top = y + 1
+
+    y = y0
+    while y < height - 1 and screenshot.getpixel((x0, y)) != border_color:
+        y += 1
+    while y < height - 1 and screenshot.getpixel((x0, y)) == border_color:
+        y += 1
+    bottom = y - 1
+
+    return (left, top, right, bottom)
+
+
+def legacy_get_box_no_border(approx_box, allowed_colors, screenshot):
+    """Previous tuple-per-pixel implementation, kept as the reference."""
+    allowed_colors_set = set(allowed_colors)
+    img_array = np.array(screenshot)
+    height, width = img_array.shape[:2]
+    x1, y1, x2, y2 = approx_box
+
+    def is_allowed_color(x, y):
+        if 0 <= x < width and 0 <= y < height:
+            return tuple(img_array[y, x]) in allowed_colors_set
+        return False
+
+    def test_vertical_line(x):
+        if not (0 <= x < width):
+            return False
+        return all(tuple(pixel) in allowed_colors_set for pixel in img_array[y1 : y2 + 1, x])
+
+    def test_horizontal_line(y):
+        if not (0 <= y < height):
+            return False
+        return all(tuple(pixel) in allowed_colors_set for pixel in img_array[y, x1 : x2 + 1])
+
+    if not (
+        test_vertical_line(x1) and test_horizontal_line(y1) and test_vertical_line(x2) and test_horizontal_line(y2)
+    ):
+        raise ValueError("Initial box test failed...")
+
+    x = x1
+    while x > 0 and is_allowed_color(x, y1):
+        x -= min(8, x)
+    while x < x1 and not is_allowed_color(x, y1):
+        x += 1
+    while x <= x1 and not test_vertical_line(x):
+        x += 1
+    left = x
+
+    x = x2
+    while x < width - 1 and is_allowed_color(x, y1):
+        x += min(8, width - 1 - x)
+    while x > x2 and not is_allowed_color(x, y1):
+        x -= 1
+    while x >= x2 and not test_vertical_line(x):
+        x -= 1
+    right = x
+
+    y = y1
+    while y > 0 and is_allowed_color(x1, y):
+        y -= min(8, y)
+    while y < y1 and not is_allowed_color(x1, y):
+        y += 1
+    while y <= y1 and not test_horizontal_line(y):
+        y += 1
+    top = y
+
+    y = y2
+    while y < height - 1 and is_allowed_color(x1, y):
+        y += min(8, height - 1 - y)
+    while y > y2 and not is_allowed_color(x1, y):
+        y -= 1
+    while y >= y2 and not test_horizontal_line(y):
+        y -= 1
+    bottom = y
+
+    return (left, top, right, bottom)
+
+
+def legacy_get_vertical_fill(x, top_y, bottom_y, empty_colors, filled_colors, screenshot):
+    """Previous y-by-y implementation, kept as the reference."""
+    empty_color_set = set(empty_colors)
+    filled_color_set = set(filled_colors)
+    img_array = np.array(screenshot)
+    fill_height = 0
+    for y in range(bottom_y, top_y - 1, -1):
+        pixel = tuple(img_array[y, x])
+        if pixel in filled_color_set:
+            fill_height += 1
+        elif pixel in empty_color_set:
+            break
+    return fill_height / (bottom_y - top_y + 1) * 100
+
+
+def make_boxes_image(seed, width=96, height=72):
+    """Noise background with several bordered boxes of random border thickness."""
+    rng = np.random.default_rng(seed)
+    image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    for _ in range(rng.integers(1, 5)):
+        x1, x2 = sorted(rng.integers(0, width, 2))
+        y1, y2 = sorted(rng.integers(0, height, 2))
+        thickness = int(rng.integers(1, 4))
+        image[y1 : y2 + 1, x1 : x1 + thickness] = BORDER
+        image[y1 : y2 + 1, max(x1, x2 - thickness + 1) : x2 + 1] = BORDER
+        image[y1 : y1 + thickness, x1 : x2 + 1] = BORDER
+        image[max(y1, y2 - thickness + 1) : y2 + 1, x1 : x2 + 1] = BORDER
+        image[y1 + thickness : y2 - thickness + 1, x1 + thickness : x2 - thickness + 1] = (5, 5, 5)
+    return image
+
+
+class TestGetBoxWithBorder:
+    """Differential tests of the vectorized edge search."""
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_matches_legacy(self, seed):
+        """Test random start points, including image edges, against the getpixel walk."""
+        image = make_boxes_image(seed)
+        height, width = image.shape[:2]
+        pil_image = Image.fromarray(image)
+        rng = np.random.default_rng(100 + seed)
+        points = [(int(x), int(y)) for x, y in zip(rng.integers(0, width, 40), rng.integers(0, height, 40))]
+        points += [(0, 0), (width - 1, height - 1), (0, height - 1), (width - 1, 0)]
+
+        expected = [legacy_get_box_with_border(point, BORDER, pil_image) for point in points]
+        assert get_boxes_with_border(points, BORDER, pil_image) == expected
+        assert get_boxes_with_border(points, BORDER, image) == expected
+
+    def test_single_box_and_captured_frame(self):
+        """Test the single-point wrapper on a known box and on a CapturedFrame."""
+        image = np.zeros((50, 60, 3), dtype=np.uint8)
+        image[10:40, 15:45] = BORDER
+        image[12:38, 17:43] = (9, 9, 9)
+        frame = CapturedFrame(image, 1, 0.0, (100, 100, 160, 150))
+        assert get_box_with_border((30, 25), BORDER, frame) == (15, 10, 44, 39)
+        assert get_box_with_border((30, 25), BORDER, Image.fromarray(image)) == (15, 10, 44, 39)
+
+
+
+class TestGetBoxNoBorder:
+    """Differential tests of the packed-color region growing."""
+
+    @pytest.mark.parametrize("seed", range(16))
+    def test_matches_legacy(self, seed):
+        """Test random allowed-color regions with ragged edges and stray pixels."""
+        rng = np.random.default_rng(seed)
+        height, width = 64, 90
+        image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        rx1, rx2 = sorted(rng.integers(0, width, 2))
+        ry1, ry2 = sorted(rng.integers(0, height, 2))
+        palette = np.array(ALLOWED, dtype=np.uint8)
+        image[ry1 : ry2 + 1, rx1 : rx2 + 1] = palette[rng.integers(0, 3, (ry2 - ry1 + 1, rx2 - rx1 + 1))]
+        # Ragged edges and stray allowed pixels outside the region
+        for _ in range(int(rng.integers(0, 6))):
+            image[rng.integers(0, height), rng.integers(0, width)] = ALLOWED[0]
+        for _ in range(int(rng.integers(0, 3))):
+            image[rng.integers(ry1, ry2 + 1), rng.integers(rx1, rx2 + 1)] = (1, 2, 3)
+
+        for _ in range(6):
+            bx1, bx2 = sorted(rng.integers(rx1, rx2 + 1, 2))
+            by1, by2 = sorted(rng.integers(ry1, ry2 + 1, 2))
+            box = (int(bx1), int(by1), int(bx2), int(by2))
+            try:
+                expected = legacy_get_box_no_border(box, ALLOWED, Image.fromarray(image))
+            except ValueError:
+                with pytest.raises(ValueError):
+                    get_box_no_border(box, ALLOWED, image)
+                continue
+            assert get_box_no_border(box, ALLOWED, image) == expected
+            assert get_box_no_border(box, ALLOWED, Image.fromarray(image)) == expected
+
+
+class TestGetVerticalFill:
+    """Differential tests of the first-empty fill level."""
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_legacy(self, seed):
+        """Test bars with filled, empty and unrelated pixels in random order."""
+        rng = np.random.default_rng(seed)
+        filled, empty, other = [(250, 200, 0), (240, 190, 0)], [(30, 30, 30)], (90, 0, 90)
+        choices = np.array(filled + empty + [other], dtype=np.uint8)
+        image = np.zeros((60, 8, 3), dtype=np.uint8)
+        image[:, 3] = choices[rng.choice(4, 60, p=[0.4, 0.3, 0.1, 0.2])]
+        top, bottom = sorted(int(v) for v in rng.choice(60, 2, replace=False))
+
+        expected = legacy_get_vertical_fill(3, top, bottom, empty, filled, image)
+        assert get_vertical_fill(3, top, bottom, empty, filled, image) == pytest.approx(expected)
+        frame = CapturedFrame(image, 1, 0.0, (0, 0, 8, 60))
+        assert get_vertical_fill(3, top, bottom, tuple(empty[0]), filled, frame) == pytest.approx(expected)
+
+    def test_out_of_bounds(self):
+        with pytest.raises(ValueError):
+            get_vertical_fill(3, 10, 5, [(0, 0, 0)], [(1, 1, 1)], np.zeros((20, 8, 3), dtype=np.uint8))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])